@@ -0,0 +1,71 @@
+# 📥 Custom modules
+from Utils.CommandSync import SyncCommandTree
+from Utils.Metrics import Snapshot
+from Utils.Logger import Logger
+
+# ⚙️ Settings
+from Config import (
+	ADMIN_ROLE_IDS,
+	BotName,
+)
+
+# 👾 Discord modules
+from discord.ext import commands
+import discord
+
+
+# 💡 Check whether a member holds one of the admin roles
+def IsAdmin(Member) -> bool:
+	return any(Role.id in ADMIN_ROLE_IDS for Role in getattr(Member, 'roles', []))
+
+
+class Admin(commands.Cog):
+	def __init__(self, Bot: commands.Bot) -> None:
+		self.Bot = Bot
+
+	# 🔄 Force a global application command sync, ignoring the persisted tree hash
+	@commands.command(name='sync')
+	async def Sync(self, Ctx: commands.Context) -> None:
+		if not IsAdmin(Ctx.author):
+			Embed = discord.Embed(
+				description='🚫 You do not have permission to use this command.',
+				color=0xF5A3A3,
+			)
+			Embed.set_footer(text=BotName)
+			await Ctx.send(embed=Embed, delete_after=5)
+			return
+		await SyncCommandTree(self.Bot.tree, Force=True)
+		Embed = discord.Embed(
+			title='Commands Synced',
+			timestamp=discord.utils.utcnow(),
+			description=f'`{len(self.Bot.tree.get_commands())}` application commands synced.',
+			color=0xA0D6B4,
+		)
+		Embed.set_footer(text=BotName)
+		await Ctx.send(embed=Embed)
+		Logger.info(f'Forced command sync by {Ctx.author}')
+
+	# 📊 Show the current value of every registered gauge
+	@commands.command(name='metrics')
+	async def Metrics(self, Ctx: commands.Context) -> None:
+		if not IsAdmin(Ctx.author):
+			Embed = discord.Embed(
+				description='🚫 You do not have permission to use this command.',
+				color=0xF5A3A3,
+			)
+			Embed.set_footer(text=BotName)
+			await Ctx.send(embed=Embed, delete_after=5)
+			return
+		Lines = [f'`{Name}`: {Value:g}' for Name, Value in Snapshot().items()]
+		Embed = discord.Embed(
+			title='Metrics',
+			timestamp=discord.utils.utcnow(),
+			description='\n'.join(Lines) or 'No metrics registered.',
+			color=0xA0D6B4,
+		)
+		Embed.set_footer(text=BotName)
+		await Ctx.send(embed=Embed)
+
+
+async def setup(Bot: commands.Bot) -> None:
+	await Bot.add_cog(Admin(Bot))
@@ -31,7 +31,7 @@ class Help(commands.Cog):
 		Categories = {}
 		for Command in self.Bot.commands:
 			# Skip hidden commands like 'say'
-			if Command.name in ['say']:
+			if Command.name in ['say', 'sync', 'metrics']:
 				continue
 			CogName = Command.cog.qualified_name if Command.cog else 'No Category'
 			if CogName not in Categories:
@@ -1,4 +1,5 @@
 # 📦 Built-in modules
+from functools import partial
 import discord
 import json
 import os
@@ -13,6 +14,7 @@ from Config import (
 	LiveStatusUpdateInterval,
 	LiveStatusFile,
 )
+from Utils.RestScheduler import Background, Interactive, Update
 from Utils.Plan import PlanAPI
 from Utils.Socket import GetStatus
 
@@ -94,6 +96,9 @@ class LiveStatus(commands.Cog):
 			await self.UpdateStatusMessage()
 
 	async def UpdateStatusMessage(self, Interaction=None):
+		# 🚦 A refresh button press jumps the queue, the periodic loop does not
+		Priority = Interactive if Interaction else Update
+		Scheduler = self.Bot.Scheduler
 		try:
 			# 🌐 Fetch server status
 			Status = GetStatus(DefaultServer, DefaultServerPort)
@@ -108,21 +113,34 @@ class LiveStatus(commands.Cog):
 			if self.Channel and isinstance(self.Channel, discord.TextChannel):
 				new_name = '🟢-server-online' if Status else '🔴-server-offline'
 				if self.Channel.name != new_name:
-					try:
-						await self.Channel.edit(name=new_name)
-					except discord.Forbidden:
-						pass  # No permission to edit channel name
+					# 🐢 Renames are heavily rate limited, so queue them without waiting
+					Rename = Scheduler.Submit(
+						partial(self.Channel.edit, name=new_name),
+						('channel_edit', self.Channel.id),
+						Background,
+						CoalesceKey=f'rename:{self.Channel.id}',
+					)
+					# 🔕 Ignore failures such as missing permission to edit the channel name
+					Rename.add_done_callback(
+						lambda Future: Future.cancelled() or Future.exception()
+					)
 
 			ViewInstance = LiveStatusView(self)
 
 			if self.StatusMessage:
-				# ✏️ Edit existing message
+				# ✏️ Edit existing message (a newer pending edit replaces an older one)
 				if File:
-					await self.StatusMessage.edit(
-						embed=Embed, attachments=[File], view=ViewInstance
+					Edit = partial(
+						self.StatusMessage.edit, embed=Embed, attachments=[File], view=ViewInstance
 					)
 				else:
-					await self.StatusMessage.edit(embed=Embed, view=ViewInstance)
+					Edit = partial(self.StatusMessage.edit, embed=Embed, view=ViewInstance)
+				await Scheduler.Run(
+					Edit,
+					('message_edit', self.StatusMessage.channel.id),
+					Priority,
+					CoalesceKey=f'edit:{self.StatusMessage.id}',
+				)
 			else:
 				# 📤 Send new message
 				if isinstance(self.Channel, discord.TextChannel):
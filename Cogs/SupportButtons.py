@@ -2,9 +2,11 @@ import discord
 from discord.ext import commands
 import json
 import os
+from functools import partial
 import shlex
 import logging
 from typing import Dict, Any
+from Utils.RestScheduler import Background
 
 # Define IDs directly in the cog for VoidBot
 ADMIN_ROLE_IDS = [1290261005955235840, 1308763721316958261]
@@ -410,7 +412,11 @@ class SupportButtons(commands.Cog):
 						view = DynamicButtonView(button_type, button_info)
 
 						# Update the message with fresh view
-						await msg.edit(embed=embed, view=view)
+						await self.bot.Scheduler.Run(
+							partial(msg.edit, embed=embed, view=view),
+							('message_edit', channel.id),
+							Background,
+						)
 						restored_count += 1
 						logger.info(
 							f'Support button restored in {channel.name} (message ID: {msg.id}).'
@@ -1,16 +1,24 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import json
 import os
+from functools import partial
 import uuid
 from datetime import datetime, timedelta
 from email.message import EmailMessage
-import smtplib
 import asyncio
-import re
+import gzip
+import html
+import io
 import logging
+import time
 from typing import Dict, Any
+from Utils.RestScheduler import Background
+from Utils.TicketStore import TicketStore
+from Utils.TicketStats import Buckets
+from Utils.TranscriptRecorder import TranscriptRecorder
+from Utils.MailQueue import MailQueue
+from Utils.Metrics import RegisterGauge
 
 # Import settings from Config
 from Config import (
@@ -18,6 +26,21 @@ from Config import (
 	MODERATOR_ROLE_ID,
 	TICKETS_CATEGORY_ID,
 	TRANSCRIPT_CHANNEL_ID,
+	TicketJournalCompactEvery,
+	TicketRetentionDays,
+	TicketCleanupRetryDelay,
+	TicketCleanupRetryMaxDelay,
+	TicketRoleCacheTTL,
+	TicketStatsWindow,
+	TranscriptDirectory,
+	TranscriptFlushDelay,
+	TranscriptEmailInlineLimit,
+	TranscriptArchiveDirectory,
+	MailOutboxDirectory,
+	MailBatchSize,
+	MailMaxAttempts,
+	MailRetryBaseDelay,
+	MailRetryMaxDelay,
 )
 
 
@@ -27,119 +50,149 @@ def get_data_dir():
 
 logger = logging.getLogger(__name__)
 
+# === Bump when the control buttons change; posted messages get their view replaced once ===
+TICKET_VIEW_VERSION = 2
+
 # === Path to JSON file ===
 TICKET_FILE = f'{get_data_dir()}/tickets.json'
+TICKET_JOURNAL_FILE = f'{get_data_dir()}/tickets.journal'
 TICKET_COUNTER_FILE = f'{get_data_dir()}/ticket_counter.json'
 
 
-# === Helper functions for JSON persistence ===
-async def load_tickets():
-	if os.path.dirname(TICKET_FILE):
-		os.makedirs(os.path.dirname(TICKET_FILE), exist_ok=True)
-	if not os.path.exists(TICKET_FILE):
-		with open(TICKET_FILE, 'w') as f:
-			json.dump([], f)
-	try:
-		with open(TICKET_FILE, 'r') as f:
-			return json.load(f)
-	except json.JSONDecodeError:
-		logger.error('Error loading tickets.json – resetting file.')
-		return []
-
-
-async def delete_ticket(channel_id: int):
-	tickets = await load_tickets()
-	tickets = [t for t in tickets if t['channel_id'] != channel_id]
-	with open(TICKET_FILE, 'w') as f:
-		json.dump(tickets, f, indent=2)
-
-
-async def save_ticket(ticket):
-	tickets = await load_tickets()
-	tickets.append(ticket)
-	with open(TICKET_FILE, 'w') as f:
-		json.dump(tickets, f, indent=2)
-
-
-async def update_ticket(channel_id: int, updates: Dict[str, Any]) -> None:
-	tickets = await load_tickets()
-	for ticket in tickets:
-		if ticket['channel_id'] == channel_id:
-			ticket.update(updates)
+# === Ticket store access ===
+def get_store(bot) -> TicketStore:
+	"""The in-memory ticket store owned by the TicketSystem cog."""
+	return bot.get_cog('TicketSystem').store
+
+
+def get_recorder(bot) -> TranscriptRecorder:
+	"""The transcript recorder owned by the TicketSystem cog."""
+	return bot.get_cog('TicketSystem').recorder
+
+
+# === Privileged role IDs, built once instead of per check ===
+ADMIN_ROLES = frozenset(ADMIN_ROLE_IDS)
+STAFF_ROLES = ADMIN_ROLES | {MODERATOR_ROLE_ID}
+
+# (guild ID, member ID) -> (expires at, is admin, is admin or moderator)
+role_class_cache = {}
+
+
+def get_role_class(user):
+	"""(is admin, is admin or moderator) for a member, from the cache while it is fresh."""
+	guild = getattr(user, 'guild', None)
+	if guild is None:
+		return False, False
+	key = (guild.id, user.id)
+	now = time.monotonic()
+	cached = role_class_cache.get(key)
+	if cached is not None and cached[0] > now:
+		return cached[1], cached[2]
+	role_ids = {role.id for role in user.roles}
+	is_admin = not ADMIN_ROLES.isdisjoint(role_ids)
+	is_staff = not STAFF_ROLES.isdisjoint(role_ids)
+	# Every entry lives for the same TTL, so re-inserting at the end keeps the cache in expiry
+	# order and expired entries (members who never check again) are dropped from the front
+	role_class_cache.pop(key, None)
+	while role_class_cache:
+		oldest = next(iter(role_class_cache))
+		if role_class_cache[oldest][0] > now:
 			break
-	with open(TICKET_FILE, 'w') as f:
-		json.dump(tickets, f, indent=2)
+		del role_class_cache[oldest]
+	# The TTL only matters when member updates are not delivered (no members intent)
+	role_class_cache[key] = (now + TicketRoleCacheTTL, is_admin, is_staff)
+	return is_admin, is_staff
 
 
-# === Counter functions for ticket numbering ===
-async def load_counter() -> int:
-	os.makedirs(os.path.dirname(TICKET_COUNTER_FILE), exist_ok=True)
-	if not os.path.exists(TICKET_COUNTER_FILE):
-		with open(TICKET_COUNTER_FILE, 'w') as f:
-			json.dump({'next_num': 1}, f)
-		return 1
-	try:
-		with open(TICKET_COUNTER_FILE, 'r') as f:
-			data = json.load(f)
-			return data.get('next_num', 1)
-	except json.JSONDecodeError:
-		logger.error(f'Error loading {get_data_dir()}/ticket_counter.json – resetting file.')
-		return 1
-
-
-async def save_counter(num: int) -> None:
-	with open(TICKET_COUNTER_FILE, 'w') as f:
-		json.dump({'next_num': num}, f)
+def forget_role_class(member):
+	role_class_cache.pop((member.guild.id, member.id), None)
 
 
 # === Permission helper function ===
-def is_allowed_for_ticket_actions(user, ticket_data, action):
+def is_allowed_for_ticket_actions(user, ticket_data, action, role_class=None):
+	# Callers checking several actions pass one role_class evaluation for all of them
+	is_admin, is_staff = role_class or get_role_class(user)
 	# If ticket is closed, only allow Reopen for creator, admins, or moderators
 	if ticket_data['status'] == 'Closed':
 		if action == 'Reopen':
-			return user.id == ticket_data['user_id'] or any(
-				role.id in ADMIN_ROLE_IDS + [MODERATOR_ROLE_ID] for role in user.roles
-			)
+			return user.id == ticket_data['user_id'] or is_staff
 		return False
 	# Claim only for Admins or Moderators
 	if action == 'Claim':
-		return any(role.id in ADMIN_ROLE_IDS + [MODERATOR_ROLE_ID] for role in user.roles)
+		return is_staff
 	# Assign only for Admins
 	if action == 'Assign':
-		return any(role.id in ADMIN_ROLE_IDS for role in user.roles)
+		return is_admin
 	# Close for creator, Admins, or Moderators
 	elif action == 'Close':
-		return user.id == ticket_data['user_id'] or any(
-			role.id in ADMIN_ROLE_IDS + [MODERATOR_ROLE_ID] for role in user.roles
-		)
+		return user.id == ticket_data['user_id'] or is_staff
 	# Status for everyone
 	return True
 
 
-# === Transcript creation ===
-async def create_transcript(channel: discord.TextChannel) -> str:
-	def replace_mentions(content, guild):
-		def replace_user(match):
-			user_id = int(match.group(1))
-			user = guild.get_member(user_id)
-			return user.name if user else f'User {user_id}'
+# === Ticket statistics helpers ===
+def format_duration(seconds):
+	if seconds is None:
+		return '-'
+	if seconds < 3600:
+		return f'{seconds / 60:.0f}m'
+	if seconds < 86400:
+		return f'{seconds / 3600:.1f}h'
+	return f'{seconds / 86400:.1f}d'
 
-		def replace_role(match):
-			role_id = int(match.group(1))
-			role = guild.get_role(role_id)
-			return role.name if role else f'Role {role_id}'
 
-		content = re.sub(r'<@(\d+)>', replace_user, content)
-		content = re.sub(r'<@&(\d+)>', replace_role, content)
-		return content
+def format_bound(bound):
+	# Percentiles are bucket upper bounds; the last bucket is open-ended
+	return f'≤{format_duration(bound)}' if bound else f'>{format_duration(Buckets[-1])}'
+
+
+def format_latency(histogram):
+	if not len(histogram):
+		return 'No data yet.'
+	return (
+		f'n={len(histogram)} · avg {format_duration(histogram.Mean())} · '
+		f'p50 {format_bound(histogram.Percentile(0.5))} · p90 {format_bound(histogram.Percentile(0.9))}'
+	)
+
 
-	transcript = []
-	async for msg in channel.history(limit=None, oldest_first=True):
-		timestamp = msg.created_at.strftime('%Y-%m-%d %H:%M')
-		author = msg.author.name
-		content = replace_mentions(msg.content or '[Attachment/Embed]', channel.guild)
-		transcript.append(f'[{timestamp}] {author}: {content}')
-	return '\n'.join(transcript)
+def format_handlers(by_handler, limit=5):
+	busiest = sorted(by_handler.items(), key=lambda entry: len(entry[1]), reverse=True)[:limit]
+	lines = [
+		f'{f"<@{handler}>" if handler else "Unclaimed"}: {format_latency(histogram)}'
+		for handler, histogram in busiest
+	]
+	return '\n'.join(lines) or 'No data yet.'
+
+
+def build_ticket_stats_embed(stats):
+	"""Embed of the store's running aggregates; nothing is scanned or parsed here."""
+	embed = discord.Embed(
+		title='📊 Ticket Statistics',
+		description=f'Latencies from ticket creation, over the latest {stats.Window} tickets each.',
+	)
+	embed.add_field(
+		name='By status',
+		value='\n'.join(f'{status}: {count}' for status, count in stats.ByStatus.most_common())
+		or 'No tickets.',
+		inline=True,
+	)
+	embed.add_field(
+		name='By type',
+		value='\n'.join(
+			f'{ticket_type}: {count}' for ticket_type, count in stats.ByType.most_common()
+		)
+		or 'No tickets.',
+		inline=True,
+	)
+	embed.add_field(name='Time to claim', value=format_latency(stats.ClaimLatency), inline=False)
+	embed.add_field(name='Time to close', value=format_latency(stats.CloseLatency), inline=False)
+	embed.add_field(
+		name='Claim by handler', value=format_handlers(stats.ClaimByHandler), inline=False
+	)
+	embed.add_field(
+		name='Close by handler', value=format_handlers(stats.CloseByHandler), inline=False
+	)
+	return embed
 
 
 # === Optional email sending ===
@@ -155,7 +208,7 @@ def build_transcript_html(
 	# Split transcript into lines and format as HTML
 	transcript_lines = transcript_text.splitlines()
 	transcript_html = ''.join(
-		f'<tr><td style="padding:4px 8px;font-family:monospace;font-size:13px;border-bottom:1px solid #eee;vertical-align:top;">{line.replace(chr(10), "<br>")}</td></tr>'
+		f'<tr><td style="padding:4px 8px;font-family:monospace;font-size:13px;border-bottom:1px solid #eee;vertical-align:top;">{html.escape(line)}</td></tr>'
 		for line in transcript_lines
 	)
 	# Ticket meta info
@@ -170,7 +223,7 @@ def build_transcript_html(
         </table>
     """
 	# Main HTML
-	html = f"""
+	html_doc = f"""
     <html>
     <head>
     <meta charset="utf-8">
@@ -191,35 +244,49 @@ def build_transcript_html(
     </body>
     </html>
     """
-	return html
+	return html_doc
 
 
-def send_transcript_email(
+def build_transcript_email(
 	to_email: str,
-	transcript_text: str,
+	html_body: str,
+	artifact: bytes,
+	artifact_name: str,
 	ticket: Dict[str, Any],
 	guild_name: str,
 	creator_name: str,
-	claimer_name: str,
-	assigned_name: str,
-) -> None:
-	try:
-		subject = f'{guild_name} - Ticket Transcript - Ticket #{ticket["ticket_num"]} - Type: {ticket["type"]} - Creator: {creator_name}'
-		html_body = build_transcript_html(
-			transcript_text, ticket, guild_name, creator_name, claimer_name, assigned_name
-		)
-		msg = EmailMessage()
+) -> EmailMessage:
+	subject = f'{guild_name} - Ticket Transcript - Ticket #{ticket["ticket_num"]} - Type: {ticket["type"]} - Creator: {creator_name}'
+	msg = EmailMessage()
+	msg['Subject'] = subject
+	msg['From'] = os.getenv('SMTP_USER')
+	msg['To'] = to_email
+	if len(html_body) <= TranscriptEmailInlineLimit:
 		msg.set_content('This is an HTML email. Please view it in an HTML-compatible email client.')
 		msg.add_alternative(html_body, subtype='html')
-		msg['Subject'] = subject
-		msg['From'] = os.getenv('SMTP_USER')
-		msg['To'] = to_email
-		with smtplib.SMTP_SSL(os.getenv('SMTP_SERVER'), int(os.getenv('SMTP_PORT', 465))) as smtp:
-			smtp.login(os.getenv('SMTP_USER'), os.getenv('SMTP_PASS'))
-			smtp.send_message(msg)
-		logger.info(f'Transcript email sent to {to_email}.')
-	except Exception as e:
-		logger.error(f'Error sending email: {e}')
+	else:
+		# Large transcripts travel as the compressed artifact instead of the message body
+		msg.set_content(
+			f'The transcript of ticket #{ticket["ticket_num"]} is too large to show inline '
+			'and is attached as a compressed HTML file.'
+		)
+		msg.add_attachment(artifact, maintype='application', subtype='gzip', filename=artifact_name)
+	return msg
+
+
+# === Transcript artifact ===
+def build_transcript_artifact(html_body: str) -> bytes:
+	"""Gzip the HTML transcript once; the same bytes go to the channel, the email and the archive."""
+	buffer = io.BytesIO()
+	with gzip.GzipFile(fileobj=buffer, mode='wb', mtime=0) as gz:
+		gz.write(html_body.encode('utf-8'))
+	return buffer.getvalue()
+
+
+def archive_transcript(name: str, artifact: bytes) -> None:
+	os.makedirs(TranscriptArchiveDirectory, exist_ok=True)
+	with open(os.path.join(TranscriptArchiveDirectory, name), 'wb') as f:
+		f.write(artifact)
 
 
 # === Shared Helper Functions (avoids duplication) ===
@@ -238,17 +305,6 @@ def create_ticket_embed(ticket_data, bot_user):
 	return embed
 
 
-def create_transcript_embed(transcript, bot_user):
-	embed = discord.Embed(
-		title='Ticket Transcript',
-		description='The transcript has been created and sent via email.',
-		# Removed color=PINK
-	)
-	embed.add_field(name='Transcript', value=transcript[:1024], inline=False)  # Limit length
-	# Removed set_pink_footer
-	return embed
-
-
 # === Modal for initial message ===
 class InitialMessageModal(discord.ui.Modal, title='Provide additional details (optional)'):
 	initial_message = discord.ui.TextInput(
@@ -301,7 +357,9 @@ class TicketTypeSelect(discord.ui.Select):
 			discord.SelectOption(label='Bug', value='bug', emoji='🐛'),
 			discord.SelectOption(label='Support', value='support', emoji='🛠️'),
 		]
-		super().__init__(placeholder='Choose the ticket type…', options=options)
+		super().__init__(
+			placeholder='Choose the ticket type…', options=options, custom_id='ticket:type'
+		)
 
 	async def callback(self, interaction: discord.Interaction):
 		try:
@@ -331,17 +389,15 @@ async def create_ticket(
 		logger.info(f'Starting ticket creation for user {interaction.user} with type {ticket_type}')
 
 		# Check cooldown: 1 hour between ticket creations per user
-		tickets = await load_tickets()
+		store = get_store(interaction.client)
 		now = datetime.now()
-		user_tickets = [t for t in tickets if t['user_id'] == interaction.user.id]
-		if user_tickets:
-			last_ticket = max(user_tickets, key=lambda t: datetime.fromisoformat(t['created_at']))
-			if now - datetime.fromisoformat(last_ticket['created_at']) < timedelta(hours=1):
-				logger.warning(f'Cooldown active for user {interaction.user}')
-				await interaction.response.send_message(
-					'You can only create a new ticket every 1 hour.', ephemeral=True
-				)
-				return
+		last_created = store.LastCreatedAt(interaction.user.id)
+		if last_created and now - last_created < timedelta(hours=1):
+			logger.warning(f'Cooldown active for user {interaction.user}')
+			await interaction.response.send_message(
+				'You can only create a new ticket every 1 hour.', ephemeral=True
+			)
+			return
 
 		guild = interaction.guild
 		logger.info(f'Guild: {guild}, Guild ID: {guild.id if guild else "None"}')
@@ -375,16 +431,8 @@ async def create_ticket(
 		if moderator_role:
 			overwrites[moderator_role] = discord.PermissionOverwrite(view_channel=True)
 
-		# Calculate ticket_num as the next highest number (no reuse of deleted IDs)
-		existing_nums = [t.get('ticket_num', 0) for t in tickets]
-		max_existing = max(existing_nums) if existing_nums else 0
-		current_counter = await load_counter()
-		if current_counter <= max_existing:
-			ticket_num = max_existing + 1
-			await save_counter(ticket_num + 1)
-		else:
-			ticket_num = current_counter
-			await save_counter(ticket_num + 1)
+		# Allocate the next ticket number (monotonic, never reuses deleted numbers)
+		ticket_num = await store.AllocateNumber()
 
 		# Shorten channel name to avoid exceeding 100 chars
 		user_name_short = interaction.user.name[:20]  # Limit username to 20 chars
@@ -399,6 +447,8 @@ async def create_ticket(
 				name=channel_name, overwrites=overwrites, category=category
 			)
 			logger.info(f'Channel created: {channel.name} (ID: {channel.id})')
+			# Record the transcript from the very first message
+			get_recorder(interaction.client).Start(channel.id)
 		except discord.Forbidden as e:
 			logger.error(f'Forbidden error creating channel: {e}')
 			await interaction.response.send_message(
@@ -420,14 +470,16 @@ async def create_ticket(
 			'type': ticket_type,
 			'status': 'Open',
 			'claimed_by': None,
+			'claimed_at': None,
 			'assigned_to': None,
 			'created_at': datetime.now().isoformat(),
 			'embed_message_id': None,
 			'reopen_count': 0,
 			'initial_message': initial_message,
+			'view_version': TICKET_VIEW_VERSION,
 		}
 
-		await save_ticket(ticket_data)
+		await store.Add(ticket_data)
 		logger.info(f'Ticket data saved for ticket #{ticket_num}')
 
 		embed = create_ticket_embed(ticket_data, interaction.client.user)
@@ -435,8 +487,7 @@ async def create_ticket(
 		msg = await channel.send(
 			f'{interaction.user.mention}, your ticket has been opened!', embed=embed, view=view
 		)
-		ticket_data['embed_message_id'] = msg.id
-		await update_ticket(channel.id, {'embed_message_id': msg.id})
+		await store.Update(channel.id, {'embed_message_id': msg.id})
 
 		await interaction.response.send_message(
 			f'Ticket created! {channel.mention}', ephemeral=True
@@ -490,14 +541,15 @@ class AssignModal(discord.ui.Modal, title='Assign ticket'):
 	async def on_submit(self, interaction: discord.Interaction):
 		try:
 			logger.info(f'AssignModal submitted by {interaction.user}')
-			tickets = await load_tickets()
-			ticket = next((t for t in tickets if t['channel_id'] == interaction.channel.id), None)
+			ticket = get_store(interaction.client).Get(interaction.channel.id)
 			if not ticket or not is_allowed_for_ticket_actions(interaction.user, ticket, 'Assign'):
 				await interaction.response.send_message('Not authorized.', ephemeral=True)
 				return
 			try:
 				user_id = int(self.user_id.value)
-				await update_ticket(interaction.channel.id, {'assigned_to': user_id})
+				await get_store(interaction.client).Update(
+					interaction.channel.id, {'assigned_to': user_id}
+				)
 				await update_embed_and_disable_buttons(interaction)
 				await interaction.response.send_message(
 					f'Ticket assigned to <@{user_id}>.', ephemeral=False
@@ -532,12 +584,13 @@ class AssignSelect(discord.ui.Select):
 				await interaction.response.send_message('No moderators available.', ephemeral=True)
 				return
 			user_id = int(self.values[0])
-			tickets = await load_tickets()
-			ticket = next((t for t in tickets if t['channel_id'] == interaction.channel.id), None)
+			ticket = get_store(interaction.client).Get(interaction.channel.id)
 			if not ticket:
 				await interaction.response.send_message('Ticket not found.', ephemeral=True)
 				return
-			await update_ticket(interaction.channel.id, {'assigned_to': user_id})
+			await get_store(interaction.client).Update(
+				interaction.channel.id, {'assigned_to': user_id}
+			)
 			await update_embed_and_disable_buttons(interaction)
 			await interaction.response.send_message(
 				f'Ticket assigned to <@{user_id}>.', ephemeral=False
@@ -565,17 +618,19 @@ class AssignView(discord.ui.View):
 # === Helper function to update embed and disable buttons ===
 async def update_embed_and_disable_buttons(interaction):
 	try:
-		tickets = await load_tickets()
-		ticket = next((t for t in tickets if t['channel_id'] == interaction.channel.id), None)
+		ticket = get_store(interaction.client).Get(interaction.channel.id)
 		if ticket and ticket.get('embed_message_id'):
 			embed = create_ticket_embed(ticket, interaction.client.user)
 			view = TicketControlView()
+			role_class = get_role_class(interaction.user)
 			# Disable buttons based on permission and status
 			for item in view.children:
 				if isinstance(item, discord.ui.Button):
 					if ticket['status'] == 'Closed' and item.label != 'Reopen':
 						item.disabled = True
-					elif not is_allowed_for_ticket_actions(interaction.user, ticket, item.label):
+					elif not is_allowed_for_ticket_actions(
+						interaction.user, ticket, item.label, role_class
+					):
 						item.disabled = True
 					elif item.label == 'Claim' and ticket.get('claimed_by'):
 						item.disabled = True
@@ -624,15 +679,39 @@ async def close_ticket_with_message(interaction, ticket, close_message=None):
 	_msg = await interaction.channel.send('🔒 Closing ticket...')
 	_followup = interaction.followup
 
-	# Update status
-	await update_ticket(interaction.channel.id, {'status': 'Closed'})
+	# Status and closed_at are written once, here, so the close time never moves afterwards
+	closed_at = datetime.now().isoformat()
+	await get_store(bot).Update(
+		interaction.channel.id, {'status': 'Closed', 'closed_at': closed_at}
+	)
 
 	# Close asynchronously, pass the message to delete it later
 	await close_ticket_async(bot, channel, ticket, _followup, _msg, close_message=None)
 
 
 async def close_ticket_async(bot, channel, ticket, followup, closing_msg, close_message=None):
-	transcript = await create_transcript(channel)
+	# Recorded live; the crawl only fills in what was missed while the bot was offline
+	transcript_lines = await get_recorder(bot).Build(channel)
+	transcript = '\n'.join(transcript_lines)
+
+	# Get names for the transcript
+	creator_user = bot.get_user(ticket['user_id'])
+	creator_name = creator_user.name if creator_user else f'User {ticket["user_id"]}'
+	claimer_user = bot.get_user(ticket.get('claimed_by')) if ticket.get('claimed_by') else None
+	claimer_name = claimer_user.name if claimer_user else 'None'
+	assigned_user = bot.get_user(ticket.get('assigned_to')) if ticket.get('assigned_to') else None
+	assigned_name = assigned_user.name if assigned_user else 'None'
+
+	# Build the compressed transcript once and reuse it for the post, the email and the archive
+	html_body = build_transcript_html(
+		transcript, ticket, channel.guild.name, creator_name, claimer_name, assigned_name
+	)
+	artifact = await asyncio.to_thread(build_transcript_artifact, html_body)
+	artifact_name = f'ticket-{ticket["ticket_num"]}-transcript.html.gz'
+	try:
+		await asyncio.to_thread(archive_transcript, artifact_name, artifact)
+	except OSError as e:
+		logger.error(f'Error archiving transcript for ticket #{ticket["ticket_num"]}: {e}')
 
 	# Update channel permissions: Remove send_messages for creator
 	creator = bot.get_user(ticket['user_id'])
@@ -666,20 +745,13 @@ async def close_ticket_async(bot, channel, ticket, followup, closing_msg, close_
 	if close_message and close_message.strip():
 		embed.add_field(name='Closing Message', value=close_message, inline=False)
 
-	# Add transcript as field (split if too long)
-	if len(transcript) <= 1024:
-		embed.add_field(name='Transcript', value=transcript, inline=False)
-	else:
-		# Split transcript into multiple fields
-		chunks = [transcript[i : i + 1024] for i in range(0, len(transcript), 1024)]
-		for idx, chunk in enumerate(chunks[:5], 1):  # Max 5 fields to avoid embed limit
-			embed.add_field(name=f'Transcript (Part {idx})', value=chunk, inline=False)
-		if len(chunks) > 5:
-			embed.add_field(
-				name='Note',
-				value='Transcript is too long. Full version sent via email.',
-				inline=False,
-			)
+	# The full transcript is attached; the embed only summarizes it
+	message_count = len(transcript_lines)
+	embed.add_field(
+		name='Transcript',
+		value=f'{message_count} message(s), attached as `{artifact_name}`',
+		inline=False,
+	)
 
 	# Removed set_pink_footer
 
@@ -687,7 +759,9 @@ async def close_ticket_async(bot, channel, ticket, followup, closing_msg, close_
 	transcripts_channel = bot.get_channel(TRANSCRIPT_CHANNEL_ID)
 	if transcripts_channel:
 		try:
-			await transcripts_channel.send(embed=embed)
+			await transcripts_channel.send(
+				embed=embed, file=discord.File(io.BytesIO(artifact), filename=artifact_name)
+			)
 			logger.info(
 				f'Transcript for ticket #{ticket["ticket_num"]} posted to transcripts channel.'
 			)
@@ -714,15 +788,14 @@ async def close_ticket_async(bot, channel, ticket, followup, closing_msg, close_
 		except Exception as e:
 			logger.error(f'Error sending closing message to creator {creator.name}: {e}')
 
-	# Update ticket status
-	ticket['status'] = 'Closed'
-	ticket['closed_at'] = datetime.now().isoformat()
-
 	# Disable buttons and update embed before archiving
 	await disable_buttons_for_closed_ticket(channel, ticket)
 
 	# Send success message in channel (check for None AND empty string)
-	success_msg = 'Ticket successfully closed and archived. It will be deleted after 7 days.'
+	success_msg = (
+		'Ticket successfully closed and archived. '
+		f'It will be deleted after {TicketRetentionDays} days.'
+	)
 	if close_message and close_message.strip():
 		success_msg += f'\n\n**Closing Message:** {close_message}'
 	await channel.send(success_msg)
@@ -736,42 +809,45 @@ async def close_ticket_async(bot, channel, ticket, followup, closing_msg, close_
 	# Archive the channel
 	await channel.edit(archived=True)
 
-	# Get names for email
-	creator_user = bot.get_user(ticket['user_id'])
-	creator_name = creator_user.name if creator_user else f'User {ticket["user_id"]}'
-	claimer_user = bot.get_user(ticket.get('claimed_by')) if ticket.get('claimed_by') else None
-	claimer_name = claimer_user.name if claimer_user else 'None'
-	assigned_user = bot.get_user(ticket.get('assigned_to')) if ticket.get('assigned_to') else None
-	assigned_name = assigned_user.name if assigned_user else 'None'
-
-	# Send email
-	send_transcript_email(
-		os.getenv('SUPPORT_EMAIL'),
-		transcript,
-		ticket,
-		channel.guild.name,
-		creator_name,
-		claimer_name,
-		assigned_name,
-	)
+	# Queue the email; the mail worker delivers it off the event loop and retries on failure
+	support_email = os.getenv('SUPPORT_EMAIL')
+	if support_email:
+		msg = build_transcript_email(
+			support_email,
+			html_body,
+			artifact,
+			artifact_name,
+			ticket,
+			channel.guild.name,
+			creator_name,
+		)
+		await bot.get_cog('TicketSystem').mail_queue.Enqueue(msg)
+	else:
+		logger.warning('SUPPORT_EMAIL is not set, transcript email skipped.')
 	logger.info(f'Ticket #{ticket["ticket_num"]} closed.')
 
 
 # === View with ticket buttons ===
+# Persistent: static custom_ids and no per-ticket state (every callback looks the ticket up by
+# channel), so one instance registered with bot.add_view serves every ticket after a restart
 class TicketControlView(discord.ui.View):
 	def __init__(self):
 		super().__init__(timeout=None)
 
-	@discord.ui.button(label='Claim', style=discord.ButtonStyle.blurple, emoji='👋')
+	@discord.ui.button(
+		label='Claim', style=discord.ButtonStyle.blurple, emoji='👋', custom_id='ticket:claim'
+	)
 	async def claim(self, interaction: discord.Interaction, button: discord.ui.Button):
 		try:
 			logger.info(f'Claim button pressed by {interaction.user}')
-			tickets = await load_tickets()
-			ticket = next((t for t in tickets if t['channel_id'] == interaction.channel.id), None)
+			ticket = get_store(interaction.client).Get(interaction.channel.id)
 			if not ticket or not is_allowed_for_ticket_actions(interaction.user, ticket, 'Claim'):
 				await interaction.response.send_message('Not authorized.', ephemeral=True)
 				return
-			await update_ticket(interaction.channel.id, {'claimed_by': interaction.user.id})
+			await get_store(interaction.client).Update(
+				interaction.channel.id,
+				{'claimed_by': interaction.user.id, 'claimed_at': datetime.now().isoformat()},
+			)
 			await update_embed_and_disable_buttons(interaction)
 			await interaction.response.send_message(
 				f'{interaction.user.mention} has claimed the ticket.', ephemeral=False
@@ -783,12 +859,13 @@ class TicketControlView(discord.ui.View):
 				'An error occurred. Please try again.', ephemeral=True
 			)
 
-	@discord.ui.button(label='Assign', style=discord.ButtonStyle.gray, emoji='📋')
+	@discord.ui.button(
+		label='Assign', style=discord.ButtonStyle.gray, emoji='📋', custom_id='ticket:assign'
+	)
 	async def assign(self, interaction: discord.Interaction, button: discord.ui.Button):
 		try:
 			logger.info(f'Assign button pressed by {interaction.user}')
-			tickets = await load_tickets()
-			ticket = next((t for t in tickets if t['channel_id'] == interaction.channel.id), None)
+			ticket = get_store(interaction.client).Get(interaction.channel.id)
 			if not ticket or not is_allowed_for_ticket_actions(interaction.user, ticket, 'Assign'):
 				await interaction.response.send_message('Not authorized.', ephemeral=True)
 				return
@@ -797,7 +874,7 @@ class TicketControlView(discord.ui.View):
 			available_users = [
 				member
 				for member in guild.members
-				if any(role.id in ADMIN_ROLE_IDS + [MODERATOR_ROLE_ID] for role in member.roles)
+				if any(role.id in STAFF_ROLES for role in member.roles)
 			]
 			if not available_users:
 				await interaction.response.send_message(
@@ -815,12 +892,13 @@ class TicketControlView(discord.ui.View):
 				'An error occurred. Please try again.', ephemeral=True
 			)
 
-	@discord.ui.button(label='Status', style=discord.ButtonStyle.green, emoji='📊')
+	@discord.ui.button(
+		label='Status', style=discord.ButtonStyle.green, emoji='📊', custom_id='ticket:status'
+	)
 	async def status(self, interaction: discord.Interaction, button: discord.ui.Button):
 		try:
 			logger.info(f'Status button pressed by {interaction.user}')
-			tickets = await load_tickets()
-			ticket = next((t for t in tickets if t['channel_id'] == interaction.channel.id), None)
+			ticket = get_store(interaction.client).Get(interaction.channel.id)
 			if ticket:
 				embed = create_ticket_embed(ticket, interaction.client.user)
 				await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -832,20 +910,22 @@ class TicketControlView(discord.ui.View):
 				'An error occurred. Please try again.', ephemeral=True
 			)
 
-	@discord.ui.button(label='Close', style=discord.ButtonStyle.red, emoji='🔒')
+	@discord.ui.button(
+		label='Close', style=discord.ButtonStyle.red, emoji='🔒', custom_id='ticket:close'
+	)
 	async def close(self, interaction: discord.Interaction, button: discord.ui.Button):
-		tickets = await load_tickets()
-		ticket = next((t for t in tickets if t['channel_id'] == interaction.channel.id), None)
+		ticket = get_store(interaction.client).Get(interaction.channel.id)
 		if not ticket or not is_allowed_for_ticket_actions(interaction.user, ticket, 'Close'):
 			await interaction.response.send_message('Not authorized.', ephemeral=True)
 			return
 		# Open modal for optional close message
 		await interaction.response.send_modal(CloseMessageModal(ticket))
 
-	@discord.ui.button(label='Reopen', style=discord.ButtonStyle.secondary, emoji='🔓')
+	@discord.ui.button(
+		label='Reopen', style=discord.ButtonStyle.secondary, emoji='🔓', custom_id='ticket:reopen'
+	)
 	async def reopen(self, interaction: discord.Interaction, button: discord.ui.Button):
-		tickets = await load_tickets()
-		ticket = next((t for t in tickets if t['channel_id'] == interaction.channel.id), None)
+		ticket = get_store(interaction.client).Get(interaction.channel.id)
 		if not ticket:
 			await interaction.response.send_message('Ticket not found.', ephemeral=True)
 			return
@@ -879,11 +959,12 @@ class TicketControlView(discord.ui.View):
 				logger.error(f'Error restoring permissions for creator: {e}')
 
 		# Reopen: Set status to Open, unarchive, increase reopen_count
-		await update_ticket(
+		await get_store(interaction.client).Update(
 			interaction.channel.id,
 			{
 				'status': 'Open',
 				'claimed_by': None,
+				'claimed_at': None,
 				'assigned_to': None,
 				'reopen_count': ticket.get('reopen_count', 0) + 1,
 			},
@@ -895,10 +976,12 @@ class TicketControlView(discord.ui.View):
 		)
 		logger.info(f'Ticket #{ticket["ticket_num"]} reopened by {interaction.user}.')
 
-	@discord.ui.button(label='Delete', style=discord.ButtonStyle.danger, emoji='🗑️')
+	@discord.ui.button(
+		label='Delete', style=discord.ButtonStyle.danger, emoji='🗑️', custom_id='ticket:delete'
+	)
 	async def delete(self, interaction: discord.Interaction, button: discord.ui.Button):
 		# Check if user is admin
-		if not any(role.id in ADMIN_ROLE_IDS for role in interaction.user.roles):
+		if not get_role_class(interaction.user)[0]:
 			await interaction.response.send_message(
 				'Not authorized. Only admins can delete tickets.', ephemeral=True
 			)
@@ -917,7 +1000,8 @@ class TicketControlView(discord.ui.View):
 			return
 
 		# Remove from database
-		await delete_ticket(interaction.channel.id)
+		await get_store(interaction.client).Delete(interaction.channel.id)
+		await get_recorder(interaction.client).Discard(interaction.channel.id)
 		logger.info(f'Ticket data for channel {interaction.channel.id} removed from database.')
 
 
@@ -925,11 +1009,65 @@ class TicketControlView(discord.ui.View):
 class TicketSystem(commands.Cog):
 	"""
 	🎫 Ticket System Cog: Allows creating and managing support tickets.
-	Modular and persistent with JSON.
+	Tickets live in an indexed in-memory store backed by a JSON journal.
 	"""
 
 	def __init__(self, bot):
 		self.bot = bot
+		# Tickets are loaded once and indexed in memory; changes are journaled, not rewritten
+		self.store = TicketStore(
+			TICKET_FILE,
+			TICKET_JOURNAL_FILE,
+			TICKET_COUNTER_FILE,
+			TicketJournalCompactEvery,
+			timedelta(days=TicketRetentionDays),
+			TicketStatsWindow,
+		)
+		self.store.Load()
+		self.recorder = TranscriptRecorder(TranscriptDirectory, TranscriptFlushDelay)
+		self.mail_queue = MailQueue(
+			MailOutboxDirectory,
+			os.getenv('SMTP_SERVER'),
+			int(os.getenv('SMTP_PORT', 465)),
+			os.getenv('SMTP_USER'),
+			os.getenv('SMTP_PASS'),
+			MailBatchSize,
+			MailMaxAttempts,
+			MailRetryBaseDelay,
+			MailRetryMaxDelay,
+		)
+		RegisterGauge('mail.outbox', lambda: len(self.mail_queue))
+		self.ready = False
+
+	async def cog_load(self):
+		"""Register the persistent views and start delivering queued mail."""
+		# Button and select clicks are routed by custom_id, so no message has to be edited on startup
+		self.bot.add_view(TicketView())
+		self.bot.add_view(TicketControlView())
+		# Includes anything left in the outbox by the last run
+		self.mail_queue.Start()
+
+	async def cog_unload(self):
+		"""Fold the journal into tickets.json before the cog goes away."""
+		await self.store.Close()
+		await self.recorder.Flush()
+		await self.mail_queue.Stop()
+
+	# Record every message sent in a ticket channel as it arrives
+	@commands.Cog.listener()
+	async def on_message(self, message):
+		if message.guild and self.store.Get(message.channel.id):
+			self.recorder.Record(message)
+
+	# Role changes take effect on the next permission check instead of after the cache TTL
+	@commands.Cog.listener()
+	async def on_member_update(self, before, after):
+		if before.roles != after.roles:
+			forget_role_class(after)
+
+	@commands.Cog.listener()
+	async def on_member_remove(self, member):
+		forget_role_class(member)
 
 	# Shared Helper for ticket embed (used in prefix and slash)
 	def get_ticket_help_embed(self, ctx_or_interaction):
@@ -961,72 +1099,140 @@ class TicketSystem(commands.Cog):
 		embed = self.get_ticket_help_embed(interaction)
 		await interaction.response.send_message(embed=embed, view=TicketView(), ephemeral=True)
 
-	# On ready: Restore views for open tickets and start cleanup
+	# !ticket-stats (Prefix) - Admins and moderators only
+	@commands.command(name='ticket-stats')
+	async def ticket_stats_command(self, ctx):
+		"""
+		📊 Show ticket volume and claim/close latency.
+		"""
+		if not get_role_class(ctx.author)[1]:
+			await ctx.send('Not authorized.')
+			return
+		await ctx.send(embed=build_ticket_stats_embed(self.store.Stats))
+
+	# /ticket-stats (Slash)
+	@app_commands.command(
+		name='ticket-stats', description='📊 Show ticket volume and claim/close latency.'
+	)
+	async def ticket_stats_slash(self, interaction: discord.Interaction):
+		if not get_role_class(interaction.user)[1]:
+			await interaction.response.send_message('Not authorized.', ephemeral=True)
+			return
+		await interaction.response.send_message(
+			embed=build_ticket_stats_embed(self.store.Stats), ephemeral=True
+		)
+
+	# On ready: Migrate control messages posted before the persistent view and start cleanup
 	@commands.Cog.listener()
 	async def on_ready(self):
-		logger.info('TicketSystem Cog ready. Restoring views for open tickets...')
-		tickets = await load_tickets()
-		for ticket in tickets:
-			if ticket['status'] in ['Open', 'Closed']:
-				# Always restore open tickets as user decides when to close
-				# Always restore closed tickets as they are static
-				try:
-					channel = self.bot.get_channel(ticket['channel_id'])
-					if channel and ticket.get('embed_message_id'):
-						msg = await channel.fetch_message(ticket['embed_message_id'])
-						embed = create_ticket_embed(ticket, self.bot.user)
-						view = TicketControlView()
-						# Disable buttons based on status (general, no user)
-						for item in view.children:
-							if isinstance(item, discord.ui.Button):
-								if ticket['status'] == 'Closed' and item.label != 'Reopen':
-									item.disabled = True
-								elif item.label == 'Claim' and ticket.get('claimed_by'):
-									item.disabled = True
-								elif item.label == 'Assign' and ticket.get('assigned_to'):
-									item.disabled = True
-								elif item.label == 'Reopen' and ticket['status'] == 'Open':
-									item.disabled = True
-						await msg.edit(embed=embed, view=view)
-						logger.info(f'View for ticket #{ticket["ticket_num"]} restored.')
-					await asyncio.sleep(6)  # Further increased sleep to avoid rate limits on server
-				except Exception as e:
-					logger.error(f'Error restoring view for ticket {ticket["ticket_num"]}: {e}')
+		# on_ready fires again after every reconnect; the work below only needs to happen once
+		if self.ready:
+			return
+		self.ready = True
+		stale = [
+			ticket
+			for ticket in self.store.All()
+			if ticket['status'] in ['Open', 'Closed']
+			and ticket.get('view_version') != TICKET_VIEW_VERSION
+		]
+		if stale:
+			logger.info(
+				f'Migrating {len(stale)} ticket control message(s) to the persistent view...'
+			)
+			# The scheduler bounds concurrency and paces each channel by its rate-limit headers
+			results = await asyncio.gather(
+				*(self.migrate_ticket_view(ticket) for ticket in stale), return_exceptions=True
+			)
+			for ticket, result in zip(stale, results):
+				if isinstance(result, Exception):
+					logger.error(
+						f'Error restoring view for ticket {ticket["ticket_num"]}: {result}'
+					)
 		# Start cleanup task
 		self.bot.loop.create_task(self.cleanup_old_tickets())
 
-	# Background task for automatic deletion of old tickets
+	async def migrate_ticket_view(self, ticket):
+		"""Replace an old control message's view (random custom_ids) with the persistent one."""
+		channel = self.bot.get_channel(ticket['channel_id'])
+		if not channel:
+			try:
+				channel = await self.bot.fetch_channel(ticket['channel_id'])
+			except discord.NotFound:
+				channel = None
+		if not channel or not ticket.get('embed_message_id'):
+			# Nothing left to migrate; mark it anyway so it isn't retried on every startup
+			logger.warning(
+				f'Channel or control message for ticket #{ticket["ticket_num"]} is gone.'
+			)
+			await self.store.Update(ticket['channel_id'], {'view_version': TICKET_VIEW_VERSION})
+			return
+		msg = channel.get_partial_message(ticket['embed_message_id'])
+		embed = create_ticket_embed(ticket, self.bot.user)
+		view = TicketControlView()
+		# Disable buttons based on status (general, no user)
+		for item in view.children:
+			if isinstance(item, discord.ui.Button):
+				if ticket['status'] == 'Closed' and item.label != 'Reopen':
+					item.disabled = True
+				elif item.label == 'Claim' and ticket.get('claimed_by'):
+					item.disabled = True
+				elif item.label == 'Assign' and ticket.get('assigned_to'):
+					item.disabled = True
+				elif item.label == 'Reopen' and ticket['status'] == 'Open':
+					item.disabled = True
+		try:
+			await self.bot.Scheduler.Run(
+				partial(msg.edit, embed=embed, view=view),
+				('message_edit', channel.id),
+				Background,
+			)
+		except discord.NotFound:
+			logger.warning(f'Control message for ticket #{ticket["ticket_num"]} is gone.')
+		await self.store.Update(channel.id, {'view_version': TICKET_VIEW_VERSION})
+		logger.info(f'View for ticket #{ticket["ticket_num"]} restored.')
+
+	# Background task that deletes closed tickets exactly when their retention ends
 	async def cleanup_old_tickets(self):
 		await self.bot.wait_until_ready()
 		while not self.bot.is_closed():
-			logger.info('Checking old tickets for deletion...')
-			tickets = await load_tickets()
-			now = datetime.now()
-			to_delete = []
-			for ticket in tickets:
-				if ticket['status'] == 'Closed':
-					closed_at_str = ticket.get('closed_at', ticket.get('created_at'))
-					closed_at = datetime.fromisoformat(closed_at_str)
-					if now - closed_at > timedelta(days=7):
-						to_delete.append(ticket)
-			for ticket in to_delete:
-				try:
-					# Try to get the channel, even if archived
-					channel = self.bot.get_channel(ticket['channel_id'])
-					if not channel:
-						# If not in cache, try to fetch from guild
-						guild = self.bot.get_guild(int(os.getenv('DISCORD_GUILD_ID')))
-						if guild:
-							channel = await guild.fetch_channel(ticket['channel_id'])
-					if channel:
-						await channel.delete()
-						logger.info(f'Old ticket #{ticket["ticket_num"]} deleted.')
-					else:
-						logger.warning(f'Channel for ticket #{ticket["ticket_num"]} not found.')
-					await delete_ticket(ticket['channel_id'])
-				except Exception as e:
-					logger.error(f'Error deleting ticket #{ticket["ticket_num"]}: {e}')
-			await asyncio.sleep(86400)  # Wait 24 hours
+			# Sleep until the earliest deletion is due, or until a close moves it earlier
+			due = self.store.NextExpiry()
+			timeout = None if due is None else max((due - datetime.now()).total_seconds(), 0)
+			self.store.ExpiryChanged.clear()
+			try:
+				await asyncio.wait_for(self.store.ExpiryChanged.wait(), timeout)
+			except asyncio.TimeoutError:
+				pass
+			for ticket in self.store.PopExpired(datetime.now()):
+				await self.delete_old_ticket(ticket)
+
+	async def delete_old_ticket(self, ticket):
+		channel_id = ticket['channel_id']
+		try:
+			# Try to get the channel, even if archived
+			channel = self.bot.get_channel(channel_id)
+			if not channel:
+				# Not in cache; NotFound here means it was deleted by hand
+				channel = await self.bot.fetch_channel(channel_id)
+			await channel.delete()
+			logger.info(f'Old ticket #{ticket["ticket_num"]} deleted.')
+		except discord.NotFound:
+			logger.warning(f'Channel for ticket #{ticket["ticket_num"]} is already gone.')
+		except Exception as e:
+			# Transient failure: back off and try again instead of waiting for a restart
+			retry_at = self.store.Postpone(
+				channel_id,
+				datetime.now(),
+				timedelta(seconds=TicketCleanupRetryDelay),
+				timedelta(seconds=TicketCleanupRetryMaxDelay),
+			)
+			logger.error(
+				f'Error deleting ticket #{ticket["ticket_num"]}: {e} '
+				f'(retrying at {retry_at:%Y-%m-%d %H:%M:%S})'
+			)
+			return
+		await self.store.Delete(channel_id)
+		await self.recorder.Discard(channel_id)
 
 
 # === Setup function ===
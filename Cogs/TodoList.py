@@ -1,12 +1,29 @@
 from discord.ext import commands
 from discord import app_commands
 import discord
-import os
-import json
-import openai
 import asyncio
-from typing import Dict, List, Any, Optional
+from functools import partial
+import io
+import json
+import re
+from typing import Dict, List, Any, Optional, Tuple
+from Utils.RestScheduler import Update
+from Utils.TodoRepository import TodoRepository, PagesFromNdjson
+from Utils.TodoDatabase import SqliteTodoRepository
+from Utils.TaskFormatter import TaskFormatter
+from Utils.CooldownStore import CooldownStore
+from Utils.Metrics import RegisterGauge
 from Config import (
+	TodoStorageBackend,
+	TodoDatabaseFile,
+	TodoFlushDelay,
+	TodoNavigationCooldown,
+	TodoBulkAddLimit,
+	TodoImportMaxBytes,
+	TaskFormatterModel,
+	TaskFormatterTimeout,
+	TaskFormatterConcurrency,
+	TaskFormatterCacheSize,
 	EMBED_COLOR,
 	ADMIN_ROLE_IDS,
 	MODERATOR_ROLE_ID,
@@ -19,7 +36,6 @@ logger = logging.getLogger(__name__)
 
 # === File path for to-do list data ===
 TODO_DATA_FILE = 'todo_list.json'
-TODO_PERSISTENT_VIEWS_FILE = 'todo_persistent_views.json'
 
 
 # === Helper function for embed footer ===
@@ -33,116 +49,194 @@ def set_embed_footer(embed: discord.Embed, bot: discord.ClientUser = None) -> No
 # TODO_CHANNEL_ID is now imported from Config.py based on PROD_MODE
 
 
-# === Helper functions for data persistence ===
-async def load_todo_data() -> Dict[str, Any]:
-	"""Load to-do list data from JSON file."""
-	if not os.path.exists(TODO_DATA_FILE):
-		logger.warning(f'To-do data file not found at {TODO_DATA_FILE}. Starting fresh.')
-		return {'channels': {}}
-	try:
-		with open(TODO_DATA_FILE, 'r', encoding='utf-8') as f:
-			data = json.load(f)
-
-		# Migrate old single-channel format to multi-channel format
-		if 'channel_id' in data or 'items' in data:
-			logger.info('Migrating old single-channel format to multi-channel format')
-			old_channel_id = data.get('channel_id')
-			old_items = data.get('items', [])
-			old_message_ids = data.get('message_ids', [])
-
-			# Create new format
-			new_data = {'channels': {}}
-
-			# If there was an old channel, migrate it
-			if old_channel_id:
-				new_data['channels'][str(old_channel_id)] = {
-					'message_ids': old_message_ids,
-					'items': old_items,
-				}
-
-			# Save migrated data
-			save_todo_data(new_data)
-			data = new_data
-
-		# Ensure channels dict exists
-		if 'channels' not in data:
-			data['channels'] = {}
-
-		# Migrate old items that don't have author info
-		for channel_id, channel_data in data['channels'].items():
-			for item in channel_data.get('items', []):
-				if 'author_id' not in item:
-					item['author_id'] = None
-					item['author_name'] = 'Unknown'
-
-		# Migrate to page-based format
-		for channel_id, channel_data in data['channels'].items():
-			# If channel has old "items" array instead of "pages"
-			if 'items' in channel_data and 'pages' not in channel_data:
-				logger.info(f'Migrating channel {channel_id} to page-based format')
-				old_items = channel_data.get('items', [])
-				channel_data['pages'] = [{'title': '📋 To-Do List', 'items': old_items}]
-				channel_data['current_page'] = 0
-				del channel_data['items']
-
-			# Ensure pages structure exists
-			if 'pages' not in channel_data:
-				channel_data['pages'] = [{'title': '📋 To-Do List', 'items': []}]
-
-			# Ensure current_page exists
-			if 'current_page' not in channel_data:
-				channel_data['current_page'] = 0
-
-			# Validate current_page is within bounds
-			if channel_data['current_page'] >= len(channel_data['pages']):
-				channel_data['current_page'] = 0
-
-		# Migrate to assignment fields
-		for channel_id, channel_data in data['channels'].items():
-			for page in channel_data.get('pages', []):
-				for item in page.get('items', []):
-					# Add assignment fields if missing
-					if 'assigned_to_id' not in item:
-						item['assigned_to_id'] = None
-						item['assigned_to_name'] = None
-						item['assigned_by_id'] = None
-						item['assigned_by_name'] = None
-						item['assigned_at'] = None
-
-		return data
-	except Exception as e:
-		logger.error(f'Error loading to-do data: {e}')
-		return {'channels': {}}
-
-
-def save_todo_data(data: Dict[str, Any]) -> None:
-	"""Save to-do list data to JSON file."""
-	# Only create directory if the path has a directory component
-	dir_path = os.path.dirname(TODO_DATA_FILE)
-	if dir_path:
-		os.makedirs(dir_path, exist_ok=True)
-	try:
-		with open(TODO_DATA_FILE, 'w', encoding='utf-8') as f:
-			json.dump(data, f, indent=4, ensure_ascii=False)
-	except Exception as e:
-		logger.error(f'Error saving to-do data: {e}')
-
-
-async def get_channel_data(data: Dict[str, Any], channel_id: int) -> Dict[str, Any]:
-	"""Get data for a specific channel, creating if doesn't exist."""
-	channel_key = str(channel_id)
-	if channel_key not in data['channels']:
-		data['channels'][channel_key] = {
-			'message_ids': [],
-			'current_page': 0,
-			'pages': [{'title': '📋 To-Do List', 'items': []}],
-		}
-	return data['channels'][channel_key]
+# === Repository access ===
+def get_repository(bot: commands.Bot) -> TodoRepository:
+	"""Return the in-memory to-do repository owned by the TodoList cog."""
+	return bot.get_cog('TodoList').repository
+
+
+def get_channel_lock(bot: commands.Bot, channel_id: int) -> asyncio.Lock:
+	"""Lock serializing read-modify-write-render sequences on one channel's to-do list."""
+	return bot.get_cog('TodoList').channel_lock(channel_id)
+
+
+def current_page_items(bot: commands.Bot, channel_id: int) -> Tuple[int, List[Dict[str, Any]]]:
+	"""Index and items of the channel's current page."""
+	repository = get_repository(bot)
+	page_idx = repository.CurrentPageIndex(channel_id)
+	return page_idx, repository.Items(channel_id, page_idx)
+
+
+async def refresh_stale_select(
+	interaction: discord.Interaction, view: Optional[discord.ui.View]
+) -> None:
+	"""Replace a select built from an older revision of the list with a fresh one."""
+	if view is None:
+		content = '⚠️ The to-do list changed and there is nothing left to pick here.'
+	else:
+		content = (
+			'⚠️ The to-do list changed since this menu was opened. '
+			'The options have been refreshed, please pick again.'
+		)
+	if interaction.response.is_done():
+		await interaction.edit_original_response(content=content, view=view)
+	else:
+		await interaction.response.edit_message(content=content, view=view)
 
 
 # === Priority emojis ===
 PRIORITY_EMOJIS = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
 
+# === Items per embed when a page is split across messages ===
+MAX_ITEMS_PER_EMBED = 12
+
+
+# === Bulk helpers ===
+BULLET_PREFIX = re.compile(r'^\s*(?:[-*•]|\d+[.)])\s*')
+PRIORITY_PREFIX = re.compile(r'^(high|medium|low)\s*:\s*', re.IGNORECASE)
+
+
+def parse_bulk_lines(text: str, default_priority: str) -> List[Tuple[str, str]]:
+	"""Split a pasted list into (raw task, priority) pairs, one per non-empty line."""
+	tasks = []
+	for line in text.splitlines():
+		line = BULLET_PREFIX.sub('', line).strip()
+		priority = default_priority
+		match = PRIORITY_PREFIX.match(line)
+		if match:
+			priority = match.group(1).lower()
+			line = line[match.end() :].strip()
+		if line:
+			tasks.append((line, priority))
+	return tasks
+
+
+def bulk_item_options(items: List[Dict[str, Any]]) -> List[discord.SelectOption]:
+	"""Select options (value = item index) for the first 25 items of a page."""
+	options = []
+	for i, item in enumerate(items[:25]):
+		title = item.get('title', 'Untitled')
+		if len(title) > 50:
+			title = title[:50] + '...'
+		assignee = item.get('assigned_to_name') or 'Unassigned'
+		priority = item.get('priority', 'low').title()
+		options.append(
+			discord.SelectOption(
+				label=f'{i + 1}. {title}'[:100],
+				value=str(i),
+				description=f'{assignee} • Priority: {priority}'[:100],
+			)
+		)
+	return options
+
+
+# === Rendering ===
+def format_todo_item(item: Dict[str, Any]) -> List[str]:
+	"""Description lines for a single to-do item."""
+	lines = [item['title']]
+	if item.get('description'):
+		lines.append(item['description'])
+	lines.append(f'👤 *Added by {item.get("author_name", "Unknown")}*')
+	# Add assignment info
+	assigned_to = item.get('assigned_to_name')
+	if assigned_to:
+		assigned_by = item.get('assigned_by_name')
+		if assigned_by:
+			# Admin assigned
+			lines.append(f'📌 *Assigned to {assigned_to} by {assigned_by}*')
+		else:
+			# Self-claimed
+			lines.append(f'🙋 *Claimed by {assigned_to}*')
+	lines.append('')  # Empty line
+	return lines
+
+
+def create_todo_embed(
+	items: List[Dict[str, Any]],
+	is_first: bool = True,
+	total_items: Optional[int] = None,
+	page_start: Optional[int] = None,
+	page_end: Optional[int] = None,
+	page_title: Optional[str] = None,
+	page_number: Optional[int] = None,
+	total_pages: Optional[int] = None,
+) -> discord.Embed:
+	"""Create a formatted to-do list embed."""
+	embed = discord.Embed(color=EMBED_COLOR)
+
+	# Use page title if provided, otherwise use default
+	if page_title:
+		# Add page counter if multiple pages exist
+		if total_pages and total_pages > 1:
+			embed.title = f'{page_title} (Page {page_number}/{total_pages})'
+		else:
+			embed.title = page_title
+	elif not is_first and page_start and page_end:
+		embed.title = f'📋 To-Do List (Continued - Items {page_start}-{page_end})'
+	else:
+		embed.title = '📋 To-Do List'
+
+	# Group items by priority in a single pass
+	grouped = {priority: [] for priority in PRIORITY_EMOJIS}
+	for item in items:
+		if item['priority'] in grouped:
+			grouped[item['priority']].append(item)
+
+	# Build description, highest priority first
+	description_parts = []
+	for priority, emoji in PRIORITY_EMOJIS.items():
+		if grouped[priority]:
+			description_parts.append(f'\n{emoji} **{priority.capitalize()} Priority**')
+			for item in grouped[priority]:
+				description_parts.extend(format_todo_item(item))
+
+	if not items:
+		description_parts.append('No items yet! Use `/todo-update` to add one.')
+
+	description_parts.append('\n🚀 Stay tuned for updates!')
+
+	# Join
+	full_description = '\n'.join(description_parts)
+
+	# For first embed, check if needs truncation
+	if is_first and total_items and total_items > len(items):
+		embed.description = (
+			full_description + '\n\n⚠️ **List truncated due to length.**\n'
+			f'Showing first {len(items)} items.\n'
+			f'Total items: {total_items}'
+		)
+	else:
+		embed.description = full_description
+
+	set_embed_footer(embed)
+	return embed
+
+
+def render_page_embeds(
+	page: Dict[str, Any], page_number: int, total_pages: int
+) -> List[discord.Embed]:
+	"""Split a page into its chunk embeds (MAX_ITEMS_PER_EMBED items each)."""
+	items = page.get('items', [])
+	page_title = page.get('title', '📋 To-Do List')
+	total_items = len(items)
+	embeds = []
+	for i in range(0, max(1, total_items), MAX_ITEMS_PER_EMBED):
+		end = min(i + MAX_ITEMS_PER_EMBED, total_items)
+		is_first_embed = i == 0
+		embeds.append(
+			create_todo_embed(
+				items[i:end],
+				is_first=is_first_embed,
+				total_items=total_items if is_first_embed else None,
+				page_start=i + 1 if not is_first_embed else None,
+				page_end=end if not is_first_embed else None,
+				page_title=page_title if is_first_embed else None,
+				page_number=page_number if is_first_embed else None,
+				total_pages=total_pages if is_first_embed else None,
+			)
+		)
+	return embeds
+
 
 # === Permission helper ===
 def is_mod_or_admin(user) -> bool:
@@ -156,49 +250,37 @@ def is_mod_or_admin(user) -> bool:
 
 # === Navigation View for page switching ===
 class TodoPageNavigationView(discord.ui.View):
-	def __init__(self, bot: commands.Bot, channel_id: int) -> None:
+	def __init__(self, bot: commands.Bot, channel_id: Optional[int] = None) -> None:
 		super().__init__(timeout=None)  # Persistent view
 		self.bot = bot
+		# None for the instance registered with bot.add_view, which serves every channel
 		self.channel_id = channel_id
 		self.message = None  # Will be set after sending
 
-		# Cooldown tracking: {user_id: datetime of last use}
-		self.navigation_cooldowns = {}
-
 	def check_navigation_cooldown(self, user_id: int) -> tuple[bool, int]:
 		"""
-		Check if user is on cooldown for navigation buttons (1 minute).
+		Check if user is on cooldown for navigation buttons.
 		Returns (can_use, cooldown_remaining_seconds).
 		"""
-		import datetime
-
-		if user_id not in self.navigation_cooldowns:
-			return True, 0
-
-		now = datetime.datetime.now(datetime.timezone.utc)
-		last_used = self.navigation_cooldowns[user_id]
-		cooldown_seconds = 60  # 1 minute cooldown
-
-		time_since_last_use = (now - last_used).total_seconds()
-
-		if time_since_last_use < cooldown_seconds:
-			remaining = int(cooldown_seconds - time_since_last_use)
-			return False, remaining
-
+		# Cooldowns live on the cog so they survive the view being re-created on every render
+		remaining = self.bot.get_cog('TodoList').navigation_cooldowns.Remaining(user_id)
+		if remaining > 0:
+			return False, max(1, int(remaining))
 		return True, 0
 
 	def update_navigation_cooldown(self, user_id: int) -> None:
 		"""Update cooldown tracking for a user."""
-		import datetime
+		self.bot.get_cog('TodoList').navigation_cooldowns.Touch(user_id)
 
-		self.navigation_cooldowns[user_id] = datetime.datetime.now(datetime.timezone.utc)
+	def resolve_channel_id(self, interaction: discord.Interaction) -> int:
+		"""Channel whose to-do list this interaction belongs to."""
+		return self.channel_id or interaction.channel_id
 
-	async def update_buttons(self) -> None:
+	def update_buttons(self) -> None:
 		"""Update button states based on current page."""
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-		current_page = channel_data.get('current_page', 0)
-		total_pages = len(channel_data.get('pages', []))
+		repository = get_repository(self.bot)
+		current_page = repository.CurrentPageIndex(self.channel_id)
+		total_pages = len(repository.Pages(self.channel_id))
 
 		# Update Previous button
 		self.previous_button.disabled = current_page <= 0
@@ -215,6 +297,8 @@ class TodoPageNavigationView(discord.ui.View):
 	async def previous_button(
 		self, interaction: discord.Interaction, button: discord.ui.Button
 	) -> None:
+		channel_id = self.resolve_channel_id(interaction)
+
 		# Check cooldown for non-mods/admins
 		if not is_mod_or_admin(interaction.user):
 			can_use, remaining = self.check_navigation_cooldown(interaction.user.id)
@@ -230,21 +314,20 @@ class TodoPageNavigationView(discord.ui.View):
 
 		await interaction.response.defer()
 
-		# Load data and update page
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-		current_page = channel_data.get('current_page', 0)
+		async with get_channel_lock(self.bot, channel_id):
+			# Update page
+			repository = get_repository(self.bot)
+			current_page = repository.CurrentPageIndex(channel_id)
 
-		if current_page > 0:
-			channel_data['current_page'] = current_page - 1
-			save_todo_data(data)
+			if current_page > 0:
+				repository.SetCurrentPage(channel_id, current_page - 1)
 
-			# Update cooldown for non-mods/admins
-			if not is_mod_or_admin(interaction.user):
-				self.update_navigation_cooldown(interaction.user.id)
+				# Update cooldown for non-mods/admins
+				if not is_mod_or_admin(interaction.user):
+					self.update_navigation_cooldown(interaction.user.id)
 
-			# Update the message
-			await self.refresh_display(interaction, data, channel_data)
+				# Update the message
+				await self.refresh_display(interaction)
 
 	@discord.ui.button(
 		label='📄 Page', style=discord.ButtonStyle.primary, custom_id='todo_nav_info', disabled=True
@@ -259,6 +342,8 @@ class TodoPageNavigationView(discord.ui.View):
 	async def next_button(
 		self, interaction: discord.Interaction, button: discord.ui.Button
 	) -> None:
+		channel_id = self.resolve_channel_id(interaction)
+
 		# Check cooldown for non-mods/admins
 		if not is_mod_or_admin(interaction.user):
 			can_use, remaining = self.check_navigation_cooldown(interaction.user.id)
@@ -274,22 +359,21 @@ class TodoPageNavigationView(discord.ui.View):
 
 		await interaction.response.defer()
 
-		# Load data and update page
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-		current_page = channel_data.get('current_page', 0)
-		total_pages = len(channel_data.get('pages', []))
+		async with get_channel_lock(self.bot, channel_id):
+			# Update page
+			repository = get_repository(self.bot)
+			current_page = repository.CurrentPageIndex(channel_id)
+			total_pages = len(repository.Pages(channel_id))
 
-		if current_page < total_pages - 1:
-			channel_data['current_page'] = current_page + 1
-			save_todo_data(data)
+			if current_page < total_pages - 1:
+				repository.SetCurrentPage(channel_id, current_page + 1)
 
-			# Update cooldown for non-mods/admins
-			if not is_mod_or_admin(interaction.user):
-				self.update_navigation_cooldown(interaction.user.id)
+				# Update cooldown for non-mods/admins
+				if not is_mod_or_admin(interaction.user):
+					self.update_navigation_cooldown(interaction.user.id)
 
-			# Update the message
-			await self.refresh_display(interaction, data, channel_data)
+				# Update the message
+				await self.refresh_display(interaction)
 
 	@discord.ui.button(
 		label='Update',
@@ -333,10 +417,10 @@ class TodoPageNavigationView(discord.ui.View):
 			return
 
 		# Show page management menu
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-		current_page_idx = channel_data.get('current_page', 0)
-		pages = channel_data.get('pages', [])
+		channel_id = self.resolve_channel_id(interaction)
+		repository = get_repository(self.bot)
+		current_page_idx = repository.CurrentPageIndex(channel_id)
+		pages = repository.Pages(channel_id)
 
 		# Build description with page list
 		description = 'Manage your todo list pages:\n\n**Available Pages:**\n'
@@ -353,104 +437,16 @@ class TodoPageNavigationView(discord.ui.View):
 		)
 		set_embed_footer(embed, bot=self.bot.user)
 
-		view = TodoPageManagementView(self.bot, self.channel_id)
+		view = TodoPageManagementView(self.bot, channel_id)
 		await interaction.response.send_message(
 			embed=embed, view=view, ephemeral=True, delete_after=60
 		)
 
-	async def refresh_display(
-		self, interaction: discord.Interaction, data: Dict[str, Any], channel_data: Dict[str, Any]
-	) -> None:
+	async def refresh_display(self, interaction: discord.Interaction) -> None:
 		"""Refresh the todo list display for the current page."""
-		current_page_idx = channel_data.get('current_page', 0)
-		pages = channel_data.get('pages', [])
-
-		if 0 <= current_page_idx < len(pages):
-			current_page = pages[current_page_idx]
-			items = current_page.get('items', [])
-			page_title = current_page.get('title', '📋 To-Do List')
-
-			# Get cog reference
-			cog = self.bot.get_cog('TodoList')
-
-			# Delete old messages if exist
-			if channel_data.get('message_ids'):
-				try:
-					channel = self.bot.get_channel(self.channel_id)
-					if channel:
-						for message_id in channel_data['message_ids']:
-							try:
-								old_message = await channel.fetch_message(message_id)
-								await old_message.delete()
-
-								# Remove from persistent views
-								if cog:
-									cog._remove_persistent_view(self.channel_id, message_id)
-							except Exception as e:
-								logger.warning(
-									f'Could not delete old to-do message {message_id}: {e}'
-								)
-				except Exception as e:
-					logger.warning(f'Could not delete old to-do messages: {e}')
-
-			# Split items into multiple embeds if needed (12 items per embed)
-			max_per_embed = 12
-			new_message_ids = []
-			total_items = len(items)
-
-			# Create navigation view (only for last message)
-			nav_view = TodoPageNavigationView(self.bot, self.channel_id)
-			await nav_view.update_buttons()
-
-			channel = interaction.channel
-
-			# Calculate total number of embeds needed
-			num_embeds = (
-				max(1, (total_items + max_per_embed - 1) // max_per_embed) if total_items > 0 else 1
-			)
-
-			# Send messages, splitting items across multiple embeds if needed
-			for embed_idx, i in enumerate(range(0, max(1, total_items), max_per_embed)):
-				end = min(i + max_per_embed, total_items)
-				embed_items = items[i:end] if total_items > 0 else []
-				is_first_embed = embed_idx == 0
-				is_last_embed = embed_idx == num_embeds - 1
-
-				modal = TodoModal(self.bot, channel_id=self.channel_id)
-				embed = modal.create_todo_embed(
-					embed_items,
-					is_first=is_first_embed,
-					total_items=total_items if is_first_embed else None,
-					page_start=i + 1 if not is_first_embed and total_items > 0 else None,
-					page_end=end if not is_first_embed and total_items > 0 else None,
-					page_title=page_title if is_first_embed else None,
-					page_number=current_page_idx + 1 if is_first_embed else None,
-					total_pages=len(pages) if is_first_embed else None,
-				)
-
-				# Only attach navigation view to the last embed
-				if is_last_embed:
-					new_message = await channel.send(embed=embed, view=nav_view)
-					nav_view.message = new_message
-
-					# Save persistent view for last message only
-					if cog:
-						cog._save_persistent_view(self.channel_id, new_message.id)
-				else:
-					new_message = await channel.send(embed=embed)
-
-				new_message_ids.append(new_message.id)
-
-				# Break if no items (empty page)
-				if total_items == 0:
-					break
-
-			# Update channel data with new message info
-			channel_data['message_ids'] = new_message_ids
-			save_todo_data(data)
-
-			# Update self.message to point to the last message
-			self.message = nav_view.message
+		channel_id = self.resolve_channel_id(interaction)
+		cog = self.bot.get_cog('TodoList')
+		await cog.render_todo_messages(channel_id, interaction.channel)
 
 
 # === Page Management View ===
@@ -470,11 +466,9 @@ class TodoPageManagementView(discord.ui.View):
 	async def edit_page_title(
 		self, interaction: discord.Interaction, button: discord.ui.Button
 	) -> None:
-		# Load data
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-		current_page = channel_data.get('current_page', 0)
-		pages = channel_data.get('pages', [])
+		repository = get_repository(self.bot)
+		current_page = repository.CurrentPageIndex(self.channel_id)
+		pages = repository.Pages(self.channel_id)
 
 		if 0 <= current_page < len(pages):
 			current_title = pages[current_page].get('title', '📋 To-Do List')
@@ -485,11 +479,9 @@ class TodoPageManagementView(discord.ui.View):
 	async def delete_page(
 		self, interaction: discord.Interaction, button: discord.ui.Button
 	) -> None:
-		# Load data
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-		pages = channel_data.get('pages', [])
-		current_page = channel_data.get('current_page', 0)
+		repository = get_repository(self.bot)
+		pages = repository.Pages(self.channel_id)
+		current_page = repository.CurrentPageIndex(self.channel_id)
 
 		# Can't delete if only one page
 		if len(pages) <= 1:
@@ -530,24 +522,17 @@ class AddPageModal(discord.ui.Modal, title='➕ Add New Page'):
 		self.channel_id = channel_id
 
 	async def on_submit(self, interaction: discord.Interaction) -> None:
-		# Load data
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-
-		# Add new page
-		new_page = {'title': self.page_title.value.strip(), 'items': []}
-		channel_data['pages'].append(new_page)
-
-		# Switch to new page
-		channel_data['current_page'] = len(channel_data['pages']) - 1
+		await interaction.response.defer()
 
-		# Save data
-		save_todo_data(data)
+		async with get_channel_lock(self.bot, self.channel_id):
+			# Add new page and switch to it
+			new_page = get_repository(self.bot).AddPage(
+				self.channel_id, self.page_title.value.strip()
+			)
 
-		# Update the message
-		modal = TodoModal(self.bot, channel_id=self.channel_id)
-		await interaction.response.defer()
-		await modal.update_todo_message(interaction, data, self.channel_id)
+			# Update the message
+			modal = TodoModal(self.bot, channel_id=self.channel_id)
+			await modal.update_todo_message(interaction, self.channel_id)
 
 		# Send confirmation (followup doesn't support delete_after)
 		await interaction.followup.send(
@@ -576,28 +561,31 @@ class EditPageTitleModal(discord.ui.Modal, title='✏️ Edit Page Title'):
 		self.channel_id = channel_id
 		self.page_index = page_index
 		self.page_title.default = current_title
+		self.revision = get_repository(bot).Revision(channel_id)
 
 	async def on_submit(self, interaction: discord.Interaction) -> None:
-		# Load data
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-		pages = channel_data.get('pages', [])
-
-		if 0 <= self.page_index < len(pages):
-			old_title = pages[self.page_index]['title']
-			pages[self.page_index]['title'] = self.page_title.value.strip()
+		new_title = self.page_title.value.strip()
+		await interaction.response.defer()
 
-			# Save data
-			save_todo_data(data)
+		async with get_channel_lock(self.bot, self.channel_id):
+			repository = get_repository(self.bot)
+			# The page index is stale if pages were added, removed or switched meanwhile
+			if repository.Revision(self.channel_id) != self.revision:
+				await interaction.followup.send(
+					'⚠️ The to-do list changed while you were typing. Please try again.',
+					ephemeral=True,
+				)
+				return
+			old_title = repository.RenamePage(self.channel_id, self.page_index, new_title)
 
-			# Update the message
-			modal = TodoModal(self.bot, channel_id=self.channel_id)
-			await interaction.response.defer()
-			await modal.update_todo_message(interaction, data, self.channel_id)
+			if old_title is not None:
+				# Update the message
+				modal = TodoModal(self.bot, channel_id=self.channel_id)
+				await modal.update_todo_message(interaction, self.channel_id)
 
 			# Send confirmation (followup doesn't support delete_after)
 			await interaction.followup.send(
-				f'✅ Page title updated from **{old_title}** to **{pages[self.page_index]["title"]}**',
+				f'✅ Page title updated from **{old_title}** to **{new_title}**',
 				ephemeral=True,
 			)
 
@@ -611,37 +599,34 @@ class DeletePageConfirmView(discord.ui.View):
 		self.bot = bot
 		self.channel_id = channel_id
 		self.page_index = page_index
+		self.revision = get_repository(bot).Revision(channel_id)
 
 	@discord.ui.button(label='Confirm Delete', style=discord.ButtonStyle.danger, emoji='✅')
 	async def confirm_delete(
 		self, interaction: discord.Interaction, button: discord.ui.Button
 	) -> None:
-		# Load data
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-		pages = channel_data.get('pages', [])
-
-		# Validate
-		if len(pages) <= 1:
-			await interaction.response.send_message(
-				'❌ Cannot delete the last page!', ephemeral=True, delete_after=5
-			)
-			return
-
-		if 0 <= self.page_index < len(pages):
-			deleted_page = pages.pop(self.page_index)
+		await interaction.response.defer()
 
-			# Adjust current page if needed
-			if channel_data['current_page'] >= len(pages):
-				channel_data['current_page'] = len(pages) - 1
+		async with get_channel_lock(self.bot, self.channel_id):
+			repository = get_repository(self.bot)
 
-			# Save data
-			save_todo_data(data)
+			# Validate
+			if repository.Revision(self.channel_id) != self.revision:
+				await interaction.followup.send(
+					'⚠️ The to-do list changed since this was opened. Nothing was deleted.',
+					ephemeral=True,
+				)
+				return
+			if len(repository.Pages(self.channel_id)) <= 1:
+				await interaction.followup.send('❌ Cannot delete the last page!', ephemeral=True)
+				return
 
-			# Update the message
-			modal = TodoModal(self.bot, channel_id=self.channel_id)
-			await interaction.response.defer()
-			await modal.update_todo_message(interaction, data, self.channel_id)
+			# Delete page (current page is adjusted if needed)
+			deleted_page = repository.DeletePage(self.channel_id, self.page_index)
+			if deleted_page is not None:
+				# Update the message
+				modal = TodoModal(self.bot, channel_id=self.channel_id)
+				await modal.update_todo_message(interaction, self.channel_id)
 
 			# Send confirmation
 			deleted_title = deleted_page.get('title', 'Untitled')
@@ -676,12 +661,14 @@ class PrioritySelectView(discord.ui.View):
 		current_priority: Optional[str] = None,
 		current_text: Optional[str] = None,
 		management_message=None,  # Add reference to management message
+		item_id: Optional[int] = None,
 	) -> None:
 		super().__init__(timeout=60)
 		self.bot = bot
 		self.channel_id = channel_id
 		self.action = action
 		self.item_index = item_index
+		self.item_id = item_id
 		self.current_priority = current_priority or 'low'
 		self.current_text = current_text or ''
 		self.management_message = management_message
@@ -711,6 +698,7 @@ class PrioritySelectView(discord.ui.View):
 			default_priority=priority,
 			default_text=self.current_text,
 			management_message=self.management_message,  # Pass through
+			item_id=self.item_id,
 		)
 		await interaction.response.send_modal(modal)
 
@@ -727,6 +715,7 @@ class TodoConfirmView(discord.ui.View):
 		interaction: discord.Interaction,
 		view_message: Optional[discord.Message] = None,
 		management_message=None,  # Add reference to management message
+		item_id: Optional[int] = None,
 	) -> None:
 		super().__init__(timeout=60)
 		self.bot = bot
@@ -735,6 +724,7 @@ class TodoConfirmView(discord.ui.View):
 		self.priority = priority
 		self.action = action
 		self.item_index = item_index
+		self.item_id = item_id
 		self.original_interaction = interaction
 		self.view_message = view_message
 		self.management_message = management_message
@@ -750,56 +740,44 @@ class TodoConfirmView(discord.ui.View):
 			'author_name': interaction.user.display_name,
 		}
 
-		# Load current data
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-
-		# Get current page
-		current_page_idx = channel_data.get('current_page', 0)
-		pages = channel_data.get('pages', [])
-
-		# Validate and auto-correct if needed
-		if not pages:
-			logger.error(f'No pages found in channel {self.channel_id}, creating default page')
-			pages = [{'title': '📋 To-Do List', 'items': []}]
-			channel_data['pages'] = pages
-			current_page_idx = 0
-			channel_data['current_page'] = 0
-		elif current_page_idx >= len(pages):
-			logger.warning(
-				f'Invalid current_page index {current_page_idx} in channel {self.channel_id}, resetting to 0'
-			)
-			current_page_idx = 0
-			channel_data['current_page'] = 0
-
-		current_page = pages[current_page_idx]
+		# Defer the response first since update_todo_message takes time
+		await interaction.response.defer(ephemeral=True)
 
-		if self.action == 'add':
-			current_page['items'].append(new_item)
-			logger.info(
-				f'To-do item added to page {current_page_idx} in channel {self.channel_id} by {interaction.user}'
-			)
-		elif self.action == 'edit' and self.item_index is not None:
-			if 0 <= self.item_index < len(current_page['items']):
-				current_page['items'][self.item_index] = new_item
+		async with get_channel_lock(self.bot, self.channel_id):
+			# Get current page (auto-corrected if out of bounds)
+			repository = get_repository(self.bot)
+			current_page_idx = repository.CurrentPageIndex(self.channel_id)
+			item_index = self.item_index
+
+			# The list may have changed while the AI was formatting: find the item by its ID
+			if self.action == 'edit' and self.item_id is not None:
+				location = repository.FindItem(self.channel_id, self.item_id)
+				if location is None:
+					await interaction.followup.send(
+						'❌ This item was removed in the meantime.', ephemeral=True
+					)
+					return
+				current_page_idx, item_index = location
+
+			if self.action == 'add':
+				repository.AddItem(self.channel_id, current_page_idx, new_item)
 				logger.info(
-					f'To-do item {self.item_index} on page {current_page_idx} in channel '
-					f'{self.channel_id} edited by {interaction.user}'
-				)
-			else:
-				logger.error(
-					f'Invalid item index {self.item_index} for page {current_page_idx} in channel {self.channel_id}'
+					f'To-do item added to page {current_page_idx} in channel {self.channel_id} by {interaction.user}'
 				)
+			elif self.action == 'edit' and item_index is not None:
+				if repository.ReplaceItem(self.channel_id, current_page_idx, item_index, new_item):
+					logger.info(
+						f'To-do item {item_index} on page {current_page_idx} in channel '
+						f'{self.channel_id} edited by {interaction.user}'
+					)
+				else:
+					logger.error(
+						f'Invalid item index {item_index} for page {current_page_idx} in channel {self.channel_id}'
+					)
 
-		# Save data
-		save_todo_data(data)
-
-		# Defer the response first since update_todo_message takes time
-		await interaction.response.defer(ephemeral=True)
-
-		# Update message
-		modal = TodoModal(self.bot, channel_id=self.channel_id)
-		await modal.update_todo_message(self.original_interaction, data, self.channel_id)
+			# Update message
+			modal = TodoModal(self.bot, channel_id=self.channel_id)
+			await modal.update_todo_message(self.original_interaction, self.channel_id)
 
 		# Send confirmation via followup
 		await interaction.followup.send('✅ To-do item added successfully!', ephemeral=True)
@@ -861,16 +839,17 @@ class TodoModal(discord.ui.Modal, title='✏️ Update To-Do List'):
 		default_priority: str = 'low',
 		default_text: str = '',
 		management_message=None,  # Add reference to management message
+		item_id: Optional[int] = None,
 	) -> None:
 		super().__init__()
 		self.bot = bot
 		self.channel_id = channel_id
 		self.action = action
 		self.item_index = item_index
+		self.item_id = item_id
 		self.priority.default = default_priority
 		self.raw_text.default = default_text
 		self.management_message = management_message
-		openai.api_key = os.getenv('OPENAI_API_KEY')
 
 	async def on_submit(self, interaction: discord.Interaction) -> None:
 		# Priority is pre-selected, but validate just in case
@@ -921,6 +900,7 @@ class TodoModal(discord.ui.Modal, title='✏️ Update To-Do List'):
 				self.item_index,
 				interaction,
 				management_message=self.management_message,  # Pass through
+				item_id=self.item_id,
 			)
 			if view is None:
 				logger.error(
@@ -941,275 +921,13 @@ class TodoModal(discord.ui.Modal, title='✏️ Update To-Do List'):
 			)
 
 	async def format_task_with_ai(self, raw_text: str, priority: str) -> Dict[str, str]:
-		"""Use OpenAI to format the task with emojis and proper structure."""
-		if not openai.api_key:
-			raise ValueError('OpenAI API key not configured.')
-
-		prompt = f"""
-Format this to-do item for a Discord bot's to-do list. Return ONLY valid JSON with this structure:
-{{
-    "title": "Short catchy title with relevant emoji (max 80 chars)",
-    "description": "2-3 lines explaining the task clearly"
-}}
-
-Priority level: {priority}
-Raw task: {raw_text}
-
-Rules:
-- Title must start with a relevant emoji (e.g., 🎮 for gaming, 📝 for documentation, 🔧 for fixes)
-- Title should be concise and action-oriented
-- Description should be clear and specific (2-3 short sentences)
-- Use professional but friendly tone
-- NO markdown formatting in the JSON values themselves
-- Return ONLY the JSON, nothing else
-- Return in english
-"""
-
-		response = openai.chat.completions.create(
-			model='gpt-4.1-nano',
-			messages=[{'role': 'user', 'content': prompt}],
-			max_tokens=200,
-			temperature=0.7,
-		)
-
-		result = response.choices[0].message.content.strip()
-		# Remove code block markers if present
-		if result.startswith('```json'):
-			result = result[7:]
-		if result.startswith('```'):
-			result = result[3:]
-		if result.endswith('```'):
-			result = result[:-3]
-
-		formatted = json.loads(result.strip())
-		return formatted
+		"""Use OpenAI to format the task with emojis and proper structure (falls back offline)."""
+		return await self.bot.get_cog('TodoList').task_formatter.Format(raw_text, priority)
 
-	async def update_todo_message(
-		self, interaction: discord.Interaction, data: Dict[str, Any], channel_id: int
-	) -> None:
+	async def update_todo_message(self, interaction: discord.Interaction, channel_id: int) -> None:
 		"""Update or create the to-do list message in the channel."""
-		channel_data = await get_channel_data(data, channel_id)
-		current_page_idx = channel_data.get('current_page', 0)
-		pages = channel_data.get('pages', [])
-
-		# Validate and auto-correct current_page if out of bounds
-		if not pages:
-			logger.error(f'No pages found in channel {channel_id}, creating default page')
-			pages = [{'title': '📋 To-Do List', 'items': []}]
-			channel_data['pages'] = pages
-			current_page_idx = 0
-			channel_data['current_page'] = 0
-			save_todo_data(data)
-		elif current_page_idx >= len(pages):
-			logger.warning(
-				f'Invalid current_page index {current_page_idx} in channel {channel_id}, resetting to 0'
-			)
-			current_page_idx = 0
-			channel_data['current_page'] = 0
-			save_todo_data(data)
-
-		# Get current page items
-		current_page = pages[current_page_idx]
-		items = current_page.get('items', [])
-		page_title = current_page.get('title', '📋 To-Do List')
-
-		# Get cog reference
 		cog = self.bot.get_cog('TodoList')
-
-		# Delete old messages if exist
-		if channel_data.get('message_ids'):
-			try:
-				channel = self.bot.get_channel(channel_id)
-				if channel:
-					for message_id in channel_data['message_ids']:
-						try:
-							old_message = await channel.fetch_message(message_id)
-							await old_message.delete()
-							logger.info(
-								f'Deleted old to-do message {message_id} in channel {channel_id}'
-							)
-
-							# Remove from persistent views
-							if cog:
-								cog._remove_persistent_view(channel_id, message_id)
-						except Exception as e:
-							logger.warning(f'Could not delete old to-do message {message_id}: {e}')
-			except Exception as e:
-				logger.warning(f'Could not delete old to-do messages: {e}')
-
-		# Split items into multiple embeds if needed (12 items per embed)
-		max_per_embed = 12
-		new_message_ids = []
-		total_items = len(items)
-
-		# Create navigation view (only for last message)
-		nav_view = TodoPageNavigationView(self.bot, channel_id)
-		await nav_view.update_buttons()
-
-		channel = interaction.channel
-
-		# Calculate total number of embeds needed
-		num_embeds = (
-			max(1, (total_items + max_per_embed - 1) // max_per_embed) if total_items > 0 else 1
-		)
-
-		# Send messages, splitting items across multiple embeds if needed
-		for embed_idx, i in enumerate(range(0, max(1, total_items), max_per_embed)):
-			end = min(i + max_per_embed, total_items)
-			embed_items = items[i:end] if total_items > 0 else []
-			is_first_embed = embed_idx == 0
-			is_last_embed = embed_idx == num_embeds - 1
-
-			embed = self.create_todo_embed(
-				embed_items,
-				is_first=is_first_embed,
-				total_items=total_items if is_first_embed else None,
-				page_start=i + 1 if not is_first_embed and total_items > 0 else None,
-				page_end=end if not is_first_embed and total_items > 0 else None,
-				page_title=page_title if is_first_embed else None,
-				page_number=current_page_idx + 1 if is_first_embed else None,
-				total_pages=len(pages) if is_first_embed else None,
-			)
-
-			# Only attach navigation view to the last embed
-			if is_last_embed:
-				new_message = await channel.send(embed=embed, view=nav_view)
-				nav_view.message = new_message
-
-				# Save persistent view for last message only
-				if cog:
-					cog._save_persistent_view(channel_id, new_message.id)
-			else:
-				new_message = await channel.send(embed=embed)
-
-			new_message_ids.append(new_message.id)
-
-			# Break if no items (empty page)
-			if total_items == 0:
-				break
-
-		# Update channel data with new message info
-		channel_data['message_ids'] = new_message_ids
-		save_todo_data(data)
-
-		logger.info(f'Posted {len(new_message_ids)} to-do message(s) in channel {channel_id}')
-
-	def create_todo_embed(
-		self,
-		items: List[Dict[str, Any]],
-		is_first: bool = True,
-		total_items: Optional[int] = None,
-		page_start: Optional[int] = None,
-		page_end: Optional[int] = None,
-		page_title: Optional[str] = None,
-		page_number: Optional[int] = None,
-		total_pages: Optional[int] = None,
-	) -> discord.Embed:
-		"""Create a formatted to-do list embed."""
-		embed = discord.Embed(color=EMBED_COLOR)
-
-		# Use page title if provided, otherwise use default
-		if page_title:
-			# Add page counter if multiple pages exist
-			if total_pages and total_pages > 1:
-				embed.title = f'{page_title} (Page {page_number}/{total_pages})'
-			else:
-				embed.title = page_title
-		elif not is_first and page_start and page_end:
-			embed.title = f'📋 To-Do List (Continued - Items {page_start}-{page_end})'
-		else:
-			embed.title = '📋 To-Do List'
-
-		# Group items by priority
-		high_priority = [item for item in items if item['priority'] == 'high']
-		medium_priority = [item for item in items if item['priority'] == 'medium']
-		low_priority = [item for item in items if item['priority'] == 'low']
-
-		# Build description
-		description_parts = []
-
-		# Add high priority items
-		if high_priority:
-			description_parts.append(f'\n{PRIORITY_EMOJIS["high"]} **High Priority**')
-			for i, item in enumerate(high_priority):
-				description_parts.append(f'{item["title"]}')
-				if item.get('description'):
-					description_parts.append(f'{item["description"]}')
-				description_parts.append(f'👤 *Added by {item.get("author_name", "Unknown")}*')
-				# Add assignment info
-				assigned_to = item.get('assigned_to_name')
-				if assigned_to:
-					assigned_by = item.get('assigned_by_name')
-					if assigned_by:
-						# Admin assigned
-						description_parts.append(f'📌 *Assigned to {assigned_to} by {assigned_by}*')
-					else:
-						# Self-claimed
-						description_parts.append(f'🙋 *Claimed by {assigned_to}*')
-				description_parts.append('')  # Empty line
-
-		# Add medium priority items
-		if medium_priority:
-			description_parts.append(f'\n{PRIORITY_EMOJIS["medium"]} **Medium Priority**')
-			for i, item in enumerate(medium_priority):
-				description_parts.append(f'{item["title"]}')
-				if item.get('description'):
-					description_parts.append(f'{item["description"]}')
-				description_parts.append(f'👤 *Added by {item.get("author_name", "Unknown")}*')
-				# Add assignment info
-				assigned_to = item.get('assigned_to_name')
-				if assigned_to:
-					assigned_by = item.get('assigned_by_name')
-					if assigned_by:
-						# Admin assigned
-						description_parts.append(f'📌 *Assigned to {assigned_to} by {assigned_by}*')
-					else:
-						# Self-claimed
-						description_parts.append(f'🙋 *Claimed by {assigned_to}*')
-				description_parts.append('')  # Empty line
-
-		# Add low priority items
-		if low_priority:
-			description_parts.append(f'\n{PRIORITY_EMOJIS["low"]} **Low Priority**')
-			for i, item in enumerate(low_priority):
-				description_parts.append(f'{item["title"]}')
-				if item.get('description'):
-					description_parts.append(f'{item["description"]}')
-				description_parts.append(f'👤 *Added by {item.get("author_name", "Unknown")}*')
-				# Add assignment info
-				assigned_to = item.get('assigned_to_name')
-				if assigned_to:
-					assigned_by = item.get('assigned_by_name')
-					if assigned_by:
-						# Admin assigned
-						description_parts.append(f'📌 *Assigned to {assigned_to} by {assigned_by}*')
-					else:
-						# Self-claimed
-						description_parts.append(f'🙋 *Claimed by {assigned_to}*')
-				description_parts.append('')  # Empty line
-
-		if not items:
-			description_parts.append('No items yet! Use `/todo-update` to add one.')
-
-		description_parts.append('\n🚀 Stay tuned for updates!')
-
-		# Join
-		full_description = '\n'.join(description_parts)
-
-		# For first embed, check if needs truncation
-		if is_first and total_items and total_items > len(items):
-			shown = len(items)
-			total = total_items
-			embed.description = (
-				full_description + '\n\n⚠️ **List truncated due to length.**\n'
-				f'Showing first {shown} items.\n'
-				f'Total items: {total}'
-			)
-		else:
-			embed.description = full_description
-
-		set_embed_footer(embed, bot=self.bot.user)
-		return embed
+		await cog.render_todo_messages(channel_id, interaction.channel)
 
 
 # === View for managing to-do list ===
@@ -1256,11 +974,9 @@ class TodoManageView(discord.ui.View):
 			)
 			return
 
-		# Load data
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-		current_page_idx = channel_data.get('current_page', 0)
-		pages = channel_data.get('pages', [])
+		repository = get_repository(self.bot)
+		current_page_idx = repository.CurrentPageIndex(self.channel_id)
+		pages = repository.Pages(self.channel_id)
 
 		if 0 <= current_page_idx < len(pages):
 			current_page = pages[current_page_idx]
@@ -1299,11 +1015,9 @@ class TodoManageView(discord.ui.View):
 			)
 			return
 
-		# Load data
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-		current_page_idx = channel_data.get('current_page', 0)
-		pages = channel_data.get('pages', [])
+		repository = get_repository(self.bot)
+		current_page_idx = repository.CurrentPageIndex(self.channel_id)
+		pages = repository.Pages(self.channel_id)
 
 		if 0 <= current_page_idx < len(pages):
 			current_page = pages[current_page_idx]
@@ -1352,21 +1066,18 @@ class TodoManageView(discord.ui.View):
 		await interaction.response.defer()
 
 		try:
-			# Load data
-			data = await load_todo_data()
-			channel_data = await get_channel_data(data, self.channel_id)
-			current_page_idx = channel_data.get('current_page', 0)
-			pages = channel_data.get('pages', [])
-
-			# Clear all items on current page
-			if 0 <= current_page_idx < len(pages):
-				pages[current_page_idx]['items'] = []
-				save_todo_data(data)
-
-				# Update message
-				modal = TodoModal(self.bot, channel_id=self.channel_id)
-				await modal.update_todo_message(interaction, data, self.channel_id)
-
+			async with get_channel_lock(self.bot, self.channel_id):
+				repository = get_repository(self.bot)
+				current_page_idx = repository.CurrentPageIndex(self.channel_id)
+
+				# Clear all items on current page
+				cleared = repository.ClearPage(self.channel_id, current_page_idx)
+				if cleared:
+					# Update message
+					modal = TodoModal(self.bot, channel_id=self.channel_id)
+					await modal.update_todo_message(interaction, self.channel_id)
+
+			if cleared:
 				logger.info(
 					f'All to-do items cleared on page {current_page_idx} in channel '
 					f'{self.channel_id} by {interaction.user}'
@@ -1400,11 +1111,9 @@ class TodoManageView(discord.ui.View):
 			)
 			return
 
-		# Load data
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-		current_page_idx = channel_data.get('current_page', 0)
-		pages = channel_data.get('pages', [])
+		repository = get_repository(self.bot)
+		current_page_idx = repository.CurrentPageIndex(self.channel_id)
+		pages = repository.Pages(self.channel_id)
 
 		if 0 <= current_page_idx < len(pages):
 			items = pages[current_page_idx].get('items', [])
@@ -1438,11 +1147,9 @@ class TodoManageView(discord.ui.View):
 			)
 			return
 
-		# Load data
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-		current_page_idx = channel_data.get('current_page', 0)
-		pages = channel_data.get('pages', [])
+		repository = get_repository(self.bot)
+		current_page_idx = repository.CurrentPageIndex(self.channel_id)
+		pages = repository.Pages(self.channel_id)
 
 		if 0 <= current_page_idx < len(pages):
 			items = pages[current_page_idx].get('items', [])
@@ -1482,11 +1189,9 @@ class TodoManageView(discord.ui.View):
 			)
 			return
 
-		# Load data
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-		current_page_idx = channel_data.get('current_page', 0)
-		pages = channel_data.get('pages', [])
+		repository = get_repository(self.bot)
+		current_page_idx = repository.CurrentPageIndex(self.channel_id)
+		pages = repository.Pages(self.channel_id)
 
 		if 0 <= current_page_idx < len(pages):
 			items = pages[current_page_idx].get('items', [])
@@ -1518,6 +1223,85 @@ class TodoManageView(discord.ui.View):
 				embed=embed, view=view, ephemeral=True, delete_after=60
 			)
 
+	@discord.ui.button(label='Bulk Add', style=discord.ButtonStyle.green, emoji='📥', row=3)
+	async def bulk_add(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
+		"""Add several items at once from a pasted list (Admin/Mod only)."""
+		if not is_mod_or_admin(interaction.user):
+			await interaction.response.send_message(
+				'❌ You do not have permission to use this.',
+				ephemeral=True,
+				delete_after=10,
+			)
+			return
+
+		await interaction.response.send_modal(TodoBulkAddModal(self.bot, self.channel_id))
+
+	@discord.ui.button(label='Bulk Priority', style=discord.ButtonStyle.primary, emoji='🎚️', row=3)
+	async def bulk_priority(
+		self, interaction: discord.Interaction, button: discord.ui.Button
+	) -> None:
+		"""Change the priority of several items at once (Admin/Mod only)."""
+		if not is_mod_or_admin(interaction.user):
+			await interaction.response.send_message(
+				'❌ You do not have permission to use this.',
+				ephemeral=True,
+				delete_after=10,
+			)
+			return
+
+		_, items = current_page_items(self.bot, self.channel_id)
+		if not items:
+			await interaction.response.send_message(
+				'❌ No items on current page!', ephemeral=True, delete_after=10
+			)
+			return
+
+		embed = discord.Embed(
+			title='🎚️ Bulk Priority Change',
+			description='Select the items, then pick their new priority:',
+			color=EMBED_COLOR,
+		)
+		set_embed_footer(embed, bot=self.bot.user)
+		await interaction.response.send_message(
+			embed=embed,
+			view=TodoBulkPriorityView(self.bot, self.channel_id, items),
+			ephemeral=True,
+			delete_after=60,
+		)
+
+	@discord.ui.button(label='Bulk Reassign', style=discord.ButtonStyle.primary, emoji='👥', row=3)
+	async def bulk_reassign(
+		self, interaction: discord.Interaction, button: discord.ui.Button
+	) -> None:
+		"""Assign several items to one user at once (Admin/Mod only)."""
+		if not is_mod_or_admin(interaction.user):
+			await interaction.response.send_message(
+				'❌ You do not have permission to use this.',
+				ephemeral=True,
+				delete_after=10,
+			)
+			return
+
+		_, items = current_page_items(self.bot, self.channel_id)
+		if not items:
+			await interaction.response.send_message(
+				'❌ No items on current page!', ephemeral=True, delete_after=10
+			)
+			return
+
+		embed = discord.Embed(
+			title='👥 Bulk Reassign',
+			description='Select the items, then pick the user to assign them to:',
+			color=EMBED_COLOR,
+		)
+		set_embed_footer(embed, bot=self.bot.user)
+		await interaction.response.send_message(
+			embed=embed,
+			view=TodoBulkAssignView(self.bot, self.channel_id, items),
+			ephemeral=True,
+			delete_after=60,
+		)
+
 
 # === Select views for task assignment ===
 class TodoAssignSelectView(discord.ui.View):
@@ -1531,6 +1315,7 @@ class TodoAssignSelectView(discord.ui.View):
 		self.channel_id = channel_id
 		self.items = items
 		self.page_idx = page_idx
+		self.revision = get_repository(bot).Revision(channel_id)
 
 		# Create select menu
 		options = []
@@ -1562,8 +1347,17 @@ class TodoAssignSelectView(discord.ui.View):
 		select.callback = self.select_callback
 		self.add_item(select)
 
+	def rebuild(self) -> Optional['TodoAssignSelectView']:
+		"""A fresh copy of this menu for the current page, or None if it has no items."""
+		page_idx, items = current_page_items(self.bot, self.channel_id)
+		return TodoAssignSelectView(self.bot, self.channel_id, items, page_idx) if items else None
+
 	async def select_callback(self, interaction: discord.Interaction) -> None:
 		"""Handle task selection."""
+		if get_repository(self.bot).Revision(self.channel_id) != self.revision:
+			await refresh_stale_select(interaction, self.rebuild())
+			return
+
 		item_idx = int(interaction.data['values'][0])
 		item = self.items[item_idx]
 
@@ -1624,8 +1418,6 @@ class UserSelectView(discord.ui.View):
 
 	async def user_selected(self, interaction: discord.Interaction) -> None:
 		"""Handle user selection and perform assignment."""
-		from datetime import datetime, timezone
-
 		selected_user = interaction.data['values'][0]
 
 		# Resolve user
@@ -1643,34 +1435,36 @@ class UserSelectView(discord.ui.View):
 
 		await interaction.response.defer(ephemeral=True)
 
-		# Load data
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-		item = channel_data['pages'][self.page_idx]['items'][self.item_idx]
-
-		# Check if already assigned to this user
-		if item.get('assigned_to_id') == user.id:
-			await interaction.followup.send(
-				f'❌ Task is already assigned to {user.display_name}!', ephemeral=True
-			)
-			return
+		async with get_channel_lock(self.bot, self.channel_id):
+			# The list may have changed while picking a user: find the task by its ID
+			repository = get_repository(self.bot)
+			location = repository.FindItem(self.channel_id, self.item.get('id'))
+			if location is None:
+				await interaction.followup.send(
+					'❌ This task was removed in the meantime.', ephemeral=True
+				)
+				return
+			self.page_idx, self.item_idx = location
+			item = repository.Items(self.channel_id, self.page_idx)[self.item_idx]
 
-		# Store old assignee for logging
-		old_assignee = item.get('assigned_to_name')
+			# Check if already assigned to this user
+			if item.get('assigned_to_id') == user.id:
+				await interaction.followup.send(
+					f'❌ Task is already assigned to {user.display_name}!', ephemeral=True
+				)
+				return
 
-		# Assign task
-		item['assigned_to_id'] = user.id
-		item['assigned_to_name'] = user.display_name
-		item['assigned_by_id'] = self.assigner.id
-		item['assigned_by_name'] = self.assigner.display_name
-		item['assigned_at'] = datetime.now(timezone.utc).isoformat()
+			# Store old assignee for logging
+			old_assignee = item.get('assigned_to_name')
 
-		# Save
-		save_todo_data(data)
+			# Assign task
+			repository.AssignItem(
+				self.channel_id, self.page_idx, self.item_idx, user, self.assigner
+			)
 
-		# Update main todo display
-		modal = TodoModal(self.bot, channel_id=self.channel_id)
-		await modal.update_todo_message(interaction, data, self.channel_id)
+			# Update main todo display
+			modal = TodoModal(self.bot, channel_id=self.channel_id)
+			await modal.update_todo_message(interaction, self.channel_id)
 
 		# Log
 		if old_assignee:
@@ -1715,6 +1509,7 @@ class TodoClaimSelectView(discord.ui.View):
 		self.items = items
 		self.page_idx = page_idx
 		self.claimer = claimer
+		self.revision = get_repository(bot).Revision(channel_id)
 
 		# Create select menu
 		options = []
@@ -1746,40 +1541,41 @@ class TodoClaimSelectView(discord.ui.View):
 		select.callback = self.select_callback
 		self.add_item(select)
 
+	def rebuild(self) -> Optional['TodoClaimSelectView']:
+		"""A fresh copy of this menu for the current page, or None if it has no items."""
+		page_idx, items = current_page_items(self.bot, self.channel_id)
+		if not items:
+			return None
+		return TodoClaimSelectView(self.bot, self.channel_id, items, page_idx, self.claimer)
+
 	async def select_callback(self, interaction: discord.Interaction) -> None:
 		"""Handle task claim."""
-		from datetime import datetime, timezone
-
 		item_idx = int(interaction.data['values'][0])
 
 		await interaction.response.defer(ephemeral=True)
 
-		# Load data
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-		item = channel_data['pages'][self.page_idx]['items'][item_idx]
+		async with get_channel_lock(self.bot, self.channel_id):
+			repository = get_repository(self.bot)
+			if repository.Revision(self.channel_id) != self.revision:
+				await refresh_stale_select(interaction, self.rebuild())
+				return
 
-		# Check if already assigned to this user
-		if item.get('assigned_to_id') == self.claimer.id:
-			await interaction.followup.send('❌ You already claimed this task!', ephemeral=True)
-			return
+			item = repository.Items(self.channel_id, self.page_idx)[item_idx]
 
-		# Store old assignee for logging (if reassigning)
-		old_assignee = item.get('assigned_to_name')
+			# Check if already assigned to this user
+			if item.get('assigned_to_id') == self.claimer.id:
+				await interaction.followup.send('❌ You already claimed this task!', ephemeral=True)
+				return
 
-		# Claim task (self-assignment, no assigned_by)
-		item['assigned_to_id'] = self.claimer.id
-		item['assigned_to_name'] = self.claimer.display_name
-		item['assigned_by_id'] = None  # Self-claim
-		item['assigned_by_name'] = None
-		item['assigned_at'] = datetime.now(timezone.utc).isoformat()
+			# Store old assignee for logging (if reassigning)
+			old_assignee = item.get('assigned_to_name')
 
-		# Save
-		save_todo_data(data)
+			# Claim task (self-assignment, no assigned_by)
+			repository.AssignItem(self.channel_id, self.page_idx, item_idx, self.claimer)
 
-		# Update display
-		modal = TodoModal(self.bot, channel_id=self.channel_id)
-		await modal.update_todo_message(interaction, data, self.channel_id)
+			# Update display
+			modal = TodoModal(self.bot, channel_id=self.channel_id)
+			await modal.update_todo_message(interaction, self.channel_id)
 
 		# Log
 		if old_assignee:
@@ -1817,6 +1613,7 @@ class TodoUnassignSelectView(discord.ui.View):
 		self.channel_id = channel_id
 		self.assigned_items = assigned_items
 		self.page_idx = page_idx
+		self.revision = get_repository(bot).Revision(channel_id)
 
 		# Create select menu
 		options = []
@@ -1842,33 +1639,39 @@ class TodoUnassignSelectView(discord.ui.View):
 		select.callback = self.select_callback
 		self.add_item(select)
 
+	def rebuild(self) -> Optional['TodoUnassignSelectView']:
+		"""A fresh copy of this menu for the current page, or None if nothing is assigned."""
+		page_idx, items = current_page_items(self.bot, self.channel_id)
+		assigned_items = [
+			(idx, item) for idx, item in enumerate(items) if item.get('assigned_to_id') is not None
+		]
+		if not assigned_items:
+			return None
+		return TodoUnassignSelectView(self.bot, self.channel_id, assigned_items, page_idx)
+
 	async def select_callback(self, interaction: discord.Interaction) -> None:
 		"""Handle unassignment."""
 		item_idx = int(interaction.data['values'][0])
 
 		await interaction.response.defer(ephemeral=True)
 
-		# Load data
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-		item = channel_data['pages'][self.page_idx]['items'][item_idx]
+		async with get_channel_lock(self.bot, self.channel_id):
+			repository = get_repository(self.bot)
+			if repository.Revision(self.channel_id) != self.revision:
+				await refresh_stale_select(interaction, self.rebuild())
+				return
 
-		# Store info for logging
-		old_assignee = item.get('assigned_to_name', 'Unknown')
+			item = repository.Items(self.channel_id, self.page_idx)[item_idx]
 
-		# Remove assignment
-		item['assigned_to_id'] = None
-		item['assigned_to_name'] = None
-		item['assigned_by_id'] = None
-		item['assigned_by_name'] = None
-		item['assigned_at'] = None
+			# Store info for logging
+			old_assignee = item.get('assigned_to_name', 'Unknown')
 
-		# Save
-		save_todo_data(data)
+			# Remove assignment
+			repository.UnassignItem(self.channel_id, self.page_idx, item_idx)
 
-		# Update display
-		modal = TodoModal(self.bot, channel_id=self.channel_id)
-		await modal.update_todo_message(interaction, data, self.channel_id)
+			# Update display
+			modal = TodoModal(self.bot, channel_id=self.channel_id)
+			await modal.update_todo_message(interaction, self.channel_id)
 
 		# Log
 		logger.info(
@@ -1891,6 +1694,7 @@ class TodoEditSelectView(discord.ui.View):
 		self.bot = bot
 		self.channel_id = channel_id
 		self.items = items
+		self.revision = get_repository(bot).Revision(channel_id)
 
 		# Create select menu options
 		options = []
@@ -1920,7 +1724,16 @@ class TodoEditSelectView(discord.ui.View):
 		self.select.callback = self.select_callback
 		self.add_item(self.select)
 
+	def rebuild(self) -> Optional['TodoEditSelectView']:
+		"""A fresh copy of this menu for the current page, or None if it has no items."""
+		_, items = current_page_items(self.bot, self.channel_id)
+		return TodoEditSelectView(self.bot, self.channel_id, items) if items else None
+
 	async def select_callback(self, interaction: discord.Interaction) -> None:
+		if get_repository(self.bot).Revision(self.channel_id) != self.revision:
+			await refresh_stale_select(interaction, self.rebuild())
+			return
+
 		index = int(self.select.values[0])
 		if 0 <= index < len(self.items):
 			item = self.items[index]
@@ -1942,6 +1755,7 @@ class TodoEditSelectView(discord.ui.View):
 				item_index=index,
 				current_priority=current_priority,
 				current_text=current_text,
+				item_id=item.get('id'),
 			)
 			await interaction.response.send_message(
 				embed=embed, view=view, ephemeral=True, delete_after=30
@@ -1955,6 +1769,7 @@ class TodoRemoveSelectView(discord.ui.View):
 		self.bot = bot
 		self.channel_id = channel_id
 		self.items = items
+		self.revision = get_repository(bot).Revision(channel_id)
 
 		# Create select menu options
 		options = []
@@ -1985,33 +1800,32 @@ class TodoRemoveSelectView(discord.ui.View):
 		self.select.callback = self.select_callback
 		self.add_item(self.select)
 
-	async def select_callback(self, interaction: discord.Interaction) -> None:
-		# Get selected indices (sorted in reverse to remove from end first)
-		indices = sorted([int(val) for val in self.select.values], reverse=True)
+	def rebuild(self) -> Optional['TodoRemoveSelectView']:
+		"""A fresh copy of this menu for the current page, or None if it has no items."""
+		_, items = current_page_items(self.bot, self.channel_id)
+		return TodoRemoveSelectView(self.bot, self.channel_id, items) if items else None
 
-		# Load current data
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, self.channel_id)
-		current_page_idx = channel_data.get('current_page', 0)
-		pages = channel_data.get('pages', [])
-		removed_items = []
+	async def select_callback(self, interaction: discord.Interaction) -> None:
+		indices = [int(val) for val in self.select.values]
+		await interaction.response.defer()
 
-		# Remove selected items from current page (from end to start to avoid index issues)
-		if 0 <= current_page_idx < len(pages):
-			current_page = pages[current_page_idx]
-			for index in indices:
-				if 0 <= index < len(current_page['items']):
-					removed_items.append(current_page['items'].pop(index))
+		async with get_channel_lock(self.bot, self.channel_id):
+			# Indices baked into the options are only valid for the revision they were built from
+			repository = get_repository(self.bot)
+			if repository.Revision(self.channel_id) != self.revision:
+				await refresh_stale_select(interaction, self.rebuild())
+				return
 
-		save_todo_data(data)
+			# Remove selected items from current page
+			current_page_idx = repository.CurrentPageIndex(self.channel_id)
+			removed_items = repository.RemoveItems(self.channel_id, current_page_idx, indices)
 
-		# Update message
-		modal = TodoModal(self.bot, channel_id=self.channel_id)
-		await interaction.response.defer()
-		await modal.update_todo_message(interaction, data, self.channel_id)
+			# Update message
+			modal = TodoModal(self.bot, channel_id=self.channel_id)
+			await modal.update_todo_message(interaction, self.channel_id)
 
 		# Log removed items
-		removed_titles = ', '.join([f"'{item['title']}'" for item in reversed(removed_items)])
+		removed_titles = ', '.join([f"'{item['title']}'" for item in removed_items])
 		logger.info(
 			f'Removed {len(removed_items)} to-do item(s) from page {current_page_idx} in channel {self.channel_id}: '
 			f'{removed_titles} by {interaction.user}'
@@ -2030,134 +1844,402 @@ class TodoRemoveSelectView(discord.ui.View):
 			pass
 
 
-class TodoList(commands.Cog):
-	"""
-	📋 To-Do List Cog: Manage a dynamic server to-do list with AI-style formatting.
-	"""
+# === Bulk operations ===
+# Every bulk action applies all of its changes under the channel lock with one repository
+# call, so a single render and a single (debounced) flush cover the whole batch
+class TodoBulkAddModal(discord.ui.Modal, title='📥 Bulk Add Items'):
+	default_priority = discord.ui.TextInput(
+		label='Default priority (high, medium or low)',
+		default='low',
+		max_length=6,
+	)
+	tasks = discord.ui.TextInput(
+		label='Tasks (one per line)',
+		style=discord.TextStyle.paragraph,
+		placeholder='Fix the welcome message\nhigh: Update the server rules\nlow: Add more emojis',
+		max_length=4000,
+	)
 
-	def __init__(self, bot: commands.Bot) -> None:
+	def __init__(self, bot: commands.Bot, channel_id: int) -> None:
+		super().__init__()
 		self.bot = bot
-		self.persistent_views_file = TODO_PERSISTENT_VIEWS_FILE
-		self.persistent_views_data = []
+		self.channel_id = channel_id
 
-		# Load persistent views data silently (logging happens in restore)
-		if os.path.exists(self.persistent_views_file):
-			try:
-				with open(self.persistent_views_file, 'r', encoding='utf-8') as f:
-					self.persistent_views_data = json.load(f)
-			except Exception as e:
-				logger.error(f'Failed to load persistent views data: {e}')
-				self.persistent_views_data = []
-		else:
-			# Only create directory if there is one (not for root-level files)
-			dir_path = os.path.dirname(self.persistent_views_file)
-			if dir_path:
-				os.makedirs(dir_path, exist_ok=True)
-			self.persistent_views_data = []
+	async def on_submit(self, interaction: discord.Interaction) -> None:
+		default_priority = self.default_priority.value.lower().strip()
+		if default_priority not in ['high', 'medium', 'low']:
+			await interaction.response.send_message(
+				'❌ Invalid priority! Use high, medium or low.', ephemeral=True, delete_after=10
+			)
+			return
 
-	async def cog_load(self) -> None:
-		"""Called when the cog is loaded (including reloads)."""
-		if self.bot.is_ready():
-			await self._restore_persistent_views()
+		tasks = parse_bulk_lines(self.tasks.value, default_priority)
+		if not tasks:
+			await interaction.response.send_message(
+				'❌ No tasks found in the list!', ephemeral=True, delete_after=10
+			)
+			return
+		if len(tasks) > TodoBulkAddLimit:
+			await interaction.response.send_message(
+				f'❌ Too many tasks! Add at most {TodoBulkAddLimit} at a time.',
+				ephemeral=True,
+				delete_after=10,
+			)
+			return
 
-	@commands.Cog.listener()
-	async def on_ready(self) -> None:
-		"""Restore persistent views when the bot is ready."""
-		await self._restore_persistent_views()
+		await interaction.response.defer(ephemeral=True)
 
-	async def _restore_persistent_views(self) -> None:
-		"""Restore persistent navigation views for all todo messages."""
-		restored_count = 0
-		cleaned_data = []
+		# Format every line concurrently (the formatter bounds how many requests run at once)
+		formatter = self.bot.get_cog('TodoList').task_formatter
+		formatted = await asyncio.gather(
+			*(formatter.Format(raw_text, priority) for raw_text, priority in tasks)
+		)
+		new_items = [
+			{
+				'priority': priority,
+				'title': task['title'],
+				'description': task['description'],
+				'author_id': interaction.user.id,
+				'author_name': interaction.user.display_name,
+			}
+			for (_, priority), task in zip(tasks, formatted)
+		]
 
-		for view_data in self.persistent_views_data:
-			channel_id = view_data.get('channel_id')
-			message_id = view_data.get('message_id')
+		async with get_channel_lock(self.bot, self.channel_id):
+			repository = get_repository(self.bot)
+			current_page_idx = repository.CurrentPageIndex(self.channel_id)
+			repository.AddItems(self.channel_id, current_page_idx, new_items)
 
-			if not channel_id or not message_id:
-				continue
+			await self.bot.get_cog('TodoList').render_todo_messages(
+				self.channel_id, interaction.channel
+			)
 
-			channel = self.bot.get_channel(channel_id)
-			if not channel:
-				logger.warning(f'Channel {channel_id} not found, skipping view restoration')
-				continue
+		logger.info(
+			f'{len(new_items)} to-do items bulk-added to page {current_page_idx} in channel '
+			f'{self.channel_id} by {interaction.user}'
+		)
+		await interaction.followup.send(f'✅ Added {len(new_items)} item(s)!', ephemeral=True)
 
-			try:
-				message = await channel.fetch_message(message_id)
 
-				# Create and attach the view
-				view = TodoPageNavigationView(self.bot, channel_id)
-				await view.update_buttons()
-				view.message = message
+class TodoBulkPriorityView(discord.ui.View):
+	"""Multi-select of items plus one button per priority."""
 
-				# Edit message to re-attach the view
-				await message.edit(view=view)
+	def __init__(self, bot: commands.Bot, channel_id: int, items: List[Dict[str, Any]]) -> None:
+		super().__init__(timeout=60)
+		self.bot = bot
+		self.channel_id = channel_id
+		self.revision = get_repository(bot).Revision(channel_id)
+		self.selected: List[int] = []
 
-				restored_count += 1
-				cleaned_data.append(view_data)
-				logger.info(
-					f'Restored todo navigation view for message {message_id} in channel {channel_id}'
+		options = bulk_item_options(items)
+		self.select = discord.ui.Select(
+			placeholder='Choose items...',
+			options=options,
+			min_values=1,
+			max_values=len(options),
+			row=0,
+		)
+		self.select.callback = self.select_callback
+		self.add_item(self.select)
+
+	def rebuild(self) -> Optional['TodoBulkPriorityView']:
+		"""A fresh copy of this menu for the current page, or None if it has no items."""
+		_, items = current_page_items(self.bot, self.channel_id)
+		return TodoBulkPriorityView(self.bot, self.channel_id, items) if items else None
+
+	async def select_callback(self, interaction: discord.Interaction) -> None:
+		self.selected = [int(val) for val in self.select.values]
+		await interaction.response.defer()
+
+	@discord.ui.button(label='High', style=discord.ButtonStyle.danger, emoji='🔴', row=1)
+	async def set_high(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
+		await self.apply(interaction, 'high')
+
+	@discord.ui.button(label='Medium', style=discord.ButtonStyle.primary, emoji='🟡', row=1)
+	async def set_medium(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
+		await self.apply(interaction, 'medium')
+
+	@discord.ui.button(label='Low', style=discord.ButtonStyle.success, emoji='🟢', row=1)
+	async def set_low(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
+		await self.apply(interaction, 'low')
+
+	async def apply(self, interaction: discord.Interaction, priority: str) -> None:
+		if not self.selected:
+			await interaction.response.send_message(
+				'❌ Select at least one item first!', ephemeral=True, delete_after=10
+			)
+			return
+
+		await interaction.response.defer()
+
+		async with get_channel_lock(self.bot, self.channel_id):
+			# Indices baked into the options are only valid for the revision they were built from
+			repository = get_repository(self.bot)
+			if repository.Revision(self.channel_id) != self.revision:
+				await refresh_stale_select(interaction, self.rebuild())
+				return
+
+			current_page_idx = repository.CurrentPageIndex(self.channel_id)
+			changed = repository.SetPriority(
+				self.channel_id, current_page_idx, self.selected, priority
+			)
+			if changed:
+				await self.bot.get_cog('TodoList').render_todo_messages(
+					self.channel_id, interaction.channel
 				)
+			# The options are still valid: priorities don't shift indices
+			self.revision = repository.Revision(self.channel_id)
 
-				await asyncio.sleep(1)  # Rate limit protection
+		logger.info(
+			f'Priority of {len(changed)} to-do item(s) on page {current_page_idx} in channel '
+			f'{self.channel_id} set to {priority} by {interaction.user}'
+		)
+		await interaction.followup.send(
+			f'✅ Set {len(changed)} item(s) to {priority.title()} priority!', ephemeral=True
+		)
 
-			except discord.NotFound:
-				logger.warning(f'Message {message_id} not found, removing from persistent views')
-			except Exception as e:
-				logger.error(f'Failed to restore view for message {message_id}: {e}')
-				cleaned_data.append(view_data)  # Keep on other errors
-
-		# Save cleaned data
-		self.persistent_views_data = cleaned_data
-		with open(self.persistent_views_file, 'w', encoding='utf-8') as f:
-			json.dump(self.persistent_views_data, f, indent=2)
-
-		logger.info(f'Restored {restored_count} persistent navigation views')
-
-	def _save_persistent_view(self, channel_id: int, message_id: int) -> None:
-		"""Save a persistent view to the data file."""
-		# Check if already exists
-		for view_data in self.persistent_views_data:
-			if (
-				view_data.get('channel_id') == channel_id
-				and view_data.get('message_id') == message_id
-			):
-				logger.info(f'View for message {message_id} already in persistent storage')
-				return  # Already saved
-
-		# Add new entry
-		self.persistent_views_data.append({'channel_id': channel_id, 'message_id': message_id})
-
-		# Save to file
-		try:
-			with open(self.persistent_views_file, 'w', encoding='utf-8') as f:
-				json.dump(self.persistent_views_data, f, indent=2)
-			logger.info(f'Saved persistent view for message {message_id} in channel {channel_id}')
-		except Exception as e:
-			logger.error(f'Failed to save persistent view: {e}')
-
-	def _remove_persistent_view(self, channel_id: int, message_id: int) -> None:
-		"""Remove a persistent view from the data file."""
-		original_count = len(self.persistent_views_data)
-		self.persistent_views_data = [
-			view_data
-			for view_data in self.persistent_views_data
-			if not (
-				view_data.get('channel_id') == channel_id
-				and view_data.get('message_id') == message_id
+
+class TodoBulkAssignView(discord.ui.View):
+	"""Multi-select of items plus a user select that assigns all of them."""
+
+	def __init__(self, bot: commands.Bot, channel_id: int, items: List[Dict[str, Any]]) -> None:
+		super().__init__(timeout=120)
+		self.bot = bot
+		self.channel_id = channel_id
+		self.revision = get_repository(bot).Revision(channel_id)
+		self.selected: List[int] = []
+
+		options = bulk_item_options(items)
+		self.select = discord.ui.Select(
+			placeholder='Choose items...',
+			options=options,
+			min_values=1,
+			max_values=len(options),
+			row=0,
+		)
+		self.select.callback = self.select_callback
+		self.add_item(self.select)
+
+		self.user_select = discord.ui.UserSelect(
+			placeholder='Assign the selected items to...', min_values=1, max_values=1, row=1
+		)
+		self.user_select.callback = self.user_selected
+		self.add_item(self.user_select)
+
+	def rebuild(self) -> Optional['TodoBulkAssignView']:
+		"""A fresh copy of this menu for the current page, or None if it has no items."""
+		_, items = current_page_items(self.bot, self.channel_id)
+		return TodoBulkAssignView(self.bot, self.channel_id, items) if items else None
+
+	async def select_callback(self, interaction: discord.Interaction) -> None:
+		self.selected = [int(val) for val in self.select.values]
+		await interaction.response.defer()
+
+	async def user_selected(self, interaction: discord.Interaction) -> None:
+		if not self.selected:
+			await interaction.response.send_message(
+				'❌ Select at least one item first!', ephemeral=True, delete_after=10
 			)
-		]
+			return
 
-		# Save to file if something was removed
-		if len(self.persistent_views_data) < original_count:
+		user = interaction.guild.get_member(int(interaction.data['values'][0]))
+		if not user:
+			await interaction.response.send_message('❌ Could not find that user!', ephemeral=True)
+			return
+		if user.bot:
+			await interaction.response.send_message(
+				'❌ Cannot assign tasks to bots!', ephemeral=True
+			)
+			return
+
+		await interaction.response.defer()
+
+		async with get_channel_lock(self.bot, self.channel_id):
+			repository = get_repository(self.bot)
+			if repository.Revision(self.channel_id) != self.revision:
+				await refresh_stale_select(interaction, self.rebuild())
+				return
+
+			current_page_idx = repository.CurrentPageIndex(self.channel_id)
+			assigned = repository.AssignItems(
+				self.channel_id, current_page_idx, self.selected, user, interaction.user
+			)
+			if assigned:
+				await self.bot.get_cog('TodoList').render_todo_messages(
+					self.channel_id, interaction.channel
+				)
+			self.revision = repository.Revision(self.channel_id)
+
+		logger.info(
+			f'{interaction.user} assigned {len(assigned)} to-do item(s) on page {current_page_idx} '
+			f'in channel {self.channel_id} to {user}'
+		)
+		await interaction.followup.send(
+			f'✅ Assigned {len(assigned)} item(s) to {user.mention}!', ephemeral=True
+		)
+
+
+class TodoList(commands.Cog):
+	"""
+	📋 To-Do List Cog: Manage a dynamic server to-do list with AI-style formatting.
+	"""
+
+	def __init__(self, bot: commands.Bot) -> None:
+		self.bot = bot
+		# Load and migrate the to-do data once; handlers only touch the in-memory copy
+		if TodoStorageBackend == 'sqlite':
+			self.repository = SqliteTodoRepository(TodoDatabaseFile, TODO_DATA_FILE, TodoFlushDelay)
+		else:
+			self.repository = TodoRepository(TODO_DATA_FILE, TodoFlushDelay)
+		self.repository.Load()
+		self.task_formatter = TaskFormatter(
+			TaskFormatterModel,
+			TaskFormatterTimeout,
+			TaskFormatterConcurrency,
+			TaskFormatterCacheSize,
+		)
+		# Last rendered state per channel: {'embeds': [embed dicts], 'nav': (page, total_pages)}
+		self.rendered: Dict[int, Dict[str, Any]] = {}
+		# One lock per channel around read-modify-write-render sequences
+		self.channel_locks: Dict[int, asyncio.Lock] = {}
+		# Rendered embeds per page ID: (version key, embeds, embed dicts)
+		self.embed_cache: Dict[int, Tuple[tuple, List[discord.Embed], List[Dict[str, Any]]]] = {}
+		# Page navigation cooldowns for non-mods, shared by every navigation view
+		self.navigation_cooldowns = CooldownStore(TodoNavigationCooldown)
+		RegisterGauge('todo.navigation_cooldowns', lambda: len(self.navigation_cooldowns))
+
+	async def cog_load(self) -> None:
+		"""Called when the cog is loaded (including reloads)."""
+		# Persist any migration done while loading
+		if self.repository.Dirty:
+			self.repository.MarkDirty()
+		# One persistent navigation view serves every to-do board: it resolves the channel from
+		# the interaction, so no message has to be fetched or edited to re-attach it on startup
+		self.bot.add_view(TodoPageNavigationView(self.bot))
+
+	async def cog_unload(self) -> None:
+		"""Write pending to-do changes before the cog goes away."""
+		await self.repository.Close()
+
+	def channel_lock(self, channel_id: int) -> asyncio.Lock:
+		"""Get the lock for a channel's to-do list, creating it on first use."""
+		if channel_id not in self.channel_locks:
+			self.channel_locks[channel_id] = asyncio.Lock()
+		return self.channel_locks[channel_id]
+
+	def build_page_embeds(
+		self, channel_id: int
+	) -> Tuple[List[discord.Embed], List[Dict[str, Any]]]:
+		"""Embeds (and their dicts) for the current page, reused while the page is unchanged."""
+		current_page_idx = self.repository.CurrentPageIndex(channel_id)
+		pages = self.repository.Pages(channel_id)
+		page = pages[current_page_idx]
+		key = (
+			self.repository.PageVersion(channel_id, current_page_idx),
+			current_page_idx,
+			len(pages),
+		)
+		cached = self.embed_cache.get(page['id'])
+		if cached and cached[0] == key:
+			return cached[1], cached[2]
+
+		embeds = render_page_embeds(page, current_page_idx + 1, len(pages))
+		dicts = [embed.to_dict() for embed in embeds]
+		self.embed_cache[page['id']] = (key, embeds, dicts)
+		return embeds, dicts
+
+	async def render_todo_messages(
+		self, channel_id: int, channel=None
+	) -> Optional[discord.PartialMessage]:
+		"""
+		Bring the posted to-do messages in line with the current page.
+		Unchanged chunks are left alone, changed ones are edited in place and only the
+		difference in chunk count is sent or deleted, so message IDs stay stable.
+		Returns the message carrying the navigation view.
+		"""
+		channel = self.bot.get_channel(channel_id) or channel
+		embeds, new_dicts = self.build_page_embeds(channel_id)
+		nav_state = (
+			self.repository.CurrentPageIndex(channel_id),
+			len(self.repository.Pages(channel_id)),
+		)
+		message_ids = list(self.repository.Channel(channel_id)['message_ids'])
+		rendered = self.rendered.get(channel_id, {})
+		old_dicts = rendered.get('embeds', [])
+		old_last = len(message_ids) - 1
+		last = len(embeds) - 1
+
+		# Navigation view (only on the last message)
+		nav_view = TodoPageNavigationView(self.bot, channel_id)
+		nav_view.update_buttons()
+
+		# Edit the messages we can keep
+		kept = []
+		edited = deleted = 0
+		for idx, message_id in enumerate(message_ids[: len(embeds)]):
+			has_view = idx == last
+			changed = (
+				idx >= len(old_dicts)
+				or old_dicts[idx] != new_dicts[idx]
+				or (has_view and rendered.get('nav') != nav_state)
+				or (idx == old_last) != has_view
+			)
+			if changed:
+				try:
+					await self.bot.Scheduler.Run(
+						partial(
+							channel.get_partial_message(message_id).edit,
+							embed=embeds[idx],
+							view=nav_view if has_view else None,
+						),
+						('message_edit', channel_id),
+						Update,
+						CoalesceKey=f'todo:{message_id}',
+					)
+				except discord.NotFound:
+					# Someone deleted it; everything from here on gets re-sent to keep the order
+					logger.warning(
+						f'To-do message {message_id} is gone, re-sending from chunk {idx}'
+					)
+					break
+				edited += 1
+			kept.append(message_id)
+
+		# Delete surplus (or out-of-order) messages
+		for message_id in message_ids[len(kept) :]:
 			try:
-				with open(self.persistent_views_file, 'w', encoding='utf-8') as f:
-					json.dump(self.persistent_views_data, f, indent=2)
-				logger.info(
-					f'Removed persistent view for message {message_id} in channel {channel_id}'
+				await self.bot.Scheduler.Run(
+					channel.get_partial_message(message_id).delete,
+					('message_delete', channel_id),
+					Update,
 				)
+				deleted += 1
+			except discord.NotFound:
+				pass
 			except Exception as e:
-				logger.error(f'Failed to remove persistent view: {e}')
+				logger.warning(f'Could not delete old to-do message {message_id}: {e}')
+
+		# Send the chunks that have no message yet
+		new_message_ids = list(kept)
+		for idx in range(len(kept), len(embeds)):
+			send_kwargs = {'embed': embeds[idx]}
+			if idx == last:
+				send_kwargs['view'] = nav_view
+			new_message = await self.bot.Scheduler.Run(
+				partial(channel.send, **send_kwargs), ('message_send', channel_id), Update
+			)
+			new_message_ids.append(new_message.id)
+
+		self.rendered[channel_id] = {'embeds': new_dicts, 'nav': nav_state}
+		if new_message_ids != message_ids:
+			self.repository.SetMessageIds(channel_id, new_message_ids)
+
+		logger.info(
+			f'Rendered to-do list in channel {channel_id}: {edited} edited, '
+			f'{len(new_message_ids) - len(kept)} sent, {deleted} deleted'
+		)
+		nav_view.message = channel.get_partial_message(new_message_ids[-1])
+		return nav_view.message
 
 	# 🧩 Shared handler for todo-update logic
 	async def handle_todo_update(self, ctx_or_interaction: Any) -> None:
@@ -2185,10 +2267,8 @@ class TodoList(commands.Cog):
 		channel_id = channel.id
 
 		# Show management view
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, channel_id)
-		current_page_idx = channel_data.get('current_page', 0)
-		pages = channel_data.get('pages', [])
+		current_page_idx = self.repository.CurrentPageIndex(channel_id)
+		pages = self.repository.Pages(channel_id)
 
 		# Get current page item count
 		current_items = 0
@@ -2226,10 +2306,8 @@ class TodoList(commands.Cog):
 		channel = ctx_or_interaction.channel
 		channel_id = channel.id
 
-		data = await load_todo_data()
-		channel_data = await get_channel_data(data, channel_id)
-		current_page_idx = channel_data.get('current_page', 0)
-		pages = channel_data.get('pages', [])
+		current_page_idx = self.repository.CurrentPageIndex(channel_id)
+		pages = self.repository.Pages(channel_id)
 
 		# Check if current page has items
 		has_items = False
@@ -2249,8 +2327,7 @@ class TodoList(commands.Cog):
 		items = current_page.get('items', [])
 		page_title = current_page.get('title', '📋 To-Do List')
 
-		modal = TodoModal(self.bot, channel_id=channel_id)
-		embed = modal.create_todo_embed(
+		embed = create_todo_embed(
 			items,
 			is_first=True,
 			total_items=len(items),
@@ -2270,6 +2347,143 @@ class TodoList(commands.Cog):
 		)
 		logger.info(f'todo-show used by {user} in channel {channel_id}')
 
+	# 🧩 Shared handler for todo-mine logic
+	async def handle_todo_mine(self, ctx_or_interaction: Any) -> None:
+		"""Show every task assigned to the caller, across all channels."""
+		user = (
+			ctx_or_interaction.author
+			if hasattr(ctx_or_interaction, 'author')
+			else ctx_or_interaction.user
+		)
+		# Answered from the assignment index, so the cost only depends on the user's own tasks
+		assigned = self.repository.ItemsAssignedTo(user.id)
+
+		if not assigned:
+			message = '📋 You have no assigned tasks!'
+			if hasattr(ctx_or_interaction, 'send'):
+				await ctx_or_interaction.send(message, delete_after=10)
+			else:
+				await ctx_or_interaction.response.send_message(message, ephemeral=True)
+			return
+
+		by_channel: Dict[int, List[str]] = {}
+		priority_order = list(PRIORITY_EMOJIS)
+		assigned.sort(key=lambda entry: priority_order.index(entry[2].get('priority', 'low')))
+		for channel_id, page, item in assigned:
+			emoji = PRIORITY_EMOJIS.get(item.get('priority', 'low'), '⚪')
+			by_channel.setdefault(channel_id, []).append(
+				f'{emoji} **{item.get("title", "Untitled")}** · *{page.get("title", "📋 To-Do List")}*'
+			)
+
+		embed = discord.Embed(
+			title='📋 My Tasks',
+			description=f'**{len(assigned)}** task(s) assigned to {user.mention} '
+			f'in **{len(by_channel)}** channel(s).',
+			color=EMBED_COLOR,
+		)
+		for channel_id, lines in list(by_channel.items())[:25]:
+			value = '\n'.join([f'<#{channel_id}>', *lines])
+			if len(value) > 1024:
+				value = value[:1020] + '\n…'
+			embed.add_field(name='\u200b', value=value, inline=False)
+		set_embed_footer(embed, bot=self.bot.user)
+
+		if hasattr(ctx_or_interaction, 'send'):
+			await ctx_or_interaction.send(embed=embed)
+		else:
+			await ctx_or_interaction.response.send_message(embed=embed, ephemeral=True)
+
+		logger.info(f'todo-mine used by {user}: {len(assigned)} task(s)')
+
+	# 🧩 Shared handler for todo-export logic
+	async def handle_todo_export(self, ctx_or_interaction: Any) -> None:
+		"""Send this channel's pages as an NDJSON file: a page record, then its item records."""
+		user = (
+			ctx_or_interaction.author
+			if hasattr(ctx_or_interaction, 'author')
+			else ctx_or_interaction.user
+		)
+		if not is_mod_or_admin(user):
+			message = '❌ You do not have permission to use this command.'
+			if hasattr(ctx_or_interaction, 'send'):
+				await ctx_or_interaction.send(message, delete_after=5)
+			else:
+				await ctx_or_interaction.response.send_message(
+					message, ephemeral=True, delete_after=10
+				)
+			return
+
+		channel_id = ctx_or_interaction.channel.id
+		buffer = io.BytesIO()
+		for record in self.repository.ExportRecords(channel_id):
+			buffer.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
+		buffer.seek(0)
+		file = discord.File(buffer, filename=f'todo-{channel_id}.ndjson')
+
+		if hasattr(ctx_or_interaction, 'send'):
+			await ctx_or_interaction.send(file=file)
+		else:
+			await ctx_or_interaction.response.send_message(file=file, ephemeral=True)
+
+		logger.info(f'todo-export used by {user} in channel {channel_id}')
+
+	# 🧩 Shared handler for todo-import logic
+	async def handle_todo_import(
+		self, ctx_or_interaction: Any, attachment: Optional[discord.Attachment]
+	) -> None:
+		"""Append the pages of an exported NDJSON file to this channel's to-do list."""
+		is_prefix = hasattr(ctx_or_interaction, 'send')
+		user = ctx_or_interaction.author if is_prefix else ctx_or_interaction.user
+
+		async def reply(message: str) -> None:
+			if is_prefix:
+				await ctx_or_interaction.send(message, delete_after=10)
+			elif ctx_or_interaction.response.is_done():
+				await ctx_or_interaction.followup.send(message, ephemeral=True)
+			else:
+				await ctx_or_interaction.response.send_message(
+					message, ephemeral=True, delete_after=10
+				)
+
+		if not is_mod_or_admin(user):
+			await reply('❌ You do not have permission to use this command.')
+			return
+		if attachment is None:
+			await reply('❌ Attach an exported `.ndjson` file.')
+			return
+		if attachment.size > TodoImportMaxBytes:
+			await reply(f'❌ File is too large! The limit is {TodoImportMaxBytes // 1024} KB.')
+			return
+
+		if not is_prefix:
+			await ctx_or_interaction.response.defer(ephemeral=True)
+
+		channel = ctx_or_interaction.channel
+		try:
+			data = await attachment.read()
+		except discord.HTTPException as e:
+			await reply(f'❌ Could not download the file: {e}')
+			return
+		pages, skipped = PagesFromNdjson(data.decode('utf-8', errors='replace').splitlines())
+		if not pages:
+			await reply('❌ No pages found in the file!')
+			return
+
+		async with self.channel_lock(channel.id):
+			self.repository.ImportPages(channel.id, pages)
+			await self.render_todo_messages(channel.id, channel)
+
+		item_count = sum(len(page['items']) for page in pages)
+		message = f'✅ Imported {len(pages)} page(s) with {item_count} item(s)!'
+		if skipped:
+			message += f' Skipped {skipped} invalid line(s).'
+		await reply(message)
+
+		logger.info(
+			f'todo-import by {user} in channel {channel.id}: {len(pages)} page(s), '
+			f'{item_count} item(s), {skipped} line(s) skipped'
+		)
+
 	# !todo-update (Prefix) - Mod/Admin only
 	@commands.command(name='todo-update')
 	async def todo_update_prefix(self, ctx: commands.Context) -> None:
@@ -2287,6 +2501,59 @@ class TodoList(commands.Cog):
 	async def todo_update_slash(self, interaction: discord.Interaction) -> None:
 		await self.handle_todo_update(interaction)
 
+	# !todo-mine (Prefix)
+	@commands.command(name='todo-mine')
+	async def todo_mine_prefix(self, ctx: commands.Context) -> None:
+		"""
+		📋 List every to-do task assigned to you, across all channels.
+		"""
+		await self.handle_todo_mine(ctx)
+
+	# /todo-mine (Slash)
+	@app_commands.command(
+		name='todo-mine',
+		description='📋 List every to-do task assigned to you, across all channels.',
+	)
+	async def todo_mine_slash(self, interaction: discord.Interaction) -> None:
+		await self.handle_todo_mine(interaction)
+
+	# !todo-export (Prefix) - Mod/Admin only
+	@commands.command(name='todo-export')
+	async def todo_export_prefix(self, ctx: commands.Context) -> None:
+		"""
+		📤 Export this channel's to-do pages as an NDJSON file. (Mod/Admin only)
+		"""
+		await self.handle_todo_export(ctx)
+
+	# /todo-export (Slash) - Mod/Admin only
+	@app_commands.command(
+		name='todo-export',
+		description="📤 Export this channel's to-do pages as an NDJSON file.",
+	)
+	async def todo_export_slash(self, interaction: discord.Interaction) -> None:
+		await self.handle_todo_export(interaction)
+
+	# !todo-import (Prefix) - Mod/Admin only
+	@commands.command(name='todo-import')
+	async def todo_import_prefix(self, ctx: commands.Context) -> None:
+		"""
+		📥 Import to-do pages from an attached NDJSON export. (Mod/Admin only)
+		Imported pages are added after the channel's existing pages.
+		"""
+		attachment = ctx.message.attachments[0] if ctx.message.attachments else None
+		await self.handle_todo_import(ctx, attachment)
+
+	# /todo-import (Slash) - Mod/Admin only
+	@app_commands.command(
+		name='todo-import',
+		description='📥 Import to-do pages from an NDJSON export.',
+	)
+	@app_commands.describe(file='A file created by /todo-export')
+	async def todo_import_slash(
+		self, interaction: discord.Interaction, file: discord.Attachment
+	) -> None:
+		await self.handle_todo_import(interaction, file)
+
 
 async def setup(bot: commands.Bot) -> None:
 	await bot.add_cog(TodoList(bot))
@@ -41,6 +41,42 @@ BotName = 'Void Bot'
 # Message Cooldown (in seconds) - Prevents spamming commands/messages
 MessageCooldown = 2
 
+# Window (in seconds) for batching prefix command message deletions into one bulk delete per channel
+CommandDeleteWindow = 1.5
+
+# File path for the hash of the last synced application command tree
+CommandTreeHashFile = 'command_tree_hash.json'
+
+# <-- REST Scheduler Settings -->
+
+# Number of concurrent outbound REST workers
+RestWorkers = 4
+
+# Per-route token buckets as (requests, period in seconds), resynced from Discord's headers on 429
+RestRouteLimits = {
+	'default': (5, 5),
+	'message_send': (5, 5),
+	'message_edit': (5, 5),
+	'message_delete': (5, 1),
+	'channel_edit': (2, 600),
+}
+
+# <-- Cog Loading Settings -->
+
+# Cogs that must be loaded after the listed cogs (e.g. LiveStatus imports Cogs.ServerStats)
+CogDependencies = {
+	'LiveStatus': ['ServerStats'],
+}
+
+# Optional cogs loaded in the background after startup instead of delaying it
+DeferredCogs = ['Achievement', 'Gallery']
+
+# Heavy third-party modules that cogs must import lazily (checked by Utils/ImportBudget.py)
+LazyImportedModules = ['openai', 'PIL']
+
+# Maximum combined import time of all cogs (in seconds) before the import budget check fails
+ImportTimeBudget = 1.5
+
 # <-- Minecraft Settings -->
 
 ProtocolVersion = 766  # 1.20.5
@@ -89,6 +125,75 @@ TICKETS_CATEGORY_ID = 1308780597988036628
 # Channel ID for ticket transcripts
 TRANSCRIPT_CHANNEL_ID = 1308793574329946162
 
+# Journal records after which tickets.journal is folded into tickets.json
+TicketJournalCompactEvery = 500
+
+# Days a closed ticket is kept before its channel is deleted
+TicketRetentionDays = 7
+
+# Seconds before a failed ticket deletion is retried; doubles per attempt up to the maximum
+TicketCleanupRetryDelay = 60
+TicketCleanupRetryMaxDelay = 3600
+
+# Seconds a member's cached admin/moderator status is trusted without a member update
+TicketRoleCacheTTL = 60
+
+# Most recent claim/close latencies kept per handler for /ticket-stats
+TicketStatsWindow = 200
+
+# Directory for the per-ticket transcript logs, recorded as messages arrive
+TranscriptDirectory = 'transcripts'
+
+# Seconds to collect transcript lines before they are appended to disk
+TranscriptFlushDelay = 2.0
+
+# Transcript emails with a larger HTML body (in characters) attach the compressed transcript instead
+TranscriptEmailInlineLimit = 100_000
+
+# Directory where the compressed transcript of every closed ticket is kept
+TranscriptArchiveDirectory = 'transcripts/archive'
+
+# <-- Mail Settings -->
+
+# Outgoing mail waits here until it is delivered (failed mail ends up in its failed/ folder)
+MailOutboxDirectory = 'mail_outbox'
+
+# Most messages sent over one SMTP connection
+MailBatchSize = 20
+
+# Delivery attempts per message before it is moved to failed/
+MailMaxAttempts = 8
+
+# Retry backoff in seconds: doubles per attempt from the base delay, capped at the max delay
+MailRetryBaseDelay = 30
+MailRetryMaxDelay = 3600
+
+# <-- To-Do List Settings -->
+
+# Seconds to collect to-do list changes before they are written to disk in one go
+TodoFlushDelay = 2.0
+
+# Seconds a non-mod has to wait between to-do page turns
+TodoNavigationCooldown = 60
+
+# Most tasks a single bulk add may contain
+TodoBulkAddLimit = 25
+
+# Largest NDJSON file /todo-import accepts, in bytes
+TodoImportMaxBytes = 1024 * 1024
+
+# 'json' keeps everything in todo_list.json, 'sqlite' stores row-level in TodoDatabaseFile
+# (the JSON file is imported once on first start with the sqlite backend)
+TodoStorageBackend = 'json'
+TodoDatabaseFile = 'todo_list.db'
+
+# AI task formatting: model, hard deadline in seconds, concurrent requests and cached results
+# (set OPENAI_BASE_URL to point the client at a compatible local server)
+TaskFormatterModel = 'gpt-4.1-nano'
+TaskFormatterTimeout = 8.0
+TaskFormatterConcurrency = 2
+TaskFormatterCacheSize = 256
+
 # <-- Bot Color Settings -->
 
 # Primary color for embeds (pastel green, used across all cogs)
@@ -1,11 +1,16 @@
 # 📦 Built-in modules
 import difflib
-import pathlib
+import asyncio
 import time
 import os
 
 # 📥 Custom modules
 from Utils.Logger import Logger, logging, ConsoleHandler
+from Utils.CommandSync import SyncCommandTree
+from Utils.RestScheduler import RestScheduler
+from Utils.DeleteQueue import DeleteQueue
+from Utils.Metrics import RegisterGauge
+from Utils.CogLoader import CogLoader
 from Utils.Env import LoadEnv
 
 # ⚙️ Settings
@@ -14,9 +19,14 @@ from Config import (
 	Intents,
 	CommandPrefix,
 	BlacklistedChannels,
+	CogDependencies,
+	DeferredCogs,
 	BotName,
 	FuzzyMatchingThreshold,
+	CommandDeleteWindow,
+	RestRouteLimits,
 	MessageCooldown,
+	RestWorkers,
 )
 
 # 👾 Discord modules
@@ -31,40 +41,65 @@ class Bot(commands.Bot):
 		# ⏱️ Track user cooldowns (user ID -> last message timestamp)
 		self.UserCooldowns = {}
 
-	async def setup_hook(self) -> None:
-		for Cog in pathlib.Path('Cogs').glob('*.py'):
-			if Cog.name.startswith('_'):
-				continue
-			Logger.info(f'• Loading extension: {Cog.stem}')
-			await self.load_extension(f'Cogs.{Cog.stem}')
-		Logger.info('Done loading Cogs.')
+		# 🧩 Cog loader with dependency ordering and load-time profiling
+		self.CogLoader = CogLoader(self, CogDependencies)
+		# 🗑️ Batches command message deletions per channel
+		self.DeleteQueue = DeleteQueue(CommandDeleteWindow)
+		RegisterGauge('delete_queue.pending', lambda: len(self.DeleteQueue))
+		# 🚦 Central outbound REST scheduler shared by all cogs
+		self.Scheduler = RestScheduler(RestRouteLimits, RestWorkers)
 
-	async def on_ready(self) -> None:
-		if self.user:
-			Logger.info(f'Logged in as {self.user.display_name} ({self.user.id})')
-		else:
-			Logger.error('Failed to get bot user details')
-			return
+	async def add_cog(self, cog: commands.Cog, /, **kwargs) -> None:
+		# ⏱️ Split each cog's load time into import/init and setup
+		self.CogLoader.MarkSetup(type(cog).__module__)
+		await super().add_cog(cog, **kwargs)
 
+	async def setup_hook(self) -> None:
+		self.Scheduler.Start()
+		AllCogs = self.CogLoader.Discover()
+		# 💡 A deferred cog that an eager cog depends on has to load eagerly too
+		Required = {
+			Dependency
+			for Name in AllCogs
+			if Name not in DeferredCogs
+			for Dependency in CogDependencies.get(Name, [])
+		}
+		Deferred = [Name for Name in AllCogs if Name in DeferredCogs and Name not in Required]
+		Eager = [Name for Name in AllCogs if Name not in Deferred]
+		Elapsed = await self.CogLoader.LoadAll(Eager)
+		self.CogLoader.Report('Done loading Cogs', Eager, Elapsed)
+		if Deferred:
+			self.StartupTask = asyncio.create_task(self.FinishStartup(Deferred))
+		else:
+			await self.SyncCommands()
+
+	# 🌱 Load optional cogs off the startup path, then sync once every command is registered
+	async def FinishStartup(self, Deferred: list[str]) -> None:
+		Elapsed = await self.CogLoader.LoadAll(Deferred)
+		self.CogLoader.Report('Done loading deferred Cogs', Deferred, Elapsed)
+		try:
+			await self.SyncCommands()
+		except Exception as E:
+			Logger.error(f'Failed to sync application commands: {E}')
+
+	async def SyncCommands(self) -> None:
 		# ⚙️ Only sync global slash commands for production bot!
 		# This prevents the test bot from registering commands globally,
 		# keeping the global command list clean and avoiding clutter.
 		# Set BOT_TYPE=test in your .env for the test bot.
+		# 💡 Syncing from startup instead of on_ready keeps gateway reconnects free of REST calls,
+		# and the persisted tree hash skips the sync entirely when nothing changed.
 		if os.getenv('BOT_TYPE') != 'test':
-			Logger.info('Syncing application commands...')
-			# Logger.info(f'Global commands before sync: {[cmd.name for cmd in self.tree.get_commands()]}')  # 🐛 Debug: Global commands
-			await self.tree.sync()
-			Logger.info('Done syncing application commands.')
+			await SyncCommandTree(self.tree)
 		else:
 			Logger.info('Global sync skipped for test bot.')
 
-		# for Guild in self.guilds:
-		# 	Logger.info(f'• Syncing commands for guild: {Guild.name} ({Guild.id})')
-		# 	try:
-		# 		await self.tree.sync(guild=Guild)
-		# 		Logger.info(f'Guild commands after sync for {Guild.id}: {[cmd.name for cmd in self.tree.get_commands(guild=Guild)]}')  # 🐛 Debug: Guild-specific commands
-		# 	except Exception as E:
-		# 		Logger.error(f'• Failed to sync commands for guild {Guild.id}: {E}')
+	async def on_ready(self) -> None:
+		if self.user:
+			Logger.info(f'Logged in as {self.user.display_name} ({self.user.id})')
+		else:
+			Logger.error('Failed to get bot user details')
+			return
 
 	async def on_message(self, message: discord.Message) -> None:
 		if message.author == self.user:
@@ -102,14 +137,9 @@ class Bot(commands.Bot):
 
 	@commands.Cog.listener()
 	async def on_command_completion(self, ctx: commands.Context) -> None:
-		# 🗑️ Delete the command message if it's a prefix command
-		if ctx.message:
-			try:
-				await ctx.message.delete()
-			except discord.Forbidden:
-				pass  # Ignore if bot lacks permissions
-			except discord.NotFound:
-				pass
+		# 🗑️ Queue the command message for deletion if it's a prefix command
+		if ctx.message and ctx.interaction is None:
+			self.DeleteQueue.Add(ctx.message)
 
 	async def on_command_error(self, ctx, error):
 		if isinstance(error, commands.CommandNotFound):
@@ -4,12 +4,16 @@ import difflib
 import glob
 
 # 📥 Custom modules
-from PIL.Image import Resampling
-from PIL import ImageDraw, ImageFont, Image
+from Utils.LazyImport import LazyModule
 
 # ⚙️ Settings
 from Config import FuzzyMatchingThreshold
 
+# 💤 Pillow is only imported once the first achievement is generated
+ImageDraw = LazyModule('PIL.ImageDraw')
+ImageFont = LazyModule('PIL.ImageFont')
+Image = LazyModule('PIL.Image')
+
 
 # 🌱 Function to generate Minecraft-style achievement image
 def MakeAchievement(
@@ -36,7 +40,7 @@ def MakeAchievement(
 		if IconName in IconNames:
 			IconPath = IconDir / f'{IconName.capitalize()}.png'
 			Icon = Image.open(IconPath).convert('RGBA')
-			Icon = Icon.resize((29, 31), resample=Resampling.LANCZOS)
+			Icon = Icon.resize((29, 31), resample=Image.Resampling.LANCZOS)
 			Base.paste(Icon, (18, 16), Icon)  # Place icon with transparency
 		else:
 			# 🔍 Fuzzy search for closest match
@@ -47,7 +51,7 @@ def MakeAchievement(
 				IconName = Closest[0]
 				IconPath = IconDir / f'{IconName.capitalize()}.png'
 				Icon = Image.open(IconPath).convert('RGBA')
-				Icon = Icon.resize((29, 31), resample=Resampling.LANCZOS)
+				Icon = Icon.resize((29, 31), resample=Image.Resampling.LANCZOS)
 				Base.paste(Icon, (18, 16), Icon)  # Place icon with transparency
 			else:
 				raise ValueError(
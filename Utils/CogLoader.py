@@ -0,0 +1,106 @@
+# 📦 Built-in modules
+import pathlib
+import asyncio
+import time
+
+# 📥 Custom modules
+from Utils.Logger import Logger
+
+# 👾 Discord modules
+from discord.ext import commands
+
+
+# 💡 Loads cogs in dependency-ordered waves and records how long each one takes
+class CogLoader:
+	def __init__(
+		self,
+		Bot: commands.Bot,
+		Dependencies: dict[str, list[str]] | None = None,
+		Directory: str = 'Cogs',
+	) -> None:
+		self.Bot = Bot
+		self.Dependencies = Dependencies or {}
+		self.Directory = Directory
+		# ⏱️ Cog name -> {'Import': seconds, 'Setup': seconds}
+		self.Timings = {}
+		self.StartTimes = {}
+		self.SetupMarks = {}
+		self.Failed = set()
+
+	# 🔍 Find every loadable cog file
+	def Discover(self) -> list[str]:
+		return sorted(
+			Cog.stem
+			for Cog in pathlib.Path(self.Directory).glob('*.py')
+			if not Cog.name.startswith('_')
+		)
+
+	# 🧱 Group cogs into waves where every cog only depends on earlier waves
+	def Waves(self, Names: list[str]) -> list[list[str]]:
+		Pending = set(Names)
+		Loaded = set(self.Bot.extensions)
+		Result = []
+		while Pending:
+			Wave = sorted(
+				Name
+				for Name in Pending
+				if all(
+					f'{self.Directory}.{Dependency}' in Loaded or Dependency not in Pending
+					for Dependency in self.Dependencies.get(Name, [])
+				)
+			)
+			if not Wave:
+				# 🔁 Circular dependency: load the rest one by one rather than not at all
+				Logger.warning(f'Circular cog dependencies between: {", ".join(sorted(Pending))}')
+				Result.extend([Name] for Name in sorted(Pending))
+				break
+			Result.append(Wave)
+			Pending -= set(Wave)
+			Loaded |= {f'{self.Directory}.{Name}' for Name in Wave}
+		return Result
+
+	# ⏱️ Called from Bot.add_cog: everything before it is import and init, the rest is setup
+	def MarkSetup(self, Module: str) -> None:
+		Name = Module.rsplit('.', 1)[-1]
+		if Name in self.StartTimes and Name not in self.SetupMarks:
+			self.SetupMarks[Name] = time.perf_counter()
+
+	async def LoadOne(self, Name: str) -> None:
+		Missing = [
+			Dependency
+			for Dependency in self.Dependencies.get(Name, [])
+			if Dependency in self.Failed
+		]
+		if Missing:
+			Logger.error(f'• Skipping extension {Name}: dependency {", ".join(Missing)} failed')
+			self.Failed.add(Name)
+			return
+		Logger.info(f'• Loading extension: {Name}')
+		self.StartTimes[Name] = Start = time.perf_counter()
+		try:
+			await self.Bot.load_extension(f'{self.Directory}.{Name}')
+		except Exception as E:
+			Logger.error(f'• Failed to load extension {Name}: {E}')
+			self.Failed.add(Name)
+			return
+		End = time.perf_counter()
+		Mark = self.SetupMarks.get(Name, End)
+		self.Timings[Name] = {'Import': Mark - Start, 'Setup': End - Mark}
+
+	# 🌱 Load the given cogs, running each independent wave concurrently
+	async def LoadAll(self, Names: list[str]) -> float:
+		Start = time.perf_counter()
+		for Wave in self.Waves(Names):
+			await asyncio.gather(*(self.LoadOne(Name) for Name in Wave))
+		return time.perf_counter() - Start
+
+	# 📊 Log a timing report, slowest cogs first
+	def Report(self, Label: str, Names: list[str], Elapsed: float) -> None:
+		Timings = {Name: self.Timings[Name] for Name in Names if Name in self.Timings}
+		Logger.info(f'{Label}: {len(Timings)} cogs in {Elapsed * 1000:.0f}ms')
+		for Name, Timing in sorted(
+			Timings.items(), key=lambda Item: -(Item[1]['Import'] + Item[1]['Setup'])
+		):
+			Logger.info(
+				f'• {Name}: import {Timing["Import"] * 1000:.1f}ms, setup {Timing["Setup"] * 1000:.1f}ms'
+			)
@@ -0,0 +1,54 @@
+# 📦 Built-in modules
+import hashlib
+import json
+import os
+
+# 📥 Custom modules
+from Utils.Logger import Logger
+
+# ⚙️ Settings
+from Config import CommandTreeHashFile
+
+# 👾 Discord modules
+from discord import app_commands
+
+
+# 💡 Serialize the command tree into a stable hash
+def HashCommandTree(Tree: app_commands.CommandTree) -> str:
+	Payload = sorted(
+		(Command.to_dict(Tree) for Command in Tree.get_commands()),
+		key=lambda Entry: (Entry.get('type', 1), Entry['name']),
+	)
+	Serialized = json.dumps(Payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+	return hashlib.sha256(Serialized.encode('utf-8')).hexdigest()
+
+
+# 💾 Read the hash persisted by the last successful sync
+def LoadTreeHash() -> str | None:
+	try:
+		with open(CommandTreeHashFile, 'r', encoding='utf-8') as File:
+			return json.load(File).get('hash')
+	except (FileNotFoundError, json.JSONDecodeError):
+		return None
+
+
+# 💾 Persist the hash atomically so a crash never leaves a half-written file
+def SaveTreeHash(TreeHash: str) -> None:
+	TempPath = f'{CommandTreeHashFile}.tmp'
+	with open(TempPath, 'w', encoding='utf-8') as File:
+		json.dump({'hash': TreeHash}, File)
+	os.replace(TempPath, CommandTreeHashFile)
+
+
+# 🌱 Sync application commands only when the tree changed since the last sync
+async def SyncCommandTree(Tree: app_commands.CommandTree, Force: bool = False) -> bool:
+	"""Sync the global command tree if its hash differs from the persisted one."""
+	TreeHash = HashCommandTree(Tree)
+	if not Force and TreeHash == LoadTreeHash():
+		Logger.info('Application commands unchanged, skipping sync.')
+		return False
+	Logger.info('Syncing application commands...')
+	await Tree.sync()
+	SaveTreeHash(TreeHash)
+	Logger.info('Done syncing application commands.')
+	return True
@@ -0,0 +1,39 @@
+# 📦 Built-in modules
+from typing import Hashable
+import time
+
+
+# 💡 Per-key cooldowns on the monotonic clock; expired entries are dropped instead of piling up
+class CooldownStore:
+	def __init__(self, Duration: float) -> None:
+		self.Duration = Duration
+		# 🗂️ Key -> monotonic time the cooldown ends
+		self.Expiry = {}
+		self.LastPrune = time.monotonic()
+
+	def __len__(self) -> int:
+		return len(self.Expiry)
+
+	# ⏱️ Seconds left on a key's cooldown, 0 if it has none
+	def Remaining(self, Key: Hashable) -> float:
+		Now = time.monotonic()
+		Ends = self.Expiry.get(Key)
+		if Ends is None:
+			return 0.0
+		if Ends <= Now:
+			del self.Expiry[Key]
+			return 0.0
+		return Ends - Now
+
+	# ➕ Start (or restart) a key's cooldown
+	def Touch(self, Key: Hashable) -> None:
+		Now = time.monotonic()
+		self.Expiry[Key] = Now + self.Duration
+		# 🧹 Sweep at most once per cooldown period, so the cost stays amortized O(1) per call
+		if Now - self.LastPrune >= self.Duration:
+			self.Prune(Now)
+
+	def Prune(self, Now: float | None = None) -> None:
+		Now = time.monotonic() if Now is None else Now
+		self.Expiry = {Key: Ends for Key, Ends in self.Expiry.items() if Ends > Now}
+		self.LastPrune = Now
@@ -0,0 +1,61 @@
+# 📦 Built-in modules
+from datetime import timedelta
+import asyncio
+
+# 📥 Custom modules
+from Utils.Logger import Logger
+
+# 👾 Discord modules
+import discord
+
+# 💡 Discord refuses bulk deletes for messages older than 14 days (small margin for clock skew)
+BulkDeleteMaxAge = timedelta(days=14) - timedelta(minutes=5)
+
+
+# 💡 Collects message deletions per channel and flushes them as one bulk delete per window
+class DeleteQueue:
+	def __init__(self, Window: float = 1.5) -> None:
+		self.Window = Window
+		# 🗂️ Channel ID -> messages waiting for deletion
+		self.Pending = {}
+		# 🗂️ Channel ID -> flush task for the currently open window
+		self.Tasks = {}
+
+	def __len__(self) -> int:
+		return sum(len(Messages) for Messages in self.Pending.values())
+
+	# ➕ Queue a message; the first message in a channel opens a new window
+	def Add(self, Message: discord.Message) -> None:
+		ChannelId = Message.channel.id
+		self.Pending.setdefault(ChannelId, []).append(Message)
+		if ChannelId not in self.Tasks:
+			self.Tasks[ChannelId] = asyncio.create_task(self.Flush(Message.channel))
+
+	async def Flush(self, Channel) -> None:
+		await asyncio.sleep(self.Window)
+		# 🔓 Close the window before awaiting so new messages start a fresh batch
+		Messages = self.Pending.pop(Channel.id, [])
+		self.Tasks.pop(Channel.id, None)
+		Cutoff = discord.utils.utcnow() - BulkDeleteMaxAge
+		Bulk = [Message for Message in Messages if Message.created_at > Cutoff]
+		Single = [Message for Message in Messages if Message.created_at <= Cutoff]
+		try:
+			if len(Bulk) >= 2 and hasattr(Channel, 'delete_messages'):
+				for Start in range(0, len(Bulk), 100):
+					try:
+						await Channel.delete_messages(Bulk[Start : Start + 100])
+					except discord.NotFound:
+						# 🔁 One of them is already gone, fall back to single deletes for this chunk
+						Single.extend(Bulk[Start : Start + 100])
+			else:
+				Single.extend(Bulk)
+			for Message in Single:
+				try:
+					await Message.delete()
+				except discord.NotFound:
+					pass
+		except discord.Forbidden:
+			# 🚫 No permission in this channel: drop the batch instead of retrying
+			Logger.warning(f'Missing permission to delete command messages in channel {Channel.id}')
+		except discord.HTTPException as E:
+			Logger.error(f'Failed to delete command messages in channel {Channel.id}: {E}')
@@ -0,0 +1,59 @@
+# 📦 Built-in modules
+import subprocess
+import pathlib
+import sys
+
+# 📥 Custom modules
+from Config import ImportTimeBudget, LazyImportedModules
+
+# 📂 Repository root, so the measurement doesn't depend on the working directory
+Root = pathlib.Path(__file__).resolve().parent.parent
+
+
+# 💡 Run `python -X importtime` for every cog and return (total seconds, eagerly loaded heavy modules)
+def MeasureImports() -> tuple[float, set[str]]:
+	Cogs = sorted(
+		f'Cogs.{Cog.stem}' for Cog in (Root / 'Cogs').glob('*.py') if not Cog.name.startswith('_')
+	)
+	try:
+		Result = subprocess.run(
+			[sys.executable, '-X', 'importtime', '-c', '; '.join(f'import {Cog}' for Cog in Cogs)],
+			capture_output=True,
+			text=True,
+			check=True,
+			cwd=Root,
+		)
+	except subprocess.CalledProcessError as E:
+		raise RuntimeError(f'Importing cogs failed:\n{E.stderr}') from E
+
+	TotalMicroseconds = 0
+	Eager = set()
+	for Line in Result.stderr.splitlines():
+		# 📏 Lines look like: "import time:   self [us] |  cumulative | imported package"
+		if not Line.startswith('import time:') or '|' not in Line:
+			continue
+		Parts = Line.split('|')
+		Package = Parts[2].rstrip()
+		if not Parts[0].split(':')[1].strip().isdigit():
+			continue
+		# 🌳 Only top-level entries (no indentation) add up without double counting
+		if not Package.startswith('  '):
+			TotalMicroseconds += int(Parts[1])
+		Name = Package.strip()
+		if Name.split('.')[0] in LazyImportedModules:
+			Eager.add(Name.split('.')[0])
+	return TotalMicroseconds / 1_000_000, Eager
+
+
+# 🧪 Fail when cog import time exceeds the budget or a lazy module is imported eagerly
+if __name__ == '__main__':
+	Seconds, Eager = MeasureImports()
+	print(f'Cog import time: {Seconds * 1000:.0f}ms (budget {ImportTimeBudget * 1000:.0f}ms)')
+	Failed = False
+	if Eager:
+		print(f'Heavy modules imported at boot: {", ".join(sorted(Eager))}')
+		Failed = True
+	if Seconds > ImportTimeBudget:
+		print('Import time budget exceeded.')
+		Failed = True
+	sys.exit(1 if Failed else 0)
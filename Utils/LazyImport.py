@@ -0,0 +1,26 @@
+# 📦 Built-in modules
+import importlib
+
+
+# 💡 Module proxy that defers the real import until the first attribute access
+class LazyModule:
+	def __init__(self, Name: str) -> None:
+		object.__setattr__(self, '_Name', Name)
+		object.__setattr__(self, '_Module', None)
+
+	def _Load(self):
+		Module = object.__getattribute__(self, '_Module')
+		if Module is None:
+			Module = importlib.import_module(object.__getattribute__(self, '_Name'))
+			object.__setattr__(self, '_Module', Module)
+		return Module
+
+	def __getattr__(self, Attr: str):
+		return getattr(self._Load(), Attr)
+
+	def __setattr__(self, Attr: str, Value) -> None:
+		setattr(self._Load(), Attr, Value)
+
+	def __repr__(self) -> str:
+		State = 'loaded' if object.__getattribute__(self, '_Module') else 'not loaded'
+		return f'<LazyModule {object.__getattribute__(self, "_Name")!r} ({State})>'
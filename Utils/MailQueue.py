@@ -0,0 +1,171 @@
+# 📦 Built-in modules
+from email.message import EmailMessage
+from email import policy
+import email
+import smtplib
+import asyncio
+import time
+import uuid
+import os
+
+# 📥 Custom modules
+from Utils.Logger import Logger
+
+
+# 💡 Persistent outbox plus a background worker that delivers off the event loop, in batches
+# over one SMTP connection, retrying failed messages with exponential backoff
+class MailQueue:
+	def __init__(
+		self,
+		Directory: str,
+		Host: str | None,
+		Port: int = 465,
+		User: str | None = None,
+		Password: str | None = None,
+		BatchSize: int = 20,
+		MaxAttempts: int = 8,
+		BaseDelay: float = 30.0,
+		MaxDelay: float = 3600.0,
+	) -> None:
+		self.Directory = Directory
+		self.FailedDirectory = os.path.join(Directory, 'failed')
+		self.Host = Host
+		self.Port = Port
+		self.User = User
+		self.Password = Password
+		self.BatchSize = BatchSize
+		self.MaxAttempts = MaxAttempts
+		self.BaseDelay = BaseDelay
+		self.MaxDelay = MaxDelay
+		# 🗂️ File name -> (attempts so far, monotonic time of the next attempt)
+		self.Retries = {}
+		# 📬 Delivered messages whose file could not be removed; never sent again by this process
+		self.Delivered = set()
+		# 🔢 Queued messages as of the last outbox listing, plus those enqueued since (for the gauge)
+		self.Size = 0
+		self.Wakeup = asyncio.Event()
+		self.Task = None
+
+	def __len__(self) -> int:
+		return self.Size
+
+	# 📂 Queued message files, oldest first (names start with a nanosecond timestamp)
+	def Outbox(self) -> list[str]:
+		if not os.path.isdir(self.Directory):
+			return []
+		return sorted(
+			Name
+			for Name in os.listdir(self.Directory)
+			if Name.endswith('.eml') and Name not in self.Delivered
+		)
+
+	def Start(self) -> None:
+		if self.Task is None or self.Task.done():
+			self.Task = asyncio.create_task(self.Worker())
+
+	async def Stop(self) -> None:
+		if self.Task and not self.Task.done():
+			self.Task.cancel()
+			try:
+				await self.Task
+			except asyncio.CancelledError:
+				pass
+
+	# ➕ Persist a message to the outbox; it survives restarts until it is delivered
+	async def Enqueue(self, Message: EmailMessage) -> None:
+		Name = f'{time.time_ns()}-{uuid.uuid4().hex}.eml'
+		await asyncio.to_thread(self.WriteMessage, Name, Message.as_bytes())
+		self.Size += 1
+		self.Wakeup.set()
+
+	def WriteMessage(self, Name: str, Data: bytes) -> None:
+		os.makedirs(self.Directory, exist_ok=True)
+		TempPath = os.path.join(self.Directory, f'{Name}.tmp')
+		with open(TempPath, 'wb') as File:
+			File.write(Data)
+			File.flush()
+			os.fsync(File.fileno())
+		os.replace(TempPath, os.path.join(self.Directory, Name))
+
+	# <-- Worker -->
+
+	async def Worker(self) -> None:
+		while True:
+			self.Wakeup.clear()
+			Now = time.monotonic()
+			Timeout = self.MaxDelay
+			try:
+				Outbox = await asyncio.to_thread(self.Outbox)
+				self.Size = len(Outbox)
+				self.Retries = {
+					Name: Retry for Name, Retry in self.Retries.items() if Name in Outbox
+				}
+				Due = [Name for Name in Outbox if self.Retries.get(Name, (0, 0.0))[1] <= Now]
+				if Due and self.Host:
+					await self.Deliver(Due[: self.BatchSize])
+					continue
+				if Due:
+					Logger.warning(f'SMTP server not configured, {len(Due)} mail(s) stay queued')
+				# 💤 Sleep until the next retry is due or a new message arrives
+				Timeout = min((Retry[1] - Now for Retry in self.Retries.values()), default=Timeout)
+			except Exception as E:
+				Logger.error(f'Mail worker error: {type(E).__name__}: {E}')
+			try:
+				await asyncio.wait_for(self.Wakeup.wait(), max(Timeout, 1.0))
+			except asyncio.TimeoutError:
+				pass
+
+	async def Deliver(self, Names: list[str]) -> None:
+		try:
+			Results = await asyncio.to_thread(self.SendBatch, Names)
+		except Exception as E:
+			# 🔌 Connect or login failed: the whole batch waits for its next attempt
+			Logger.error(f'SMTP delivery failed: {type(E).__name__}: {E}')
+			Results = {Name: E for Name in Names}
+
+		for Name, Error in Results.items():
+			if Error is None:
+				self.Retries.pop(Name, None)
+				continue
+			Attempts = self.Retries.get(Name, (0, 0.0))[0] + 1
+			if Attempts >= self.MaxAttempts:
+				Logger.error(f'Giving up on mail {Name} after {Attempts} attempts: {Error}')
+				self.Retries.pop(Name, None)
+				await asyncio.to_thread(self.MoveToFailed, Name)
+				continue
+			Delay = min(self.BaseDelay * 2 ** (Attempts - 1), self.MaxDelay)
+			self.Retries[Name] = (Attempts, time.monotonic() + Delay)
+			Logger.warning(f'Mail {Name} failed ({Error}), retrying in {Delay:.0f}s')
+
+	# 📤 One connection and login for the whole batch (runs in a worker thread)
+	def SendBatch(self, Names: list[str]) -> dict[str, Exception | None]:
+		Results = {}
+		with smtplib.SMTP_SSL(self.Host, self.Port, timeout=30) as Smtp:
+			if self.User:
+				Smtp.login(self.User, self.Password)
+			for Index, Name in enumerate(Names):
+				Path = os.path.join(self.Directory, Name)
+				try:
+					with open(Path, 'rb') as File:
+						Message = email.message_from_binary_file(File, policy=policy.default)
+					Smtp.send_message(Message)
+				except smtplib.SMTPServerDisconnected as E:
+					# 🔌 Connection lost mid-batch: this and the rest retry later
+					Results.update({Rest: E for Rest in Names[Index:]})
+					break
+				except (smtplib.SMTPException, OSError) as E:
+					Results[Name] = E
+					continue
+				Results[Name] = None
+				Logger.info(f'Mail {Name} delivered to {Message["To"]}')
+				try:
+					os.remove(Path)
+				except OSError as E:
+					# 📬 Sent already: keep it out of later batches rather than mail it twice
+					self.Delivered.add(Name)
+					Logger.error(f'Mail {Name} was delivered but could not be removed: {E}')
+		return Results
+
+	def MoveToFailed(self, Name: str) -> None:
+		os.makedirs(self.FailedDirectory, exist_ok=True)
+		os.replace(os.path.join(self.Directory, Name), os.path.join(self.FailedDirectory, Name))
@@ -0,0 +1,21 @@
+# 📦 Built-in modules
+from typing import Callable
+
+# 🗂️ Gauge name -> callable returning the current value
+Gauges: dict[str, Callable[[], float]] = {}
+
+
+# ➕ Register (or replace) a gauge that is evaluated on every snapshot
+def RegisterGauge(Name: str, Getter: Callable[[], float]) -> None:
+	Gauges[Name] = Getter
+
+
+# 📊 Evaluate every registered gauge
+def Snapshot() -> dict[str, float]:
+	Values = {}
+	for Name, Getter in sorted(Gauges.items()):
+		try:
+			Values[Name] = Getter()
+		except Exception:
+			Values[Name] = float('nan')
+	return Values
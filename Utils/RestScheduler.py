@@ -0,0 +1,209 @@
+# 📦 Built-in modules
+from typing import Any, Awaitable, Callable
+import itertools
+import asyncio
+import time
+
+# 📥 Custom modules
+from Utils.Metrics import RegisterGauge
+from Utils.Logger import Logger
+
+# 👾 Discord modules
+import discord
+
+# 🚦 Priority classes, lower runs first
+Interactive = 0
+Update = 1
+Background = 2
+PriorityNames = {Interactive: 'interactive', Update: 'update', Background: 'background'}
+
+# 🔁 How often a job is retried after Discord answered with 429
+MaxRateLimitRetries = 3
+
+
+# 💡 Token bucket for one route, refilled continuously on the monotonic clock
+class TokenBucket:
+	def __init__(self, Capacity: int, Period: float) -> None:
+		self.Capacity = Capacity
+		self.Rate = Capacity / Period
+		self.Tokens = float(Capacity)
+		self.Updated = time.monotonic()
+
+	def Refill(self) -> None:
+		Now = time.monotonic()
+		self.Tokens = min(self.Capacity, self.Tokens + (Now - self.Updated) * self.Rate)
+		self.Updated = Now
+
+	# ⏱️ Take a token, or return how long to wait for the next one without taking it
+	def Take(self) -> float:
+		self.Refill()
+		if self.Tokens >= 1:
+			self.Tokens -= 1
+			return 0.0
+		return (1 - self.Tokens) / self.Rate
+
+	# 🪞 Mirror Discord's X-RateLimit headers after a rate-limited response
+	def Sync(self, Headers) -> float:
+		ResetAfter = float(
+			Headers.get('X-RateLimit-Reset-After') or Headers.get('Retry-After') or 1
+		)
+		Limit = Headers.get('X-RateLimit-Limit')
+		if Limit:
+			self.Capacity = int(Limit)
+			self.Rate = self.Capacity / max(ResetAfter, 0.001)
+		self.Tokens = float(Headers.get('X-RateLimit-Remaining') or 0)
+		# 💡 Pretend the bucket was just drained so refills resume after ResetAfter
+		self.Updated = time.monotonic() + ResetAfter
+		return ResetAfter
+
+
+class Job:
+	__slots__ = (
+		'Factory',
+		'Route',
+		'Priority',
+		'CoalesceKey',
+		'Future',
+		'Attempts',
+		'Started',
+		'Parked',
+	)
+
+	def __init__(self, Factory, Route, Priority, CoalesceKey, Future) -> None:
+		self.Factory = Factory
+		self.Route = Route
+		self.Priority = Priority
+		self.CoalesceKey = CoalesceKey
+		self.Future = Future
+		self.Attempts = 0
+		self.Started = False
+		# ⏳ Priority the job was counted under while waiting for its route, None when not parked
+		self.Parked = None
+
+
+# 💡 Central outbound REST scheduler with per-route buckets, priorities and edit coalescing
+class RestScheduler:
+	def __init__(self, RouteLimits: dict[str, tuple[int, float]], Workers: int = 4) -> None:
+		self.RouteLimits = RouteLimits
+		self.WorkerCount = Workers
+		self.Queue = asyncio.PriorityQueue()
+		self.Sequence = itertools.count()
+		# 🗂️ (kind, major id) -> TokenBucket
+		self.Buckets = {}
+		# 🗂️ Coalesce key -> pending job that has not started yet
+		self.Coalescing = {}
+		self.Depth = dict.fromkeys(PriorityNames, 0)
+		self.Coalesced = 0
+		self.Workers = []
+		for Priority, Name in PriorityNames.items():
+			RegisterGauge(f'rest.queue.{Name}', lambda Priority=Priority: self.Depth[Priority])
+		RegisterGauge('rest.coalesced', lambda: self.Coalesced)
+
+	def Start(self) -> None:
+		if not self.Workers:
+			self.Workers = [asyncio.create_task(self.Worker()) for _ in range(self.WorkerCount)]
+
+	async def Stop(self) -> None:
+		for Task in self.Workers:
+			Task.cancel()
+		await asyncio.gather(*self.Workers, return_exceptions=True)
+		self.Workers = []
+
+	def Bucket(self, Route: tuple[str, int]) -> TokenBucket:
+		if Route not in self.Buckets:
+			Capacity, Period = self.RouteLimits.get(Route[0], self.RouteLimits['default'])
+			self.Buckets[Route] = TokenBucket(Capacity, Period)
+		return self.Buckets[Route]
+
+	def Enqueue(self, Item: Job) -> None:
+		self.Depth[Item.Priority] += 1
+		self.Queue.put_nowait((Item.Priority, next(self.Sequence), Item))
+
+	# ➕ Queue a call; a pending job with the same coalesce key is replaced by the newer one
+	def Submit(
+		self,
+		Factory: Callable[[], Awaitable[Any]],
+		Route: tuple[str, int],
+		Priority: int = Update,
+		CoalesceKey: str | None = None,
+	) -> asyncio.Future:
+		if CoalesceKey is not None:
+			Pending = self.Coalescing.get(CoalesceKey)
+			if Pending is not None and not Pending.Started:
+				# 🔀 Only the newest edit matters; everyone waiting gets its result
+				Pending.Factory = Factory
+				if Priority < Pending.Priority:
+					Pending.Priority = Priority
+					# 💡 A parked job is queued under its new priority once its delay ends
+					if Pending.Parked is None:
+						self.Enqueue(Pending)
+				self.Coalesced += 1
+				return Pending.Future
+		Item = Job(
+			Factory, Route, Priority, CoalesceKey, asyncio.get_running_loop().create_future()
+		)
+		if CoalesceKey is not None:
+			self.Coalescing[CoalesceKey] = Item
+		self.Enqueue(Item)
+		return Item.Future
+
+	# 🌱 Queue a call and wait for its result
+	async def Run(
+		self,
+		Factory: Callable[[], Awaitable[Any]],
+		Route: tuple[str, int],
+		Priority: int = Update,
+		CoalesceKey: str | None = None,
+	) -> Any:
+		return await self.Submit(Factory, Route, Priority, CoalesceKey)
+
+	async def Worker(self) -> None:
+		while True:
+			Priority, _, Item = await self.Queue.get()
+			self.Depth[Priority] -= 1
+			# 🧹 Stale entry left behind when a coalesced job was promoted to a higher priority
+			if Item.Started or Item.Future.done() or Priority != Item.Priority:
+				continue
+			Delay = self.Bucket(Item.Route).Take()
+			if Delay > 0:
+				# ⏳ Park the job instead of the worker so other routes keep flowing
+				self.Park(Item, Delay)
+				continue
+			Item.Started = True
+			if self.Coalescing.get(Item.CoalesceKey) is Item:
+				del self.Coalescing[Item.CoalesceKey]
+			try:
+				Result = await Item.Factory()
+			except discord.HTTPException as E:
+				if E.status == 429 and Item.Attempts < MaxRateLimitRetries:
+					Item.Attempts += 1
+					Item.Started = False
+					Delay = self.Bucket(Item.Route).Sync(E.response.headers)
+					Logger.warning(f'Rate limited on {Item.Route[0]}, retrying in {Delay:.1f}s')
+					self.Park(Item, Delay)
+				elif not Item.Future.done():
+					Item.Future.set_exception(E)
+			except asyncio.CancelledError as E:
+				if not Item.Future.done():
+					Item.Future.set_exception(E)
+				# 🛑 Only stop when this worker is being cancelled, not when a job's inner task was
+				if asyncio.current_task().cancelling():
+					raise
+				Logger.warning(f'Job on {Item.Route[0]} was cancelled')
+			except Exception as E:
+				if not Item.Future.done():
+					Item.Future.set_exception(E)
+			else:
+				if not Item.Future.done():
+					Item.Future.set_result(Result)
+
+	def Park(self, Item: Job, Delay: float) -> None:
+		Item.Parked = Item.Priority
+		self.Depth[Item.Parked] += 1
+		asyncio.get_running_loop().call_later(Delay, self.Requeue, Item)
+
+	def Requeue(self, Item: Job) -> None:
+		# 🔢 Account against the priority it was parked under; a coalesced submit may have raised it
+		self.Depth[Item.Parked] -= 1
+		Item.Parked = None
+		self.Enqueue(Item)
@@ -0,0 +1,141 @@
+# 📦 Built-in modules
+from collections import OrderedDict
+import asyncio
+import json
+import os
+import re
+
+# 📥 Custom modules
+from Utils.LazyImport import LazyModule
+from Utils.Logger import Logger
+
+# 💡 openai is heavy and only needed when a task is formatted, so import it on first use
+openai = LazyModule('openai')
+
+Prompt = """
+Format this to-do item for a Discord bot's to-do list. Return ONLY valid JSON with this structure:
+{{
+    "title": "Short catchy title with relevant emoji (max 80 chars)",
+    "description": "2-3 lines explaining the task clearly"
+}}
+
+Priority level: {Priority}
+Raw task: {RawText}
+
+Rules:
+- Title must start with a relevant emoji (e.g., 🎮 for gaming, 📝 for documentation, 🔧 for fixes)
+- Title should be concise and action-oriented
+- Description should be clear and specific (2-3 short sentences)
+- Use professional but friendly tone
+- NO markdown formatting in the JSON values themselves
+- Return ONLY the JSON, nothing else
+- Return in english
+"""
+
+# 🏷️ Keyword -> emoji for the offline fallback, first match wins
+FallbackEmojis = [
+	(('fix', 'bug', 'crash', 'error', 'broken'), '🔧'),
+	(('doc', 'readme', 'wiki', 'write'), '📝'),
+	(('test',), '🧪'),
+	(('game', 'minecraft', 'server', 'plugin', 'mod'), '🎮'),
+	(('command', 'bot', 'slash'), '🤖'),
+	(('role', 'permission', 'ban', 'moderat'), '🛡️'),
+	(('event', 'giveaway', 'contest'), '🎉'),
+	(('design', 'image', 'logo', 'banner'), '🎨'),
+	(('fast', 'slow', 'performance', 'lag'), '⚡'),
+]
+PriorityEmojis = {'high': '🔥', 'medium': '📌', 'low': '📋'}
+
+SentenceEnd = re.compile(r'(?<=[.!?])\s+')
+CodeFence = re.compile(r'^```(?:json)?\s*|\s*```$')
+
+
+# 💡 Deterministic formatting used when the API is unavailable, slow or returns garbage
+def FallbackFormat(RawText: str, Priority: str) -> dict[str, str]:
+	Text = ' '.join(RawText.split())
+	Lowered = Text.lower()
+	Emoji = next(
+		(Emoji for Words, Emoji in FallbackEmojis if any(Word in Lowered for Word in Words)),
+		PriorityEmojis.get(Priority, '📋'),
+	)
+	First, *Rest = SentenceEnd.split(Text, maxsplit=1) or ['']
+	Title = First.rstrip('.!?')
+	if len(Title) > 75:
+		Title = Title[:74].rsplit(' ', 1)[0] + '…'
+	Description = Rest[0] if Rest else Text
+	Description = Description[:1].upper() + Description[1:]
+	return {'title': f'{Emoji} {Title[:1].upper()}{Title[1:]}', 'description': Description[:300]}
+
+
+def ParseResponse(Text: str) -> dict[str, str]:
+	Formatted = json.loads(CodeFence.sub('', Text.strip()))
+	if not isinstance(Formatted.get('title'), str) or not isinstance(
+		Formatted.get('description'), str
+	):
+		raise ValueError('Response is missing title or description')
+	return {'title': Formatted['title'], 'description': Formatted['description']}
+
+
+# 💡 Async OpenAI formatting with a hard deadline, bounded concurrency and an LRU cache
+class TaskFormatter:
+	def __init__(
+		self,
+		Model: str = 'gpt-4.1-nano',
+		Timeout: float = 8.0,
+		Concurrency: int = 2,
+		CacheSize: int = 256,
+	) -> None:
+		self.Model = Model
+		self.Timeout = Timeout
+		self.Semaphore = asyncio.Semaphore(Concurrency)
+		self.CacheSize = CacheSize
+		# 🗂️ (raw text, priority) -> formatted task, oldest first
+		self.Cache = OrderedDict()
+		self.Client = None
+
+	# 🔌 Created on first use; honours OPENAI_BASE_URL, so a local stand-in server can replace the API
+	def GetClient(self):
+		if self.Client is None and os.getenv('OPENAI_API_KEY'):
+			self.Client = openai.AsyncOpenAI(
+				api_key=os.getenv('OPENAI_API_KEY'),
+				timeout=self.Timeout,
+				max_retries=0,
+			)
+		return self.Client
+
+	async def Request(self, Client, RawText: str, Priority: str) -> dict[str, str]:
+		# ⏳ Waiting for a free slot counts towards the deadline too
+		async with self.Semaphore:
+			Response = await Client.chat.completions.create(
+				model=self.Model,
+				messages=[
+					{'role': 'user', 'content': Prompt.format(Priority=Priority, RawText=RawText)}
+				],
+				max_tokens=200,
+				temperature=0.7,
+			)
+		return ParseResponse(Response.choices[0].message.content)
+
+	async def Format(self, RawText: str, Priority: str) -> dict[str, str]:
+		Key = (RawText, Priority)
+		if Key in self.Cache:
+			self.Cache.move_to_end(Key)
+			return dict(self.Cache[Key])
+
+		Client = self.GetClient()
+		if Client is None:
+			Logger.warning('OpenAI API key not configured, using fallback task formatting')
+			return FallbackFormat(RawText, Priority)
+		try:
+			Formatted = await asyncio.wait_for(
+				self.Request(Client, RawText, Priority), self.Timeout
+			)
+		except Exception as E:
+			# 🔁 Not cached, so the next attempt asks the API again
+			Logger.warning(f'AI task formatting failed ({type(E).__name__}: {E}), using fallback')
+			return FallbackFormat(RawText, Priority)
+
+		self.Cache[Key] = Formatted
+		if len(self.Cache) > self.CacheSize:
+			self.Cache.popitem(last=False)
+		return dict(Formatted)
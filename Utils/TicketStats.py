@@ -0,0 +1,116 @@
+# 📦 Built-in modules
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import Any
+import bisect
+
+# ⏱️ Upper bounds (seconds) of the latency buckets; anything slower lands in the last, open bucket
+Buckets = (300, 900, 1800, 3600, 4 * 3600, 12 * 3600, 86400, 3 * 86400, 7 * 86400)
+
+
+# 💡 Histogram over the most recent samples: bucket counts and the sum are adjusted as samples
+# enter and leave the window, so reading it never touches the samples themselves
+class RollingHistogram:
+	def __init__(self, Window: int) -> None:
+		self.Window = Window
+		# 🗂️ Sample key (channel ID) -> seconds, oldest first
+		self.Samples = OrderedDict()
+		self.Counts = [0] * (len(Buckets) + 1)
+		self.Sum = 0.0
+
+	def __len__(self) -> int:
+		return len(self.Samples)
+
+	def Add(self, Key: int, Seconds: float) -> None:
+		"""Add a sample, replacing the one already held under the same key."""
+		self.Remove(Key)
+		if len(self.Samples) == self.Window:
+			self.Remove(next(iter(self.Samples)))
+		self.Samples[Key] = Seconds
+		self.Counts[bisect.bisect_left(Buckets, Seconds)] += 1
+		self.Sum += Seconds
+
+	def Remove(self, Key: int) -> None:
+		Seconds = self.Samples.pop(Key, None)
+		if Seconds is not None:
+			self.Counts[bisect.bisect_left(Buckets, Seconds)] -= 1
+			self.Sum -= Seconds
+
+	def Mean(self) -> float | None:
+		return self.Sum / len(self.Samples) if self.Samples else None
+
+	def Percentile(self, Fraction: float) -> float | None:
+		"""Upper bound of the bucket holding the given fraction of samples (None for the open bucket)."""
+		Target = Fraction * len(self.Samples)
+		Seen = 0
+		for Index, Count in enumerate(self.Counts):
+			Seen += Count
+			if Count and Seen >= Target:
+				return Buckets[Index] if Index < len(Buckets) else None
+		return None
+
+
+# 📊 Running ticket aggregates, updated by the ticket store on every change
+class TicketStats:
+	def __init__(self, Window: int = 200) -> None:
+		self.Window = Window
+		# 🗂️ Ticket type / status -> number of tickets currently in the store
+		self.ByType = Counter()
+		self.ByStatus = Counter()
+		# ⏱️ Latency from creation over all tickets, and per handler ID (None when nobody claimed it)
+		self.ClaimLatency = RollingHistogram(Window)
+		self.CloseLatency = RollingHistogram(Window)
+		self.ClaimByHandler = {}
+		self.CloseByHandler = {}
+		# 🔁 Channel ID -> {kind: (event time, handler)} of its current samples; each ticket holds
+		# one claim and one close sample, so replays are harmless and a new close replaces the old
+		self.Seen = {}
+
+	def Count(self, Ticket: dict[str, Any], Delta: int) -> None:
+		for Counts, Key in (
+			(self.ByType, Ticket.get('type')),
+			(self.ByStatus, Ticket.get('status')),
+		):
+			Counts[Key] += Delta
+			if Counts[Key] <= 0:
+				del Counts[Key]
+
+	def Observe(self, Ticket: dict[str, Any]) -> None:
+		"""Sample the claim and close latency of a ticket that has reached those states."""
+		if not Ticket.get('created_at'):
+			return
+		if Ticket.get('claimed_by') and Ticket.get('claimed_at'):
+			self.Sample('claim', Ticket, Ticket['claimed_at'], Ticket['claimed_by'])
+		if Ticket.get('status') == 'Closed' and Ticket.get('closed_at'):
+			Handler = Ticket.get('claimed_by') or Ticket.get('assigned_to')
+			self.Sample('close', Ticket, Ticket['closed_at'], Handler)
+
+	def Sample(self, Kind: str, Ticket: dict[str, Any], At: str, Handler: int | None) -> None:
+		ChannelId = Ticket['channel_id']
+		Seen = self.Seen.setdefault(ChannelId, {})
+		if Seen.get(Kind) == (At, Handler):
+			return
+		Overall, ByHandler = (
+			(self.ClaimLatency, self.ClaimByHandler)
+			if Kind == 'claim'
+			else (self.CloseLatency, self.CloseByHandler)
+		)
+		if Kind in Seen:
+			# 🔁 Replaces the ticket's earlier sample, which may sit under another handler
+			Previous = ByHandler.get(Seen[Kind][1])
+			if Previous is not None:
+				Previous.Remove(ChannelId)
+		Seen[Kind] = (At, Handler)
+		Seconds = (
+			datetime.fromisoformat(At) - datetime.fromisoformat(Ticket['created_at'])
+		).total_seconds()
+		Seconds = max(Seconds, 0.0)
+		Overall.Add(ChannelId, Seconds)
+		Histogram = ByHandler.get(Handler)
+		if Histogram is None:
+			Histogram = ByHandler[Handler] = RollingHistogram(self.Window)
+		Histogram.Add(ChannelId, Seconds)
+
+	def Forget(self, ChannelId: int) -> None:
+		# 🧹 A deleted ticket's events can't be replayed any more; its samples stay in the histograms
+		self.Seen.pop(ChannelId, None)
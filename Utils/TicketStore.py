@@ -0,0 +1,306 @@
+# 📦 Built-in modules
+from datetime import datetime, timedelta
+from typing import Any
+import asyncio
+import heapq
+import json
+import os
+
+# 📥 Custom modules
+from Utils.TodoRepository import WriteAtomic
+from Utils.TicketStats import TicketStats
+from Utils.Logger import Logger
+
+
+# 📝 Append one journal record and make it durable before returning
+def AppendLine(Path: str, Line: str) -> None:
+	with open(Path, 'a', encoding='utf-8') as File:
+		File.write(Line + '\n')
+		File.flush()
+		os.fsync(File.fileno())
+
+
+# 💡 Tickets held in memory and indexed; changes go to an append-only journal that is
+# periodically compacted into the tickets.json snapshot
+class TicketStore:
+	def __init__(
+		self,
+		Path: str,
+		JournalPath: str,
+		CounterPath: str,
+		CompactEvery: int = 500,
+		Retention: timedelta = timedelta(days=7),
+		StatsWindow: int = 200,
+	) -> None:
+		self.Path = Path
+		self.JournalPath = JournalPath
+		self.CounterPath = CounterPath
+		self.CompactEvery = CompactEvery
+		# 🗂️ Channel ID -> ticket (the primary index)
+		self.Tickets = {}
+		# 🗂️ User ID -> {channel ID, ...} of the tickets they created
+		self.ByUser = {}
+		# 🗂️ Ticket number -> channel ID
+		self.ByNumber = {}
+		# 🗂️ User ID -> creation time of their newest ticket (parsed once, for the cooldown check)
+		self.LastCreated = {}
+		# ⏰ Min-heap of (deletion due time, channel ID) for closed tickets; entries made stale by a
+		# reopen, a later close or a delete are skipped when they reach the top
+		self.Retention = Retention
+		self.Expiry = []
+		# 🔁 Channel ID -> (retry time, attempts) for deletions that failed and were pushed back
+		self.Postponed = {}
+		# 🔔 Set when a ticket becomes due earlier than everything else in the heap
+		self.ExpiryChanged = asyncio.Event()
+		# 📊 Counts and latency histograms, kept current by every change below
+		self.Stats = TicketStats(StatsWindow)
+		# 🔢 Next ticket number to hand out; only ever moves forward, so numbers are never reused
+		self.NextNumber = 1
+		self.JournalLength = 0
+		# 🛡️ False while an unreadable snapshot is still in place; it must never be overwritten
+		self.SnapshotWritable = True
+		self.Lock = asyncio.Lock()
+
+	# <-- Loading -->
+
+	def Load(self) -> None:
+		"""Read the snapshot, replay the journal on top of it and compact if anything was replayed."""
+		if os.path.exists(self.CounterPath):
+			try:
+				with open(self.CounterPath, 'r', encoding='utf-8') as File:
+					self.NextNumber = max(self.NextNumber, json.load(File).get('next_num', 1))
+			except (OSError, ValueError) as E:
+				Logger.error(f'Error loading {self.CounterPath}: {E}')
+		if os.path.exists(self.Path):
+			try:
+				with open(self.Path, 'r', encoding='utf-8') as File:
+					for Ticket in json.load(File):
+						self.Put(Ticket)
+			except (OSError, ValueError, KeyError, TypeError) as E:
+				Logger.error(f'Error loading {self.Path}: {E}')
+				# 📦 Keep the unreadable file, so compaction can't replace it with journal-only tickets
+				self.SnapshotWritable = self.SetAside(self.Path)
+		if os.path.exists(self.JournalPath):
+			with open(self.JournalPath, 'r', encoding='utf-8') as File:
+				for Line in File:
+					try:
+						self.Replay(json.loads(Line))
+						self.JournalLength += 1
+					except ValueError:
+						# ✂️ Only the last line can be torn by a crash mid-write; nothing after it was acknowledged
+						Logger.warning(f'Skipping unreadable journal line in {self.JournalPath}')
+		# 🧹 Always start from an empty journal, so a torn line is never glued to the next record
+		if self.SnapshotWritable and (
+			self.JournalLength
+			or os.path.exists(self.JournalPath)
+			and os.path.getsize(self.JournalPath)
+		):
+			self.WriteSnapshot()
+
+	def SetAside(self, Path: str) -> bool:
+		"""Move an unreadable file to <path>.corrupt-<timestamp>; False if it is still in place."""
+		Target = f'{Path}.corrupt-{datetime.now():%Y%m%d-%H%M%S}'
+		try:
+			os.replace(Path, Target)
+		except OSError as E:
+			Logger.error(f'Could not move unreadable {Path} aside, not compacting into it: {E}')
+			return False
+		Logger.error(f'Moved unreadable {Path} to {Target}')
+		return True
+
+	def Replay(self, Record: dict[str, Any]) -> None:
+		# 💡 Every operation is idempotent, so replaying a journal that was already compacted is harmless
+		if Record['op'] == 'put':
+			self.Put(Record['ticket'])
+		elif Record['op'] == 'update':
+			self.Patch(Record['channel_id'], Record['updates'])
+		elif Record['op'] == 'delete':
+			self.Drop(Record['channel_id'])
+			self.Stats.Forget(Record['channel_id'])
+		elif Record['op'] == 'counter':
+			self.NextNumber = max(self.NextNumber, Record['next_num'])
+
+	# <-- Reads -->
+
+	def Get(self, ChannelId: int) -> dict[str, Any] | None:
+		return self.Tickets.get(ChannelId)
+
+	def GetByNumber(self, TicketNum: int) -> dict[str, Any] | None:
+		ChannelId = self.ByNumber.get(TicketNum)
+		return None if ChannelId is None else self.Tickets.get(ChannelId)
+
+	def ForUser(self, UserId: int) -> list[dict[str, Any]]:
+		return [self.Tickets[ChannelId] for ChannelId in self.ByUser.get(UserId, ())]
+
+	def LastCreatedAt(self, UserId: int) -> datetime | None:
+		return self.LastCreated.get(UserId)
+
+	def DueAt(self, Ticket: dict[str, Any]) -> datetime | None:
+		"""When a closed ticket is due for deletion (older data without closed_at falls back to created_at)."""
+		if Ticket.get('status') != 'Closed':
+			return None
+		ClosedAt = Ticket.get('closed_at') or Ticket.get('created_at')
+		return datetime.fromisoformat(ClosedAt) + self.Retention if ClosedAt else None
+
+	def NextExpiry(self) -> datetime | None:
+		return self.Expiry[0][0] if self.Expiry else None
+
+	def PopExpired(self, Now: datetime) -> list[dict[str, Any]]:
+		"""Remove and return every heap entry that is due, keeping only those still valid."""
+		Expired = []
+		while self.Expiry and self.Expiry[0][0] <= Now:
+			Due, ChannelId = heapq.heappop(self.Expiry)
+			Ticket = self.Tickets.get(ChannelId)
+			Scheduled = None if Ticket is None else self.DueAt(Ticket)
+			if Scheduled is None:
+				continue
+			# ⏳ A postponed deletion is only valid at its retry time, not at the original one
+			Postponed = self.Postponed.get(ChannelId)
+			if Due == (Postponed[0] if Postponed else Scheduled):
+				Expired.append(Ticket)
+		return Expired
+
+	def Postpone(
+		self, ChannelId: int, Now: datetime, BaseDelay: timedelta, MaxDelay: timedelta
+	) -> datetime:
+		"""Retry a failed deletion later, backing off exponentially per ticket."""
+		Attempts = self.Postponed.get(ChannelId, (None, 0))[1] + 1
+		Due = Now + min(BaseDelay * 2 ** (Attempts - 1), MaxDelay)
+		self.Postponed[ChannelId] = (Due, Attempts)
+		heapq.heappush(self.Expiry, (Due, ChannelId))
+		return Due
+
+	def All(self) -> list[dict[str, Any]]:
+		return list(self.Tickets.values())
+
+	# <-- In-memory changes (index maintenance only, no I/O) -->
+
+	def Put(self, Ticket: dict[str, Any]) -> None:
+		self.Drop(Ticket['channel_id'])
+		self.Tickets[Ticket['channel_id']] = Ticket
+		self.ByUser.setdefault(Ticket['user_id'], set()).add(Ticket['channel_id'])
+		self.NoteCreated(Ticket)
+		self.ScheduleExpiry(Ticket)
+		self.Stats.Count(Ticket, 1)
+		self.Stats.Observe(Ticket)
+		if Ticket.get('ticket_num') is not None:
+			self.ByNumber[Ticket['ticket_num']] = Ticket['channel_id']
+			# 💡 Tickets from older data may be ahead of the stored counter
+			self.NextNumber = max(self.NextNumber, Ticket['ticket_num'] + 1)
+
+	def ScheduleExpiry(self, Ticket: dict[str, Any]) -> None:
+		Due = self.DueAt(Ticket)
+		if Due is None:
+			return
+		if not self.Expiry or Due < self.Expiry[0][0]:
+			self.ExpiryChanged.set()
+		heapq.heappush(self.Expiry, (Due, Ticket['channel_id']))
+
+	def NoteCreated(self, Ticket: dict[str, Any]) -> None:
+		if not Ticket.get('created_at'):
+			return
+		CreatedAt = datetime.fromisoformat(Ticket['created_at'])
+		Last = self.LastCreated.get(Ticket['user_id'])
+		if Last is None or CreatedAt > Last:
+			self.LastCreated[Ticket['user_id']] = CreatedAt
+
+	def Patch(self, ChannelId: int, Updates: dict[str, Any]) -> dict[str, Any] | None:
+		Ticket = self.Tickets.get(ChannelId)
+		if Ticket is None:
+			return None
+		# 🔢 Indexed fields are never patched, only status/handler fields, so the indexes stay valid
+		self.Stats.Count(Ticket, -1)
+		Ticket.update(Updates)
+		self.Stats.Count(Ticket, 1)
+		if 'status' in Updates or 'closed_at' in Updates:
+			self.Postponed.pop(ChannelId, None)
+			self.ScheduleExpiry(Ticket)
+		if 'claimed_at' in Updates or 'closed_at' in Updates:
+			self.Stats.Observe(Ticket)
+		return Ticket
+
+	def Drop(self, ChannelId: int) -> dict[str, Any] | None:
+		Ticket = self.Tickets.pop(ChannelId, None)
+		if Ticket is None:
+			return None
+		self.Postponed.pop(ChannelId, None)
+		self.Stats.Count(Ticket, -1)
+		Channels = self.ByUser.get(Ticket['user_id'])
+		if Channels is not None:
+			Channels.discard(ChannelId)
+			if not Channels:
+				del self.ByUser[Ticket['user_id']]
+		# 🔁 Only the user's remaining tickets count, as before; a rescan of just their tickets
+		self.LastCreated.pop(Ticket['user_id'], None)
+		for Other in self.ForUser(Ticket['user_id']):
+			self.NoteCreated(Other)
+		if self.ByNumber.get(Ticket.get('ticket_num')) == ChannelId:
+			del self.ByNumber[Ticket['ticket_num']]
+		return Ticket
+
+	# <-- Mutations (memory first, so readers see them at once, then the journal) -->
+
+	async def AllocateNumber(self) -> int:
+		"""Hand out the next ticket number and persist the new high-water mark."""
+		# 🔒 Read and increment happen without an await in between, so concurrent creations
+		# can never get the same number; the journal lock then orders the persisted marks
+		Number = self.NextNumber
+		self.NextNumber += 1
+		await self.Journal({'op': 'counter', 'next_num': self.NextNumber})
+		return Number
+
+	async def Add(self, Ticket: dict[str, Any]) -> None:
+		self.Put(Ticket)
+		await self.Journal({'op': 'put', 'ticket': Ticket})
+
+	async def Update(self, ChannelId: int, Updates: dict[str, Any]) -> dict[str, Any] | None:
+		Ticket = self.Patch(ChannelId, Updates)
+		if Ticket is not None:
+			await self.Journal({'op': 'update', 'channel_id': ChannelId, 'updates': Updates})
+		return Ticket
+
+	async def Delete(self, ChannelId: int) -> dict[str, Any] | None:
+		Ticket = self.Drop(ChannelId)
+		if Ticket is not None:
+			self.Stats.Forget(ChannelId)
+			await self.Journal({'op': 'delete', 'channel_id': ChannelId})
+		return Ticket
+
+	# <-- Persistence -->
+
+	async def Journal(self, Record: dict[str, Any]) -> None:
+		# 📸 Serialize on the loop so the record matches the change, write it off the loop
+		Line = json.dumps(Record, ensure_ascii=False)
+		async with self.Lock:
+			try:
+				await asyncio.to_thread(AppendLine, self.JournalPath, Line)
+			except Exception as E:
+				# 💾 The change is still in memory; the next compaction persists it
+				Logger.error(f'Error writing ticket journal: {E}')
+			self.JournalLength += 1
+			if self.JournalLength >= self.CompactEvery:
+				await self.Compact()
+
+	async def Compact(self) -> None:
+		if not self.SnapshotWritable:
+			return
+		Text = json.dumps(self.All(), indent=2, ensure_ascii=False)
+		try:
+			await asyncio.to_thread(self.WriteSnapshot, Text, self.NextNumber)
+		except Exception as E:
+			Logger.error(f'Error compacting ticket journal: {E}')
+
+	def WriteSnapshot(self, Text: str | None = None, NextNumber: int | None = None) -> None:
+		"""Write the full snapshot and counter, then empty the journal they now contain."""
+		if Text is None:
+			Text = json.dumps(self.All(), indent=2, ensure_ascii=False)
+		WriteAtomic(self.Path, Text)
+		WriteAtomic(self.CounterPath, json.dumps({'next_num': NextNumber or self.NextNumber}))
+		with open(self.JournalPath, 'w', encoding='utf-8'):
+			pass
+		self.JournalLength = 0
+
+	async def Close(self) -> None:
+		async with self.Lock:
+			if self.JournalLength:
+				await self.Compact()
@@ -0,0 +1,351 @@
+# 📦 Built-in modules
+from typing import Any
+import sqlite3
+import asyncio
+import json
+import os
+
+# 📥 Custom modules
+from Utils.TodoRepository import MaxId, MigrateTodoData, TodoRepository
+from Utils.Logger import Logger
+
+# 💡 Rows are ordered by ID: IDs only ever grow, so insertion order is display order
+Schema = """
+CREATE TABLE IF NOT EXISTS meta (
+	key TEXT PRIMARY KEY,
+	value TEXT
+);
+CREATE TABLE IF NOT EXISTS channels (
+	channel_id INTEGER PRIMARY KEY,
+	current_page INTEGER NOT NULL DEFAULT 0,
+	message_ids TEXT NOT NULL DEFAULT '[]'
+);
+CREATE TABLE IF NOT EXISTS pages (
+	id INTEGER PRIMARY KEY,
+	channel_id INTEGER NOT NULL REFERENCES channels (channel_id) ON DELETE CASCADE,
+	title TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+	id INTEGER PRIMARY KEY,
+	page_id INTEGER NOT NULL REFERENCES pages (id) ON DELETE CASCADE,
+	priority TEXT,
+	title TEXT,
+	description TEXT,
+	author_id INTEGER,
+	author_name TEXT,
+	extra TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS assignments (
+	item_id INTEGER PRIMARY KEY REFERENCES items (id) ON DELETE CASCADE,
+	assigned_to_id INTEGER NOT NULL,
+	assigned_to_name TEXT,
+	assigned_by_id INTEGER,
+	assigned_by_name TEXT,
+	assigned_at TEXT
+);
+CREATE INDEX IF NOT EXISTS pages_by_channel ON pages (channel_id, id);
+CREATE INDEX IF NOT EXISTS items_by_page ON items (page_id, id);
+CREATE INDEX IF NOT EXISTS assignments_by_user ON assignments (assigned_to_id);
+"""
+
+ItemColumns = ('id', 'priority', 'title', 'description', 'author_id', 'author_name')
+AssignmentColumns = (
+	'assigned_to_id',
+	'assigned_to_name',
+	'assigned_by_id',
+	'assigned_by_name',
+	'assigned_at',
+)
+
+UpsertChannel = (
+	'INSERT INTO channels (channel_id, current_page, message_ids) VALUES (?, ?, ?) '
+	'ON CONFLICT (channel_id) DO UPDATE SET '
+	'current_page = excluded.current_page, message_ids = excluded.message_ids'
+)
+UpsertItem = (
+	'INSERT INTO items '
+	'(id, page_id, priority, title, description, author_id, author_name, extra) '
+	'VALUES (?, ?, ?, ?, ?, ?, ?, ?) '
+	'ON CONFLICT (id) DO UPDATE SET '
+	'page_id = excluded.page_id, priority = excluded.priority, title = excluded.title, '
+	'description = excluded.description, author_id = excluded.author_id, '
+	'author_name = excluded.author_name, extra = excluded.extra'
+)
+UpsertAssignment = (
+	'INSERT OR REPLACE INTO assignments '
+	'(item_id, assigned_to_id, assigned_to_name, assigned_by_id, assigned_by_name, assigned_at) '
+	'VALUES (?, ?, ?, ?, ?, ?)'
+)
+
+
+def PageRow(Page: dict[str, Any], ChannelId) -> tuple[str, tuple]:
+	return 'INSERT INTO pages (id, channel_id, title) VALUES (?, ?, ?)', (
+		Page['id'],
+		int(ChannelId),
+		Page['title'],
+	)
+
+
+def Connect(Path: str) -> sqlite3.Connection:
+	Directory = os.path.dirname(Path)
+	if Directory:
+		os.makedirs(Directory, exist_ok=True)
+	# 💡 Only ever used from one flush at a time (serialized by the repository's FlushLock)
+	Connection = sqlite3.connect(Path, check_same_thread=False)
+	Connection.execute('PRAGMA journal_mode=WAL')
+	Connection.execute('PRAGMA synchronous=NORMAL')
+	Connection.execute('PRAGMA foreign_keys=ON')
+	Connection.executescript(Schema)
+	return Connection
+
+
+# 💡 Same in-memory repository, but every mutation is persisted as a handful of row writes
+class SqliteTodoRepository(TodoRepository):
+	def __init__(self, Path: str, JsonPath: str | None = None, FlushDelay: float = 2.0) -> None:
+		super().__init__(Path, FlushDelay)
+		self.JsonPath = JsonPath
+		self.Connection = None
+		# 📝 (sql, params) statements waiting for the next flush, in mutation order
+		self.Pending = []
+
+	# <-- Loading -->
+
+	def Load(self) -> None:
+		try:
+			self.Connection = Connect(self.Path)
+			Imported = self.Connection.execute("SELECT 1 FROM meta WHERE key = 'json_imported'")
+			if Imported.fetchone() is None:
+				self.ImportJson()
+			self.Data = self.ReadAll()
+		except Exception as E:
+			Logger.error(f'Error loading to-do database: {E}')
+			return
+		self.NextId = MaxId(self.Data) + 1
+		self.Reindex()
+
+	# 📥 One-time import of the legacy JSON document
+	def ImportJson(self) -> None:
+		Data = {'channels': {}}
+		if self.JsonPath and os.path.exists(self.JsonPath):
+			with open(self.JsonPath, 'r', encoding='utf-8') as File:
+				Data, _ = MigrateTodoData(json.load(File))
+		Statements = []
+		for ChannelId, ChannelData in Data['channels'].items():
+			Statements.append(self.ChannelRow(ChannelId, ChannelData))
+			for Page in ChannelData['pages']:
+				Statements.append(PageRow(Page, ChannelId))
+				for Item in Page['items']:
+					Statements.extend(self.ItemRows(Page['id'], Item))
+		with self.Connection:
+			for Sql, Params in Statements:
+				self.Connection.execute(Sql, Params)
+			self.Connection.execute("INSERT INTO meta (key, value) VALUES ('json_imported', '1')")
+		Logger.info(f'Imported {len(Data["channels"])} to-do channel(s) into {self.Path}')
+
+	def ReadAll(self) -> dict[str, Any]:
+		Data = {'channels': {}}
+		Pages = {}
+		for ChannelId, CurrentPage, MessageIds in self.Connection.execute(
+			'SELECT channel_id, current_page, message_ids FROM channels'
+		):
+			Data['channels'][str(ChannelId)] = {
+				'message_ids': json.loads(MessageIds),
+				'current_page': CurrentPage,
+				'pages': [],
+			}
+		for Id, ChannelId, Title in self.Connection.execute(
+			'SELECT id, channel_id, title FROM pages ORDER BY channel_id, id'
+		):
+			Pages[Id] = {'id': Id, 'title': Title, 'items': []}
+			Data['channels'][str(ChannelId)]['pages'].append(Pages[Id])
+		for Row in self.Connection.execute(
+			'SELECT items.id, priority, title, description, author_id, author_name, extra, page_id, '
+			'assigned_to_id, assigned_to_name, assigned_by_id, assigned_by_name, assigned_at '
+			'FROM items LEFT JOIN assignments ON assignments.item_id = items.id '
+			'ORDER BY page_id, items.id'
+		):
+			Item = dict(zip(ItemColumns, Row[:6]))
+			Item.update(json.loads(Row[6]))
+			Item.update(zip(AssignmentColumns, Row[8:]))
+			Pages[Row[7]]['items'].append(Item)
+		return Data
+
+	# <-- Row statements -->
+
+	@staticmethod
+	def ChannelRow(ChannelId, ChannelData: dict[str, Any]) -> tuple[str, tuple]:
+		return UpsertChannel, (
+			int(ChannelId),
+			ChannelData.get('current_page', 0),
+			json.dumps(ChannelData.get('message_ids', [])),
+		)
+
+	@staticmethod
+	def ItemRows(PageId: int, Item: dict[str, Any]) -> list[tuple[str, tuple]]:
+		Extra = {
+			Key: Value
+			for Key, Value in Item.items()
+			if Key not in ItemColumns and Key not in AssignmentColumns
+		}
+		Values = (
+			Item['id'],
+			PageId,
+			*(Item.get(Column) for Column in ItemColumns[1:]),
+			json.dumps(Extra, ensure_ascii=False),
+		)
+		return [(UpsertItem, Values), SqliteTodoRepository.AssignmentRow(Item)]
+
+	@staticmethod
+	def AssignmentRow(Item: dict[str, Any]) -> tuple[str, tuple]:
+		if Item.get('assigned_to_id') is None:
+			return 'DELETE FROM assignments WHERE item_id = ?', (Item['id'],)
+		return UpsertAssignment, (Item['id'], *(Item.get(Column) for Column in AssignmentColumns))
+
+	def Record(self, *Statements: tuple[str, tuple]) -> None:
+		self.Pending.extend(Statements)
+		self.MarkDirty()
+
+	def RecordChannel(self, ChannelId: int) -> None:
+		self.Record(self.ChannelRow(ChannelId, self.Data['channels'][str(ChannelId)]))
+
+	# <-- Mutations (in-memory change first, then the matching row writes) -->
+
+	def Channel(self, ChannelId: int) -> dict[str, Any]:
+		if str(ChannelId) not in self.Data['channels']:
+			# 💡 The channel row has to exist before its default page is inserted
+			self.Record(self.ChannelRow(ChannelId, {}))
+		return super().Channel(ChannelId)
+
+	def SetCurrentPage(self, ChannelId: int, PageIndex: int) -> bool:
+		if not super().SetCurrentPage(ChannelId, PageIndex):
+			return False
+		self.RecordChannel(ChannelId)
+		return True
+
+	def SetMessageIds(self, ChannelId: int, MessageIds: list[int]) -> None:
+		super().SetMessageIds(ChannelId, MessageIds)
+		self.RecordChannel(ChannelId)
+
+	def AddPage(self, ChannelId: int, Title: str) -> dict[str, Any]:
+		Page = super().AddPage(ChannelId, Title)
+		self.Record(PageRow(Page, ChannelId))
+		self.RecordChannel(ChannelId)
+		return Page
+
+	def RenamePage(self, ChannelId: int, PageIndex: int, Title: str) -> str | None:
+		OldTitle = super().RenamePage(ChannelId, PageIndex, Title)
+		if OldTitle is not None:
+			Page = self.Pages(ChannelId)[PageIndex]
+			self.Record(('UPDATE pages SET title = ? WHERE id = ?', (Title, Page['id'])))
+		return OldTitle
+
+	def DeletePage(self, ChannelId: int, PageIndex: int) -> dict[str, Any] | None:
+		Page = super().DeletePage(ChannelId, PageIndex)
+		if Page is not None:
+			# 🧹 Items and assignments go with it (ON DELETE CASCADE)
+			self.Record(('DELETE FROM pages WHERE id = ?', (Page['id'],)))
+			self.RecordChannel(ChannelId)
+		return Page
+
+	def AddItem(self, ChannelId: int, PageIndex: int, Item: dict[str, Any]) -> None:
+		super().AddItem(ChannelId, PageIndex, Item)
+		self.Record(*self.ItemRows(self.Pages(ChannelId)[PageIndex]['id'], Item))
+
+	def ReplaceItem(
+		self, ChannelId: int, PageIndex: int, ItemIndex: int, Item: dict[str, Any]
+	) -> bool:
+		if not super().ReplaceItem(ChannelId, PageIndex, ItemIndex, Item):
+			return False
+		self.Record(*self.ItemRows(self.Pages(ChannelId)[PageIndex]['id'], Item))
+		return True
+
+	def RemoveItems(
+		self, ChannelId: int, PageIndex: int, ItemIndices: list[int]
+	) -> list[dict[str, Any]]:
+		Removed = super().RemoveItems(ChannelId, PageIndex, ItemIndices)
+		if Removed:
+			self.Record(*(('DELETE FROM items WHERE id = ?', (Item['id'],)) for Item in Removed))
+		return Removed
+
+	def ClearPage(self, ChannelId: int, PageIndex: int) -> bool:
+		if not super().ClearPage(ChannelId, PageIndex):
+			return False
+		Page = self.Pages(ChannelId)[PageIndex]
+		self.Record(('DELETE FROM items WHERE page_id = ?', (Page['id'],)))
+		return True
+
+	def AssignItem(self, ChannelId: int, PageIndex: int, ItemIndex: int, User, Assigner=None):
+		Item = super().AssignItem(ChannelId, PageIndex, ItemIndex, User, Assigner)
+		if Item is not None:
+			self.Record(self.AssignmentRow(Item))
+		return Item
+
+	def UnassignItem(self, ChannelId: int, PageIndex: int, ItemIndex: int):
+		Item = super().UnassignItem(ChannelId, PageIndex, ItemIndex)
+		if Item is not None:
+			self.Record(self.AssignmentRow(Item))
+		return Item
+
+	def AddItems(self, ChannelId: int, PageIndex: int, Items: list[dict[str, Any]]) -> None:
+		super().AddItems(ChannelId, PageIndex, Items)
+		PageId = self.Pages(ChannelId)[PageIndex]['id']
+		self.Record(*(Row for Item in Items for Row in self.ItemRows(PageId, Item)))
+
+	def SetPriority(
+		self, ChannelId: int, PageIndex: int, ItemIndices: list[int], Priority: str
+	) -> list[dict[str, Any]]:
+		Changed = super().SetPriority(ChannelId, PageIndex, ItemIndices, Priority)
+		if Changed:
+			self.Record(
+				*(
+					('UPDATE items SET priority = ? WHERE id = ?', (Priority, Item['id']))
+					for Item in Changed
+				)
+			)
+		return Changed
+
+	def AssignItems(
+		self, ChannelId: int, PageIndex: int, ItemIndices: list[int], User, Assigner=None
+	) -> list[dict[str, Any]]:
+		Assigned = super().AssignItems(ChannelId, PageIndex, ItemIndices, User, Assigner)
+		if Assigned:
+			self.Record(*(self.AssignmentRow(Item) for Item in Assigned))
+		return Assigned
+
+	def ImportPages(self, ChannelId: int, Pages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+		Pages = super().ImportPages(ChannelId, Pages)
+		Statements = []
+		for Page in Pages:
+			Statements.append(PageRow(Page, ChannelId))
+			for Item in Page['items']:
+				Statements.extend(self.ItemRows(Page['id'], Item))
+		self.Record(*Statements)
+		return Pages
+
+	# <-- Write-behind persistence -->
+
+	def Apply(self, Statements: list[tuple[str, tuple]]) -> None:
+		with self.Connection:
+			for Sql, Params in Statements:
+				self.Connection.execute(Sql, Params)
+
+	async def Flush(self) -> None:
+		"""Apply every pending row write in one transaction."""
+		async with self.FlushLock:
+			self.Dirty = False
+			if not self.Pending or self.Connection is None:
+				return
+			Statements, self.Pending = self.Pending, []
+			try:
+				await asyncio.to_thread(self.Apply, Statements)
+			except Exception as E:
+				# 🔁 Keep them (in order) for the next attempt
+				self.Pending = Statements + self.Pending
+				self.Dirty = True
+				Logger.error(f'Error saving to-do data: {E}')
+
+	async def Close(self) -> None:
+		await super().Close()
+		if self.Connection is not None:
+			self.Connection.close()
+			self.Connection = None
@@ -0,0 +1,544 @@
+# 📦 Built-in modules
+from datetime import datetime, timezone
+from typing import Any, Iterable, Iterator
+import asyncio
+import json
+import os
+
+# 📥 Custom modules
+from Utils.Logger import Logger
+
+DefaultPageTitle = '📋 To-Do List'
+Priorities = ('high', 'medium', 'low')
+
+# 📏 Imported text is clamped to what the page modal and the task formatter produce, so one
+# record can't push a page's embed past Discord's limits
+PageTitleLimit = 100
+ItemTextLimits = {
+	'title': 100,
+	'description': 300,
+	'author_name': 100,
+	'assigned_to_name': 100,
+	'assigned_by_name': 100,
+	'assigned_at': 64,
+}
+ItemIdFields = ('author_id', 'assigned_to_id', 'assigned_by_id')
+
+
+# 💡 Bring any older on-disk layout up to the current multi-channel, page-based format
+def MigrateTodoData(Data: dict[str, Any]) -> tuple[dict[str, Any], bool]:
+	Changed = False
+
+	# 🔄 Old single-channel format -> multi-channel format
+	if 'channel_id' in Data or 'items' in Data:
+		Logger.info('Migrating old single-channel format to multi-channel format')
+		OldChannelId = Data.get('channel_id')
+		Migrated = {'channels': {}}
+		if OldChannelId:
+			Migrated['channels'][str(OldChannelId)] = {
+				'message_ids': Data.get('message_ids', []),
+				'items': Data.get('items', []),
+			}
+		Data = Migrated
+		Changed = True
+
+	if 'channels' not in Data:
+		Data['channels'] = {}
+		Changed = True
+
+	for ChannelId, ChannelData in Data['channels'].items():
+		# 👤 Items without author info
+		for Item in ChannelData.get('items', []):
+			if 'author_id' not in Item:
+				Item['author_id'] = None
+				Item['author_name'] = 'Unknown'
+				Changed = True
+
+		# 📄 Flat item list -> pages
+		if 'items' in ChannelData and 'pages' not in ChannelData:
+			Logger.info(f'Migrating channel {ChannelId} to page-based format')
+			ChannelData['pages'] = [{'title': DefaultPageTitle, 'items': ChannelData['items']}]
+			ChannelData['current_page'] = 0
+			del ChannelData['items']
+			Changed = True
+		if not ChannelData.get('pages'):
+			ChannelData['pages'] = [{'title': DefaultPageTitle, 'items': []}]
+			Changed = True
+		if ChannelData.get('current_page', 0) >= len(ChannelData['pages']) or (
+			'current_page' not in ChannelData
+		):
+			ChannelData['current_page'] = 0
+			Changed = True
+		ChannelData.setdefault('message_ids', [])
+
+		# 📌 Assignment fields
+		for Page in ChannelData['pages']:
+			for Item in Page.setdefault('items', []):
+				if 'assigned_to_id' not in Item:
+					Item['assigned_to_id'] = None
+					Item['assigned_to_name'] = None
+					Item['assigned_by_id'] = None
+					Item['assigned_by_name'] = None
+					Item['assigned_at'] = None
+					Changed = True
+
+	# 🆔 Stable IDs for pages and items, so storage backends can address single rows
+	NextId = MaxId(Data) + 1
+	for ChannelData in Data['channels'].values():
+		for Page in ChannelData['pages']:
+			for Entry in [Page, *Page['items']]:
+				if Entry.get('id') is None:
+					Entry['id'] = NextId
+					NextId += 1
+					Changed = True
+
+	return Data, Changed
+
+
+# 🔢 Highest page or item ID in use (pages and items share one ID sequence)
+def MaxId(Data: dict[str, Any]) -> int:
+	return max(
+		(
+			Entry.get('id') or 0
+			for ChannelData in Data['channels'].values()
+			for Page in ChannelData.get('pages', [])
+			for Entry in [Page, *Page.get('items', [])]
+		),
+		default=0,
+	)
+
+
+def SetAssignment(Item: dict[str, Any], User, Assigner=None) -> None:
+	Item['assigned_to_id'] = User.id
+	Item['assigned_to_name'] = User.display_name
+	Item['assigned_by_id'] = Assigner.id if Assigner else None
+	Item['assigned_by_name'] = Assigner.display_name if Assigner else None
+	Item['assigned_at'] = datetime.now(timezone.utc).isoformat()
+
+
+# 📄 Rebuild pages from NDJSON lines written by ExportRecords; returns (pages, skipped line count)
+def PagesFromNdjson(Lines: Iterable[str]) -> tuple[list[dict[str, Any]], int]:
+	Pages, Skipped = [], 0
+	for Line in Lines:
+		Line = Line.strip()
+		if not Line:
+			continue
+		try:
+			Record = json.loads(Line)
+		except ValueError:
+			Skipped += 1
+			continue
+		if not isinstance(Record, dict):
+			Skipped += 1
+		elif Record.get('type') == 'page':
+			Title = Record.get('title')
+			Title = Title if isinstance(Title, str) and Title.strip() else DefaultPageTitle
+			Pages.append({'title': Title[:PageTitleLimit], 'items': []})
+		elif Record.get('type') == 'item' and (Item := ItemFromRecord(Record)) is not None:
+			if not Pages:
+				Pages.append({'title': DefaultPageTitle, 'items': []})
+			Pages[-1]['items'].append(Item)
+		else:
+			Skipped += 1
+	return Pages, Skipped
+
+
+# 🧹 Only known keys with the right types; None when the record can't be a to-do item
+def ItemFromRecord(Record: dict[str, Any]) -> dict[str, Any] | None:
+	if Record.get('priority') not in Priorities:
+		return None
+	if not isinstance(Record.get('title'), str) or not Record['title'].strip():
+		return None
+	Item = {'priority': Record['priority']}
+	for Key in ItemIdFields:
+		Value = Record.get(Key)
+		# 🔢 bool is an int subclass, but never a valid user ID
+		if Value is not None and (not isinstance(Value, int) or isinstance(Value, bool)):
+			return None
+		Item[Key] = Value
+	for Key, Limit in ItemTextLimits.items():
+		Value = Record.get(Key)
+		if Value is not None and not isinstance(Value, str):
+			return None
+		Item[Key] = Value[:Limit] if Value is not None else None
+	Item['description'] = Item['description'] or ''
+	Item['author_name'] = Item['author_name'] or 'Unknown'
+	return Item
+
+
+# 💾 Write a file atomically: temp file in the same directory, then rename over the target
+def WriteAtomic(Path: str, Text: str) -> None:
+	Directory = os.path.dirname(Path)
+	if Directory:
+		os.makedirs(Directory, exist_ok=True)
+	TempPath = f'{Path}.tmp'
+	with open(TempPath, 'w', encoding='utf-8') as File:
+		File.write(Text)
+		File.flush()
+		os.fsync(File.fileno())
+	os.replace(TempPath, Path)
+
+
+# 💡 In-memory to-do data, loaded and migrated once, persisted by a write-behind flusher
+class TodoRepository:
+	def __init__(self, Path: str, FlushDelay: float = 2.0) -> None:
+		self.Path = Path
+		self.FlushDelay = FlushDelay
+		self.Data = {'channels': {}}
+		self.NextId = 1
+		# 🔢 Page ID -> version, bumped whenever the page's content changes (not persisted)
+		self.Versions = {}
+		# 🔢 Channel ID -> revision, bumped on every change that can shift page or item indices
+		self.Revisions = {}
+		# 🗂️ User ID -> {item ID: (channel ID, page, item)}, kept in step with every mutation
+		self.Assignments = {}
+		self.Dirty = False
+		self.FlushTask = None
+		self.FlushLock = asyncio.Lock()
+
+	# 📂 Read and migrate the JSON file (only called once, at cog load)
+	def Load(self) -> None:
+		if not os.path.exists(self.Path):
+			Logger.warning(f'To-do data file not found at {self.Path}. Starting fresh.')
+			return
+		try:
+			with open(self.Path, 'r', encoding='utf-8') as File:
+				self.Data, Changed = MigrateTodoData(json.load(File))
+		except Exception as E:
+			Logger.error(f'Error loading to-do data: {E}')
+			return
+		self.NextId = MaxId(self.Data) + 1
+		self.Reindex()
+		if Changed:
+			self.Dirty = True
+
+	def NewId(self) -> int:
+		Id = self.NextId
+		self.NextId += 1
+		return Id
+
+	# <-- Reads -->
+
+	def Channel(self, ChannelId: int) -> dict[str, Any]:
+		"""Get data for a channel, creating it if it doesn't exist."""
+		Key = str(ChannelId)
+		if Key not in self.Data['channels']:
+			self.Data['channels'][Key] = {'message_ids': [], 'current_page': 0, 'pages': []}
+			self.AddPage(ChannelId, DefaultPageTitle)
+		return self.Data['channels'][Key]
+
+	def Pages(self, ChannelId: int) -> list[dict[str, Any]]:
+		return self.Channel(ChannelId)['pages']
+
+	def CurrentPageIndex(self, ChannelId: int) -> int:
+		"""Index of the current page, repaired if the stored one is out of bounds."""
+		ChannelData = self.Channel(ChannelId)
+		if not ChannelData['pages']:
+			Logger.error(f'No pages found in channel {ChannelId}, creating default page')
+			self.AddPage(ChannelId, DefaultPageTitle)
+		elif not 0 <= ChannelData.get('current_page', 0) < len(ChannelData['pages']):
+			Logger.warning(
+				f'Invalid current_page index {ChannelData.get("current_page")} in channel {ChannelId}, resetting to 0'
+			)
+			self.SetCurrentPage(ChannelId, 0)
+		return ChannelData['current_page']
+
+	def CurrentPage(self, ChannelId: int) -> dict[str, Any]:
+		return self.Pages(ChannelId)[self.CurrentPageIndex(ChannelId)]
+
+	def Items(self, ChannelId: int, PageIndex: int) -> list[dict[str, Any]]:
+		Pages = self.Pages(ChannelId)
+		return Pages[PageIndex]['items'] if 0 <= PageIndex < len(Pages) else []
+
+	def Revision(self, ChannelId: int) -> int:
+		return self.Revisions.get(int(ChannelId), 0)
+
+	def FindItem(self, ChannelId: int, ItemId: int) -> tuple[int, int] | None:
+		"""(page index, item index) of an item by its stable ID, or None if it is gone."""
+		for PageIndex, Page in enumerate(self.Pages(ChannelId)):
+			for ItemIndex, Item in enumerate(Page['items']):
+				if Item.get('id') == ItemId:
+					return PageIndex, ItemIndex
+		return None
+
+	def PageVersion(self, ChannelId: int, PageIndex: int) -> int:
+		return self.Versions.get(self.Pages(ChannelId)[PageIndex]['id'], 0)
+
+	def ItemsAssignedTo(self, UserId: int) -> list[tuple[int, dict[str, Any], dict[str, Any]]]:
+		"""Every (channel ID, page, item) currently assigned to a user, straight from the index."""
+		return list(self.Assignments.get(UserId, {}).values())
+
+	# <-- Assignment index -->
+	# 💡 Entries hold the page and item objects themselves, so moving pages around never stales them
+
+	def Reindex(self) -> None:
+		self.Assignments = {}
+		for ChannelId, ChannelData in self.Data['channels'].items():
+			for Page in ChannelData['pages']:
+				for Item in Page['items']:
+					self.IndexItem(int(ChannelId), Page, Item)
+
+	def IndexItem(self, ChannelId: int, Page: dict[str, Any], Item: dict[str, Any]) -> None:
+		UserId = Item.get('assigned_to_id')
+		if UserId is not None:
+			self.Assignments.setdefault(UserId, {})[Item['id']] = (int(ChannelId), Page, Item)
+
+	def UnindexItem(self, Item: dict[str, Any]) -> None:
+		UserId = Item.get('assigned_to_id')
+		Entries = self.Assignments.get(UserId)
+		if Entries is None:
+			return
+		Entries.pop(Item.get('id'), None)
+		if not Entries:
+			del self.Assignments[UserId]
+
+	# <-- Mutations -->
+
+	def Bump(self, ChannelId: int) -> None:
+		"""Bump a channel's revision so menus built from older data can tell they are stale."""
+		self.Revisions[int(ChannelId)] = self.Revision(ChannelId) + 1
+
+	def Touch(self, ChannelId: int, PageIndex: int) -> None:
+		"""Bump a page's version so cached renders of it are rebuilt."""
+		PageId = self.Pages(ChannelId)[PageIndex]['id']
+		self.Versions[PageId] = self.Versions.get(PageId, 0) + 1
+		self.Bump(ChannelId)
+
+	def SetCurrentPage(self, ChannelId: int, PageIndex: int) -> bool:
+		ChannelData = self.Channel(ChannelId)
+		if not 0 <= PageIndex < len(ChannelData['pages']):
+			return False
+		ChannelData['current_page'] = PageIndex
+		self.Bump(ChannelId)
+		self.MarkDirty()
+		return True
+
+	def SetMessageIds(self, ChannelId: int, MessageIds: list[int]) -> None:
+		self.Channel(ChannelId)['message_ids'] = list(MessageIds)
+		self.MarkDirty()
+
+	def AddPage(self, ChannelId: int, Title: str) -> dict[str, Any]:
+		"""Append a page and make it the current one."""
+		ChannelData = self.Channel(ChannelId)
+		Page = {'id': self.NewId(), 'title': Title, 'items': []}
+		ChannelData['pages'].append(Page)
+		ChannelData['current_page'] = len(ChannelData['pages']) - 1
+		self.Bump(ChannelId)
+		self.MarkDirty()
+		return Page
+
+	def RenamePage(self, ChannelId: int, PageIndex: int, Title: str) -> str | None:
+		"""Rename a page and return its old title, or None if it doesn't exist."""
+		Pages = self.Pages(ChannelId)
+		if not 0 <= PageIndex < len(Pages):
+			return None
+		OldTitle = Pages[PageIndex]['title']
+		Pages[PageIndex]['title'] = Title
+		self.Touch(ChannelId, PageIndex)
+		self.MarkDirty()
+		return OldTitle
+
+	def DeletePage(self, ChannelId: int, PageIndex: int) -> dict[str, Any] | None:
+		"""Remove a page (never the last one) and keep current_page in bounds."""
+		ChannelData = self.Channel(ChannelId)
+		Pages = ChannelData['pages']
+		if len(Pages) <= 1 or not 0 <= PageIndex < len(Pages):
+			return None
+		Page = Pages.pop(PageIndex)
+		for Item in Page['items']:
+			self.UnindexItem(Item)
+		if ChannelData['current_page'] >= len(Pages):
+			ChannelData['current_page'] = len(Pages) - 1
+		self.Bump(ChannelId)
+		self.MarkDirty()
+		return Page
+
+	def AddItem(self, ChannelId: int, PageIndex: int, Item: dict[str, Any]) -> None:
+		Page = self.Pages(ChannelId)[PageIndex]
+		Item['id'] = self.NewId()
+		Page['items'].append(Item)
+		self.IndexItem(ChannelId, Page, Item)
+		self.Touch(ChannelId, PageIndex)
+		self.MarkDirty()
+
+	def ReplaceItem(
+		self, ChannelId: int, PageIndex: int, ItemIndex: int, Item: dict[str, Any]
+	) -> bool:
+		Items = self.Items(ChannelId, PageIndex)
+		if not 0 <= ItemIndex < len(Items):
+			return False
+		# 🆔 An edited item keeps its identity
+		Item['id'] = Items[ItemIndex].get('id') or self.NewId()
+		self.UnindexItem(Items[ItemIndex])
+		Items[ItemIndex] = Item
+		self.IndexItem(ChannelId, self.Pages(ChannelId)[PageIndex], Item)
+		self.Touch(ChannelId, PageIndex)
+		self.MarkDirty()
+		return True
+
+	def RemoveItems(
+		self, ChannelId: int, PageIndex: int, ItemIndices: list[int]
+	) -> list[dict[str, Any]]:
+		"""Remove items by index and return them in their original order."""
+		Items = self.Items(ChannelId, PageIndex)
+		Removed = [
+			Items.pop(Index)
+			for Index in sorted(set(ItemIndices), reverse=True)
+			if 0 <= Index < len(Items)
+		]
+		for Item in Removed:
+			self.UnindexItem(Item)
+		if Removed:
+			self.Touch(ChannelId, PageIndex)
+			self.MarkDirty()
+		return Removed[::-1]
+
+	def ClearPage(self, ChannelId: int, PageIndex: int) -> bool:
+		Pages = self.Pages(ChannelId)
+		if not 0 <= PageIndex < len(Pages):
+			return False
+		for Item in Pages[PageIndex]['items']:
+			self.UnindexItem(Item)
+		Pages[PageIndex]['items'] = []
+		self.Touch(ChannelId, PageIndex)
+		self.MarkDirty()
+		return True
+
+	def AssignItem(
+		self,
+		ChannelId: int,
+		PageIndex: int,
+		ItemIndex: int,
+		User,
+		Assigner=None,
+	) -> dict[str, Any] | None:
+		"""Assign an item to a user; without an assigner it counts as a self-claim."""
+		Items = self.Items(ChannelId, PageIndex)
+		if not 0 <= ItemIndex < len(Items):
+			return None
+		Item = Items[ItemIndex]
+		self.UnindexItem(Item)
+		SetAssignment(Item, User, Assigner)
+		self.IndexItem(ChannelId, self.Pages(ChannelId)[PageIndex], Item)
+		self.Touch(ChannelId, PageIndex)
+		self.MarkDirty()
+		return Item
+
+	def UnassignItem(self, ChannelId: int, PageIndex: int, ItemIndex: int) -> dict[str, Any] | None:
+		Items = self.Items(ChannelId, PageIndex)
+		if not 0 <= ItemIndex < len(Items):
+			return None
+		Item = Items[ItemIndex]
+		self.UnindexItem(Item)
+		for Key in ('assigned_to_id', 'assigned_to_name', 'assigned_by_id', 'assigned_by_name'):
+			Item[Key] = None
+		Item['assigned_at'] = None
+		self.Touch(ChannelId, PageIndex)
+		self.MarkDirty()
+		return Item
+
+	# <-- Bulk operations -->
+	# 💡 Each one touches the page once and marks dirty once, however many items it covers
+
+	def AddItems(self, ChannelId: int, PageIndex: int, Items: list[dict[str, Any]]) -> None:
+		if not Items:
+			return
+		Page = self.Pages(ChannelId)[PageIndex]
+		for Item in Items:
+			Item['id'] = self.NewId()
+			self.IndexItem(ChannelId, Page, Item)
+		Page['items'].extend(Items)
+		self.Touch(ChannelId, PageIndex)
+		self.MarkDirty()
+
+	def SetPriority(
+		self, ChannelId: int, PageIndex: int, ItemIndices: list[int], Priority: str
+	) -> list[dict[str, Any]]:
+		"""Set the priority of several items and return the ones that changed."""
+		Items = self.Items(ChannelId, PageIndex)
+		Changed = [
+			Items[Index]
+			for Index in sorted(set(ItemIndices))
+			if 0 <= Index < len(Items) and Items[Index].get('priority') != Priority
+		]
+		for Item in Changed:
+			Item['priority'] = Priority
+		if Changed:
+			self.Touch(ChannelId, PageIndex)
+			self.MarkDirty()
+		return Changed
+
+	def AssignItems(
+		self, ChannelId: int, PageIndex: int, ItemIndices: list[int], User, Assigner=None
+	) -> list[dict[str, Any]]:
+		Items = self.Items(ChannelId, PageIndex)
+		Assigned = [Items[Index] for Index in sorted(set(ItemIndices)) if 0 <= Index < len(Items)]
+		Page = self.Pages(ChannelId)[PageIndex]
+		for Item in Assigned:
+			self.UnindexItem(Item)
+			SetAssignment(Item, User, Assigner)
+			self.IndexItem(ChannelId, Page, Item)
+		if Assigned:
+			self.Touch(ChannelId, PageIndex)
+			self.MarkDirty()
+		return Assigned
+
+	def ImportPages(self, ChannelId: int, Pages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+		"""Append whole pages (with fresh IDs) after the channel's existing ones."""
+		ChannelData = self.Channel(ChannelId)
+		for Page in Pages:
+			Page['id'] = self.NewId()
+			for Item in Page['items']:
+				Item['id'] = self.NewId()
+				self.IndexItem(ChannelId, Page, Item)
+			ChannelData['pages'].append(Page)
+		if Pages:
+			self.Bump(ChannelId)
+			self.MarkDirty()
+		return Pages
+
+	def ExportRecords(self, ChannelId: int) -> Iterator[dict[str, Any]]:
+		"""A channel's pages as flat records: one page record followed by its item records."""
+		for Page in self.Pages(ChannelId):
+			yield {'type': 'page', 'title': Page['title']}
+			for Item in Page['items']:
+				yield {'type': 'item', **{Key: Value for Key, Value in Item.items() if Key != 'id'}}
+
+	# <-- Write-behind persistence -->
+
+	def MarkDirty(self) -> None:
+		"""Schedule a flush; changes made within FlushDelay share one write."""
+		self.Dirty = True
+		if self.FlushTask is None or self.FlushTask.done():
+			try:
+				self.FlushTask = asyncio.get_running_loop().create_task(self.DelayedFlush())
+			except RuntimeError:
+				pass  # No running loop (e.g. during cog construction); Flush() picks it up later
+
+	async def DelayedFlush(self) -> None:
+		# 🔁 MarkDirty doesn't schedule while this task runs, so changes made during a write
+		# (or left over by a failed one) are picked up by another round here
+		while True:
+			await asyncio.sleep(self.FlushDelay)
+			await self.Flush()
+			if not self.Dirty:
+				return
+
+	async def Flush(self) -> None:
+		"""Persist the current state if anything changed since the last write."""
+		async with self.FlushLock:
+			if not self.Dirty:
+				return
+			# 📸 Serialize on the loop so the snapshot is consistent, write it off the loop
+			Text = json.dumps(self.Data, ensure_ascii=False)
+			self.Dirty = False
+			try:
+				await asyncio.to_thread(WriteAtomic, self.Path, Text)
+			except Exception as E:
+				self.Dirty = True
+				Logger.error(f'Error saving to-do data: {E}')
+
+	async def Close(self) -> None:
+		await self.Flush()
+		if self.FlushTask and not self.FlushTask.done():
+			self.FlushTask.cancel()
@@ -0,0 +1,198 @@
+# 📦 Built-in modules
+from functools import partial
+import asyncio
+import json
+import os
+import re
+
+# 📥 Custom modules
+from Utils.Logger import Logger
+
+# 👾 Discord modules
+import discord
+
+# 🔗 User (<@id>, <@!id>) and role (<@&id>) mentions, resolved in a single pass
+MentionPattern = re.compile(r'<@([!&]?)(\d+)>')
+
+
+def WriteLines(Path: str, Lines: list[str], Truncate: bool) -> None:
+	Directory = os.path.dirname(Path)
+	if Directory:
+		os.makedirs(Directory, exist_ok=True)
+	with open(Path, 'w' if Truncate else 'a', encoding='utf-8') as File:
+		File.write(''.join(Line + '\n' for Line in Lines))
+
+
+# 📂 (started by the recorder, ID to resume crawling after, has gaps, {message ID: line}) of a log
+def ReadLog(Path: str) -> tuple[bool, int | None, bool, dict[int, str]]:
+	Started, ResumeAfter, Gap, Lines = False, None, False, {}
+	if not os.path.exists(Path):
+		return Started, ResumeAfter, Gap, Lines
+	with open(Path, 'r', encoding='utf-8') as File:
+		for Raw in File:
+			try:
+				Record = json.loads(Raw)
+			except ValueError:
+				continue
+			if Record.get('start'):
+				Started = True
+			elif Record.get('gap'):
+				# 🕳️ Nothing is known between the records before and after this marker
+				Gap = True
+			else:
+				Lines.setdefault(Record['id'], Record['line'])
+				if not Gap:
+					ResumeAfter = Record['id']
+	return Started, ResumeAfter, Gap, Lines
+
+
+# 💡 Appends ticket messages to a per-ticket log as they arrive, so closing a ticket only has to
+# catch up on what was missed (e.g. while the bot was offline) instead of crawling the whole channel
+class TranscriptRecorder:
+	def __init__(self, Directory: str, FlushDelay: float = 2.0) -> None:
+		self.Directory = Directory
+		self.FlushDelay = FlushDelay
+		# 📝 Channel ID -> log lines waiting for the next flush
+		self.Pending = {}
+		# 🧹 Channels whose log is rewritten from scratch on the next flush
+		self.Truncate = set()
+		# 🗂️ Channel ID -> message IDs recorded while a catch-up crawl is running
+		self.Building = {}
+		# 🔗 Channels recorded without interruption by this process; a log written by an earlier
+		# run gets a gap marker before its first live message, since the bot may have been offline
+		self.Live = set()
+		# 🗂️ User ID -> display name used in transcripts
+		self.Names = {}
+		self.FlushTask = None
+		self.FlushLock = asyncio.Lock()
+
+	def LogPath(self, ChannelId: int) -> str:
+		return os.path.join(self.Directory, f'{ChannelId}.jsonl')
+
+	# <-- Rendering -->
+
+	def NameOf(self, Guild, UserId: int) -> str:
+		Name = self.Names.get(UserId)
+		if Name is None:
+			Member = Guild.get_member(UserId) if Guild else None
+			if Member is None:
+				return f'User {UserId}'
+			Name = self.Names[UserId] = Member.name
+		return Name
+
+	def ReplaceMention(self, Guild, Match: re.Match) -> str:
+		Id = int(Match.group(2))
+		if Match.group(1) == '&':
+			Role = Guild.get_role(Id) if Guild else None
+			return Role.name if Role else f'Role {Id}'
+		return self.NameOf(Guild, Id)
+
+	def Render(self, Message: discord.Message) -> str:
+		self.Names[Message.author.id] = Message.author.name
+		Content = (
+			MentionPattern.sub(partial(self.ReplaceMention, Message.guild), Message.content)
+			if Message.content
+			else '[Attachment/Embed]'
+		)
+		return f'[{Message.created_at.strftime("%Y-%m-%d %H:%M")}] {Message.author.name}: {Content}'
+
+	# <-- Recording -->
+
+	def Start(self, ChannelId: int) -> None:
+		"""Begin a fresh log for a ticket channel; everything after this is recorded live."""
+		self.Truncate.add(ChannelId)
+		self.Pending[ChannelId] = [json.dumps({'start': True})]
+		self.Live.add(ChannelId)
+		self.MarkDirty()
+
+	def Record(self, Message: discord.Message) -> None:
+		ChannelId = Message.channel.id
+		if ChannelId in self.Building:
+			self.Building[ChannelId].add(Message.id)
+		Pending = self.Pending.setdefault(ChannelId, [])
+		if ChannelId not in self.Live:
+			Pending.append(json.dumps({'gap': True}))
+			self.Live.add(ChannelId)
+		Pending.append(
+			json.dumps({'id': Message.id, 'line': self.Render(Message)}, ensure_ascii=False)
+		)
+		self.MarkDirty()
+
+	async def Build(self, Channel: discord.TextChannel) -> list[str]:
+		"""The transcript lines of a ticket, one per message, fetching only what the recorder hasn't seen."""
+		# 🔒 Registered before the first await, so a live message can never slip past both checks
+		Seen = self.Building.setdefault(Channel.id, set())
+		try:
+			await self.Flush()
+			Started, ResumeAfter, Gap, Lines = await asyncio.to_thread(
+				ReadLog, self.LogPath(Channel.id)
+			)
+			if not Started:
+				# 📜 Ticket opened before recording began: crawl it once, then it's recorded like the rest
+				self.Start(Channel.id)
+				ResumeAfter, Lines = None, {}
+			# 🕳️ Resume after the last record before the earliest gap (the bot was offline there);
+			# messages already in the log are skipped, so the crawl only fills what is missing
+			After = discord.Object(id=ResumeAfter) if ResumeAfter else None
+			async for Message in Channel.history(limit=None, after=After, oldest_first=True):
+				if Message.id not in Seen and Message.id not in Lines:
+					self.Record(Message)
+			self.Live.add(Channel.id)
+			await self.Flush()
+			if Gap:
+				return await self.Rewrite(Channel.id)
+			_, _, _, Lines = await asyncio.to_thread(ReadLog, self.LogPath(Channel.id))
+			# 📖 Live messages recorded during the crawl may interleave with it; snowflakes sort by time
+			return [Line for _, Line in sorted(Lines.items())]
+		finally:
+			self.Building.pop(Channel.id, None)
+
+	async def Rewrite(self, ChannelId: int) -> list[str]:
+		"""Rewrite a log whose gaps were just filled in message order, without the gap markers."""
+		async with self.FlushLock:
+			Path = self.LogPath(ChannelId)
+			_, _, _, Lines = await asyncio.to_thread(ReadLog, Path)
+			Ordered = sorted(Lines.items())
+			Records = [json.dumps({'start': True})] + [
+				json.dumps({'id': Id, 'line': Line}, ensure_ascii=False) for Id, Line in Ordered
+			]
+			await asyncio.to_thread(WriteLines, Path, Records, True)
+		return [Line for _, Line in Ordered]
+
+	async def Discard(self, ChannelId: int) -> None:
+		self.Pending.pop(ChannelId, None)
+		self.Truncate.discard(ChannelId)
+		self.Live.discard(ChannelId)
+		async with self.FlushLock:
+			try:
+				await asyncio.to_thread(os.remove, self.LogPath(ChannelId))
+			except FileNotFoundError:
+				pass
+			except OSError as E:
+				Logger.error(f'Error removing transcript log for channel {ChannelId}: {E}')
+
+	# <-- Write-behind persistence -->
+
+	def MarkDirty(self) -> None:
+		if self.FlushTask is None or self.FlushTask.done():
+			self.FlushTask = asyncio.get_running_loop().create_task(self.DelayedFlush())
+
+	async def DelayedFlush(self) -> None:
+		await asyncio.sleep(self.FlushDelay)
+		await self.Flush()
+
+	async def Flush(self) -> None:
+		async with self.FlushLock:
+			Pending, self.Pending = self.Pending, {}
+			Truncate, self.Truncate = self.Truncate, set()
+			for ChannelId, Lines in Pending.items():
+				try:
+					await asyncio.to_thread(
+						WriteLines, self.LogPath(ChannelId), Lines, ChannelId in Truncate
+					)
+				except Exception as E:
+					# 🔁 Keep them (in order) for the next attempt
+					self.Pending[ChannelId] = Lines + self.Pending.get(ChannelId, [])
+					if ChannelId in Truncate:
+						self.Truncate.add(ChannelId)
+					Logger.error(f'Error writing transcript log for channel {ChannelId}: {E}')
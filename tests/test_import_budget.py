@@ -0,0 +1,10 @@
+from Config import ImportTimeBudget
+from Utils.ImportBudget import MeasureImports
+
+
+def test_cogs_import_within_budget():
+	Seconds, Eager = MeasureImports()
+	assert not Eager, f'Heavy modules imported at boot: {", ".join(sorted(Eager))}'
+	assert Seconds <= ImportTimeBudget, (
+		f'Cog import time {Seconds * 1000:.0f}ms exceeds {ImportTimeBudget * 1000:.0f}ms'
+	)
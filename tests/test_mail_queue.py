@@ -0,0 +1,134 @@
+import asyncio
+import os
+import shutil
+import socket
+import ssl
+import subprocess
+from email.message import EmailMessage
+
+import pytest
+
+from Utils import MailQueue as Module
+from Utils.MailQueue import MailQueue
+
+aiosmtpd = pytest.importorskip('aiosmtpd.controller')
+
+
+# 📬 Collects delivered messages and refuses recipients starting with 'reject'
+class Collector:
+	def __init__(self) -> None:
+		self.Messages = []
+
+	async def handle_RCPT(self, Server, Session, Envelope, Address, Options):
+		if Address.startswith('reject'):
+			return '550 No such user'
+		Envelope.rcpt_tos.append(Address)
+		return '250 OK'
+
+	async def handle_DATA(self, Server, Session, Envelope):
+		self.Messages.append((id(Session), Envelope.rcpt_tos[0]))
+		return '250 OK'
+
+
+@pytest.fixture
+def Smtp(tmp_path):
+	# 🔐 MailQueue speaks implicit TLS (SMTP_SSL), so the stand-in needs a certificate
+	if shutil.which('openssl') is None:
+		pytest.skip('openssl is needed to create a test certificate')
+	Cert, Key = tmp_path / 'cert.pem', tmp_path / 'key.pem'
+	subprocess.run(
+		['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1']
+		+ ['-subj', '/CN=localhost', '-keyout', str(Key), '-out', str(Cert)],
+		check=True,
+		capture_output=True,
+	)
+	Context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+	Context.load_cert_chain(Cert, Key)
+	with socket.socket() as Probe:
+		Probe.bind(('127.0.0.1', 0))
+		Port = Probe.getsockname()[1]
+	Handler = Collector()
+	Controller = aiosmtpd.Controller(Handler, hostname='127.0.0.1', port=Port, ssl_context=Context)
+	Controller.start()
+	yield Handler, Port
+	Controller.stop()
+
+
+def Mail(To: str) -> EmailMessage:
+	Message = EmailMessage()
+	Message['From'] = 'bot@example.com'
+	Message['To'] = To
+	Message['Subject'] = 'Transcript'
+	Message.set_content('Hello')
+	return Message
+
+
+async def Until(Predicate, Timeout: float = 5.0) -> None:
+	Deadline = asyncio.get_running_loop().time() + Timeout
+	while not Predicate():
+		assert asyncio.get_running_loop().time() < Deadline, 'timed out'
+		await asyncio.sleep(0.02)
+
+
+def test_batch_is_sent_over_one_connection(Smtp, tmp_path):
+	Handler, Port = Smtp
+
+	async def Scenario():
+		Queue = MailQueue(str(tmp_path / 'outbox'), '127.0.0.1', Port)
+		for Index in range(3):
+			await Queue.Enqueue(Mail(f'user{Index}@example.com'))
+		assert len(Queue) == 3
+		Queue.Start()
+		await Until(lambda: len(Handler.Messages) == 3 and not Queue.Outbox())
+		await Until(lambda: len(Queue) == 0)
+		await Queue.Stop()
+
+	asyncio.run(Scenario())
+	assert [To for _, To in Handler.Messages] == [f'user{Index}@example.com' for Index in range(3)]
+	assert len({Session for Session, _ in Handler.Messages}) == 1
+
+
+def test_rejected_mail_is_retried_then_moved_to_failed(Smtp, tmp_path):
+	Handler, Port = Smtp
+
+	async def Scenario():
+		Queue = MailQueue(str(tmp_path / 'outbox'), '127.0.0.1', Port, MaxAttempts=2, BaseDelay=0.1)
+		await Queue.Enqueue(Mail('reject@example.com'))
+		await Queue.Enqueue(Mail('ok@example.com'))
+		Queue.Start()
+		await Until(lambda: os.path.isdir(Queue.FailedDirectory) and not Queue.Outbox())
+		await Queue.Stop()
+		return Queue
+
+	Queue = asyncio.run(Scenario())
+	assert [To for _, To in Handler.Messages] == ['ok@example.com']
+	assert len(os.listdir(Queue.FailedDirectory)) == 1
+	assert not Queue.Retries
+
+
+def test_delivered_mail_is_not_resent_when_removal_fails(Smtp, tmp_path, monkeypatch):
+	Handler, Port = Smtp
+	Remove = os.remove
+
+	def Stuck(Path):
+		if Path.endswith('.eml') and 'first' in open(Path, encoding='utf-8').read():
+			raise PermissionError('file is locked')
+		Remove(Path)
+
+	monkeypatch.setattr(Module.os, 'remove', Stuck)
+
+	async def Scenario():
+		Queue = MailQueue(str(tmp_path / 'outbox'), '127.0.0.1', Port)
+		First = Mail('first@example.com')
+		First.set_content('first')
+		await Queue.Enqueue(First)
+		Queue.Start()
+		await Until(lambda: len(Handler.Messages) == 1 and Queue.Delivered)
+		# ✉️ Another batch must not pick the already delivered message up again
+		await Queue.Enqueue(Mail('second@example.com'))
+		await Until(lambda: len(Handler.Messages) >= 2 and len(Queue) == 0)
+		await asyncio.sleep(0.2)
+		await Queue.Stop()
+
+	asyncio.run(Scenario())
+	assert [To for _, To in Handler.Messages] == ['first@example.com', 'second@example.com']
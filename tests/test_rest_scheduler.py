@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from Utils.RestScheduler import Background, Interactive, RestScheduler
+
+
+def test_cancelled_job_does_not_kill_the_worker():
+	async def Scenario():
+		Scheduler = RestScheduler({'default': (100, 1.0)}, Workers=1)
+		Scheduler.Start()
+
+		async def Cancelled():
+			raise asyncio.CancelledError
+
+		async def Fine():
+			return 'ok'
+
+		with pytest.raises(asyncio.CancelledError):
+			await asyncio.wait_for(Scheduler.Run(Cancelled, ('channel', 1)), 1)
+		Result = await asyncio.wait_for(Scheduler.Run(Fine, ('channel', 1)), 1)
+		Alive = not Scheduler.Workers[0].done()
+		await Scheduler.Stop()
+		return Result, Alive
+
+	assert asyncio.run(Scenario()) == ('ok', True)
+
+
+def test_promoted_parked_job_keeps_depth_balanced():
+	async def Scenario():
+		Scheduler = RestScheduler({'default': (1, 0.2)}, Workers=1)
+		Scheduler.Start()
+		Calls = []
+
+		async def Call(Name):
+			Calls.append(Name)
+			return Name
+
+		First = Scheduler.Submit(lambda: Call('first'), ('channel', 1), Background)
+		Scheduler.Submit(lambda: Call('stale'), ('channel', 1), Background, 'edit')
+		await asyncio.sleep(0.05)
+		# ⏫ Promote the job while it is parked waiting for its bucket
+		Newest = Scheduler.Submit(lambda: Call('newest'), ('channel', 1), Interactive, 'edit')
+		Results = await asyncio.gather(First, Newest)
+		await asyncio.sleep(0.05)
+		Depth = dict(Scheduler.Depth)
+		await Scheduler.Stop()
+		return Results, Calls, Depth
+
+	Results, Calls, Depth = asyncio.run(Scenario())
+	assert Results == ['first', 'newest']
+	assert Calls == ['first', 'newest']
+	assert set(Depth.values()) == {0}
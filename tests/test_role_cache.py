@@ -0,0 +1,52 @@
+import asyncio
+from types import SimpleNamespace
+
+from Cogs import TicketSystem as TicketSystemModule
+from Cogs.TicketSystem import TicketSystem, get_role_class, role_class_cache
+from Config import TicketRoleCacheTTL
+
+Admin = next(iter(TicketSystemModule.ADMIN_ROLES))
+
+
+def Member(Id: int, *RoleIds: int) -> SimpleNamespace:
+	return SimpleNamespace(
+		id=Id,
+		guild=SimpleNamespace(id=1),
+		roles=[SimpleNamespace(id=RoleId) for RoleId in RoleIds],
+	)
+
+
+def Clock(monkeypatch) -> list[float]:
+	Now = [1000.0]
+	monkeypatch.setattr(TicketSystemModule.time, 'monotonic', lambda: Now[0])
+	role_class_cache.clear()
+	return Now
+
+
+def test_cached_class_expires_and_is_pruned(monkeypatch):
+	Now = Clock(monkeypatch)
+	assert get_role_class(Member(2, Admin))[0]
+	# 🕒 Still cached: a role removed without an update event shows up only after the TTL
+	assert get_role_class(Member(2))[0]
+	Now[0] += TicketRoleCacheTTL + 1
+	assert not get_role_class(Member(2))[0]
+
+	# 🧹 Members who never check again are dropped once their entry expires
+	get_role_class(Member(3))
+	Now[0] += TicketRoleCacheTTL + 1
+	get_role_class(Member(4))
+	assert list(role_class_cache) == [(1, 4)]
+
+
+def test_member_events_invalidate(monkeypatch):
+	Clock(monkeypatch)
+	assert get_role_class(Member(2, Admin))[0]
+	asyncio.run(TicketSystem.on_member_update(None, Member(2, Admin), Member(2)))
+	assert not get_role_class(Member(2))[0]
+
+	# 🔁 An update that leaves the roles alone keeps the entry
+	asyncio.run(TicketSystem.on_member_update(None, Member(2), Member(2)))
+	assert (1, 2) in role_class_cache
+
+	asyncio.run(TicketSystem.on_member_remove(None, Member(2)))
+	assert (1, 2) not in role_class_cache
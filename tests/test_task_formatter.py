@@ -0,0 +1,118 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from Utils.TaskFormatter import FallbackFormat, TaskFormatter
+
+
+# 💡 Stand-in for the chat completions endpoint: answers after Delay seconds and records
+# how many requests it got and how many were in flight at once
+class StandIn(ThreadingHTTPServer):
+	daemon_threads = True
+
+	def __init__(self) -> None:
+		super().__init__(('127.0.0.1', 0), CompletionHandler)
+		self.Delay = 0.0
+		self.Requests = 0
+		self.InFlight = 0
+		self.MaxInFlight = 0
+		self.Lock = threading.Lock()
+
+
+class CompletionHandler(BaseHTTPRequestHandler):
+	def do_POST(self) -> None:
+		Server = self.server
+		Body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+		with Server.Lock:
+			Server.Requests += 1
+			Server.InFlight += 1
+			Server.MaxInFlight = max(Server.MaxInFlight, Server.InFlight)
+		try:
+			time.sleep(Server.Delay)
+			RawText = Body['messages'][0]['content'].split('Raw task: ', 1)[1].split('\n', 1)[0]
+			Content = json.dumps({'title': f'✅ {RawText}', 'description': 'Formatted remotely.'})
+			Payload = json.dumps(
+				{
+					'id': 'chatcmpl-test',
+					'object': 'chat.completion',
+					'created': 0,
+					'model': Body['model'],
+					'choices': [
+						{
+							'index': 0,
+							'message': {'role': 'assistant', 'content': Content},
+							'finish_reason': 'stop',
+						}
+					],
+				}
+			).encode()
+			self.send_response(200)
+			self.send_header('Content-Type', 'application/json')
+			self.send_header('Content-Length', str(len(Payload)))
+			self.end_headers()
+			self.wfile.write(Payload)
+		except (BrokenPipeError, ConnectionResetError):
+			pass  # The client gave up (timeout test)
+		finally:
+			with Server.Lock:
+				Server.InFlight -= 1
+
+	def log_message(self, *Args) -> None:
+		pass
+
+
+@pytest.fixture
+def Server(monkeypatch):
+	pytest.importorskip('openai')
+	Server = StandIn()
+	Thread = threading.Thread(target=Server.serve_forever, daemon=True)
+	Thread.start()
+	monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+	monkeypatch.setenv('OPENAI_BASE_URL', f'http://127.0.0.1:{Server.server_address[1]}/v1')
+	yield Server
+	Server.shutdown()
+	Server.server_close()
+
+
+def test_cache_hit(Server):
+	async def Scenario():
+		Formatter = TaskFormatter(Timeout=5)
+		return [await Formatter.Format('fix the login', 'high') for _ in range(3)]
+
+	Results = asyncio.run(Scenario())
+	assert Results == [{'title': '✅ fix the login', 'description': 'Formatted remotely.'}] * 3
+	assert Server.Requests == 1
+
+
+def test_timeout_falls_back_and_is_not_cached(Server):
+	Server.Delay = 1.0
+
+	async def Scenario():
+		Formatter = TaskFormatter(Timeout=0.2)
+		Started = time.monotonic()
+		Result = await Formatter.Format('write the readme', 'low')
+		return Result, time.monotonic() - Started, Formatter.Cache
+
+	Result, Elapsed, Cache = asyncio.run(Scenario())
+	assert Result == FallbackFormat('write the readme', 'low')
+	assert Elapsed < 0.8
+	assert not Cache
+
+
+def test_concurrency_is_bounded(Server):
+	Server.Delay = 0.2
+
+	async def Scenario():
+		Formatter = TaskFormatter(Timeout=5, Concurrency=2)
+		return await asyncio.gather(
+			*(Formatter.Format(f'task {Index}', 'medium') for Index in range(6))
+		)
+
+	Results = asyncio.run(Scenario())
+	assert [Result['title'] for Result in Results] == [f'✅ task {Index}' for Index in range(6)]
+	assert Server.Requests == 6
+	assert Server.MaxInFlight == 2
@@ -0,0 +1,146 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from Utils import TicketStore as TicketStoreModule
+from Utils.TicketStore import TicketStore
+
+Created = datetime(2026, 1, 1)
+Minute = timedelta(minutes=1)
+
+
+def Store(tmp_path) -> TicketStore:
+	Result = TicketStore(
+		str(tmp_path / 'tickets.json'),
+		str(tmp_path / 'tickets.journal'),
+		str(tmp_path / 'ticket_counter.json'),
+		Retention=timedelta(days=7),
+	)
+	Result.Load()
+	return Result
+
+
+def Ticket(ChannelId: int) -> dict:
+	return {
+		'channel_id': ChannelId,
+		'user_id': 1,
+		'ticket_num': ChannelId,
+		'type': 'support',
+		'status': 'Open',
+		'claimed_by': None,
+		'claimed_at': None,
+		'created_at': Created.isoformat(),
+	}
+
+
+def Close(Store: TicketStore, ChannelId: int, At: datetime) -> None:
+	asyncio.run(Store.Update(ChannelId, {'status': 'Closed', 'closed_at': At.isoformat()}))
+
+
+def test_expiry_follows_reopen_and_reload(tmp_path):
+	Tickets = Store(tmp_path)
+	for ChannelId in (1, 2, 3):
+		asyncio.run(Tickets.Add(Ticket(ChannelId)))
+	Close(Tickets, 1, Created)
+	Close(Tickets, 2, Created)
+	asyncio.run(Tickets.Update(2, {'status': 'Open'}))
+	Close(Tickets, 3, Created + timedelta(days=1))
+
+	assert Tickets.NextExpiry() == Created + timedelta(days=7)
+	Due = Created + timedelta(days=8)
+	assert [Expired['channel_id'] for Expired in Tickets.PopExpired(Due)] == [1, 3]
+	# 🔁 The schedule is rebuilt from the persisted close times
+	assert [Expired['channel_id'] for Expired in Store(tmp_path).PopExpired(Due)] == [1, 3]
+
+
+def test_failed_deletion_is_retried_with_backoff(tmp_path):
+	Tickets = Store(tmp_path)
+	asyncio.run(Tickets.Add(Ticket(1)))
+	Close(Tickets, 1, Created)
+	Now = Created + timedelta(days=7)
+	assert [Expired['channel_id'] for Expired in Tickets.PopExpired(Now)] == [1]
+
+	First = Tickets.Postpone(1, Now, Minute, 10 * Minute)
+	assert First == Now + Minute
+	assert Tickets.PopExpired(First - timedelta(seconds=1)) == []
+	assert [Expired['channel_id'] for Expired in Tickets.PopExpired(First)] == [1]
+	Second = Tickets.Postpone(1, First, Minute, 10 * Minute)
+	assert Second == First + 2 * Minute
+
+	# 🗑️ Once deleted, the pending retry is ignored
+	asyncio.run(Tickets.Delete(1))
+	assert Tickets.PopExpired(Second) == []
+	assert not Tickets.Postponed
+
+
+def test_stats_hold_one_close_sample_per_ticket(tmp_path):
+	Tickets = Store(tmp_path)
+	for ChannelId in (1, 2):
+		asyncio.run(Tickets.Add(Ticket(ChannelId)))
+	asyncio.run(
+		Tickets.Update(1, {'claimed_by': 7, 'claimed_at': (Created + 10 * Minute).isoformat()})
+	)
+	Close(Tickets, 1, Created + 60 * Minute)
+	# 🔁 Writing the close again (or reopening and closing) replaces the ticket's sample
+	Close(Tickets, 1, Created + 90 * Minute)
+	asyncio.run(Tickets.Update(2, {'assigned_to': 8}))
+	Close(Tickets, 2, Created + 30 * Minute)
+	asyncio.run(Tickets.Update(2, {'status': 'Open'}))
+	Close(Tickets, 2, Created + 120 * Minute)
+
+	def Summary(Stats):
+		return (
+			dict(Stats.ByStatus),
+			dict(Stats.ByType),
+			len(Stats.ClaimLatency),
+			Stats.ClaimLatency.Sum,
+			len(Stats.CloseLatency),
+			Stats.CloseLatency.Sum,
+			{
+				Handler: dict(Histogram.Samples)
+				for Handler, Histogram in Stats.CloseByHandler.items()
+			},
+		)
+
+	Live = Summary(Tickets.Stats)
+	assert Live == (
+		{'Closed': 2},
+		{'support': 2},
+		1,
+		600.0,
+		2,
+		(90 + 120) * 60.0,
+		{7: {1: 90 * 60.0}, 8: {2: 120 * 60.0}},
+	)
+	assert Summary(Store(tmp_path).Stats) == Live
+
+
+def test_unreadable_snapshot_is_set_aside_not_overwritten(tmp_path):
+	Tickets = Store(tmp_path)
+	for ChannelId in (1, 2):
+		asyncio.run(Tickets.Add(Ticket(ChannelId)))
+	asyncio.run(Tickets.Compact())
+	asyncio.run(Tickets.Add(Ticket(3)))
+	Snapshot = tmp_path / 'tickets.json'
+	Damaged = Snapshot.read_text(encoding='utf-8')[:-20]
+	Snapshot.write_text(Damaged, encoding='utf-8')
+
+	Reloaded = Store(tmp_path)
+	[Aside] = tmp_path.glob('tickets.json.corrupt-*')
+	assert Aside.read_text(encoding='utf-8') == Damaged
+	# 🔢 The journal is still replayed and numbering continues past the counter
+	assert [Loaded['channel_id'] for Loaded in Reloaded.All()] == [3]
+	assert Reloaded.NextNumber == 4
+
+
+def test_unreadable_snapshot_that_cannot_move_is_left_alone(tmp_path, monkeypatch):
+	Tickets = Store(tmp_path)
+	asyncio.run(Tickets.Add(Ticket(1)))
+	(tmp_path / 'tickets.json').write_text('[{', encoding='utf-8')
+
+	def Locked(Source, Target):
+		raise PermissionError('locked')
+
+	monkeypatch.setattr(TicketStoreModule.os, 'replace', Locked)
+	Reloaded = Store(tmp_path)
+	asyncio.run(Reloaded.Close())
+	assert (tmp_path / 'tickets.json').read_text(encoding='utf-8') == '[{'
@@ -0,0 +1,94 @@
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+from Utils import TodoDatabase as Module
+from Utils.TodoDatabase import SqliteTodoRepository
+
+Alice = SimpleNamespace(id=10, display_name='Alice')
+Bob = SimpleNamespace(id=20, display_name='Bob')
+
+
+# 📝 An item with every column set, as the cog builds them
+def Item(Task: str, Priority: str = 'medium') -> dict:
+	return {
+		'task': Task,
+		'priority': Priority,
+		'title': None,
+		'description': None,
+		'author_id': Bob.id,
+		'author_name': Bob.display_name,
+		'assigned_to_id': None,
+		'assigned_to_name': None,
+		'assigned_by_id': None,
+		'assigned_by_name': None,
+		'assigned_at': None,
+	}
+
+
+def Reopen(Path) -> SqliteTodoRepository:
+	Repository = SqliteTodoRepository(str(Path))
+	Repository.Load()
+	return Repository
+
+
+def test_round_trip(tmp_path):
+	Legacy = {'channel_id': 1, 'message_ids': [5], 'items': [{'task': 'legacy', 'priority': 'low'}]}
+	(tmp_path / 'todo.json').write_text(json.dumps(Legacy), encoding='utf-8')
+
+	async def Scenario():
+		Repository = SqliteTodoRepository(
+			str(tmp_path / 'todo.db'), str(tmp_path / 'todo.json'), FlushDelay=0.01
+		)
+		Repository.Load()
+		Repository.AddItems(1, 0, [Item('a'), Item('b'), Item('c')])
+		Repository.SetPriority(1, 0, [1, 2], 'high')
+		Repository.AssignItem(1, 0, 2, Alice, Bob)
+		Repository.RemoveItems(1, 0, [1])
+		Repository.AddPage(2, 'Second')
+		Repository.RenamePage(2, 1, 'Renamed')
+		Repository.AddItem(2, 1, Item('d'))
+		Repository.SetCurrentPage(2, 1)
+		await Repository.Close()
+		return Repository.Data
+
+	Data = asyncio.run(Scenario())
+	Loaded = Reopen(tmp_path / 'todo.db')
+	assert Loaded.Data == Data
+	assert [Item['task'] for Item in Loaded.Items(1, 0)] == ['legacy', 'b', 'c']
+	assert [(ChannelId, Item['task']) for ChannelId, _, Item in Loaded.ItemsAssignedTo(10)] == [
+		(1, 'b')
+	]
+	assert Loaded.Pages(2)[1]['title'] == 'Renamed'
+	# 🔢 New IDs continue after the persisted ones
+	assert Loaded.NextId > max(Item['id'] for Item in Loaded.Items(1, 0))
+
+
+def test_change_during_commit_is_flushed(tmp_path, monkeypatch):
+	Writing = threading.Event()
+	RealApply = Module.SqliteTodoRepository.Apply
+
+	def SlowApply(self, Statements):
+		Writing.set()
+		time.sleep(0.2)
+		RealApply(self, Statements)
+
+	monkeypatch.setattr(Module.SqliteTodoRepository, 'Apply', SlowApply)
+
+	async def Scenario():
+		Repository = SqliteTodoRepository(str(tmp_path / 'todo.db'), FlushDelay=0.01)
+		Repository.Load()
+		Repository.AddItem(1, 0, Item('first'))
+		await asyncio.to_thread(Writing.wait, 1)
+		# ✍️ Queued while the first transaction is still committing
+		Repository.AddItem(1, 0, Item('second'))
+		await asyncio.wait_for(Repository.FlushTask, 2)
+		assert not Repository.Pending
+
+	asyncio.run(Scenario())
+	assert [Item['task'] for Item in Reopen(tmp_path / 'todo.db').Items(1, 0)] == [
+		'first',
+		'second',
+	]
@@ -0,0 +1,93 @@
+import asyncio
+import json
+import threading
+import time
+
+from Utils import TodoRepository as Module
+from Utils.TodoRepository import ItemTextLimits, PageTitleLimit, PagesFromNdjson, TodoRepository
+
+
+def test_change_during_write_is_flushed(tmp_path, monkeypatch):
+	Writing = threading.Event()
+	RealWrite = Module.WriteAtomic
+
+	def SlowWrite(Path, Text):
+		Writing.set()
+		time.sleep(0.2)
+		RealWrite(Path, Text)
+
+	monkeypatch.setattr(Module, 'WriteAtomic', SlowWrite)
+
+	async def Scenario():
+		Repository = TodoRepository(str(tmp_path / 'todo.json'), FlushDelay=0.01)
+		Repository.AddItem(1, 0, {'task': 'first'})
+		await asyncio.to_thread(Writing.wait, 1)
+		# ✍️ Lands while the first flush is still writing
+		Repository.AddItem(1, 0, {'task': 'second'})
+		await asyncio.wait_for(Repository.FlushTask, 2)
+		return Repository
+
+	Repository = asyncio.run(Scenario())
+	assert not Repository.Dirty
+	Data = json.loads((tmp_path / 'todo.json').read_text(encoding='utf-8'))
+	assert [Item['task'] for Item in Data['channels']['1']['pages'][0]['items']] == [
+		'first',
+		'second',
+	]
+
+
+def test_import_validates_item_records():
+	Lines = [
+		json.dumps({'type': 'page', 'title': 'P' * 500}),
+		json.dumps(
+			{
+				'type': 'item',
+				'priority': 'high',
+				'title': 'T' * 1000,
+				'description': 'D' * 10_000,
+				'author_id': 5,
+				'author_name': 'Alice',
+				'assigned_to_id': 6,
+				'injected': 'dropped',
+			}
+		),
+		# 🚫 Mistyped ID fields, a missing title and an unknown priority are skipped
+		json.dumps({'type': 'item', 'priority': 'low', 'title': 'x', 'assigned_to_id': '6'}),
+		json.dumps({'type': 'item', 'priority': 'low', 'title': 'x', 'author_id': True}),
+		json.dumps({'type': 'item', 'priority': 'low', 'title': 'x', 'description': 7}),
+		json.dumps({'type': 'item', 'priority': 'low'}),
+		json.dumps({'type': 'item', 'priority': 'urgent', 'title': 'x'}),
+		'{not json',
+	]
+	Pages, Skipped = PagesFromNdjson(Lines)
+	assert Skipped == 6
+	assert len(Pages[0]['title']) == PageTitleLimit
+	[Item] = Pages[0]['items']
+	assert len(Item['title']) == ItemTextLimits['title']
+	assert len(Item['description']) == ItemTextLimits['description']
+	assert Item['assigned_to_id'] == 6
+	assert 'injected' not in Item
+	assert Item['assigned_by_id'] is None
+
+
+def test_export_round_trips_through_import():
+	Repository = TodoRepository('unused.json')
+	Repository.Data['channels']['1'] = {'message_ids': [], 'current_page': 0, 'pages': []}
+	Repository.AddPage(1, 'Work')
+	Repository.AddItem(
+		1,
+		0,
+		{
+			'priority': 'medium',
+			'title': 'Ship it',
+			'description': 'Soon',
+			'author_id': 5,
+			'author_name': 'Alice',
+		},
+	)
+	Lines = [json.dumps(Record) for Record in Repository.ExportRecords(1)]
+	Pages, Skipped = PagesFromNdjson(Lines)
+	assert Skipped == 0
+	assert Pages[0]['title'] == 'Work'
+	assert Pages[0]['items'][0]['title'] == 'Ship it'
+	assert Pages[0]['items'][0]['author_id'] == 5
@@ -0,0 +1,71 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+from Utils.TranscriptRecorder import TranscriptRecorder
+
+ChannelId = 10
+Author = SimpleNamespace(id=1, name='user')
+
+
+def Message(Id: int) -> SimpleNamespace:
+	return SimpleNamespace(
+		id=Id,
+		channel=SimpleNamespace(id=ChannelId),
+		author=Author,
+		guild=None,
+		content=f'message {Id}',
+		created_at=datetime(2026, 1, 1),
+	)
+
+
+class Channel:
+	def __init__(self, Messages: list, DuringCrawl=None) -> None:
+		self.id = ChannelId
+		self.Messages = Messages
+		self.DuringCrawl = DuringCrawl
+
+	async def history(self, limit=None, after=None, oldest_first=True):
+		for Message in self.Messages:
+			if after is None or Message.id > after.id:
+				yield Message
+				if self.DuringCrawl:
+					self.DuringCrawl()
+					self.DuringCrawl = None
+
+
+def Lines(*Ids: int) -> list[str]:
+	return [f'[2026-01-01 00:00] user: message {Id}' for Id in Ids]
+
+
+def test_build_fills_offline_gap(tmp_path):
+	async def Run():
+		Before = TranscriptRecorder(str(tmp_path))
+		Before.Start(ChannelId)
+		for Id in (1, 2):
+			Before.Record(Message(Id))
+		await Before.Flush()
+
+		# 💤 Messages 3 and 4 arrive while the bot is offline; after the restart 5 is recorded live
+		After = TranscriptRecorder(str(tmp_path))
+		After.Record(Message(5))
+		History = Channel([Message(Id) for Id in range(1, 6)])
+		assert await After.Build(History) == Lines(1, 2, 3, 4, 5)
+
+		# 🔁 The gap is filled for good: another build reads the same transcript without crawling
+		History.Messages = []
+		assert await After.Build(History) == Lines(1, 2, 3, 4, 5)
+
+	asyncio.run(Run())
+
+
+def test_build_records_live_message_once(tmp_path):
+	async def Run():
+		Recorder = TranscriptRecorder(str(tmp_path))
+		Recorder.Start(ChannelId)
+		Recorder.Record(Message(1))
+		# ⚡ Message 3 is delivered live while the crawl is still running
+		History = Channel([Message(Id) for Id in range(1, 4)], lambda: Recorder.Record(Message(3)))
+		assert await Recorder.Build(History) == Lines(1, 2, 3)
+
+	asyncio.run(Run())